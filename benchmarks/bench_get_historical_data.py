@@ -0,0 +1,115 @@
+"""Benchmark of the DataFrame construction in APIClient.get_historical_data.
+
+Compares the former string round-trip / object-dtype conversion with the typed
+path on synthetic 10k-row EOD and intraday responses. No network access or API
+key is needed:
+
+    python benchmarks/bench_get_historical_data.py [rows] [repeat]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from eodhd.apiclient import APIClient, _EOD_COLUMNS, _INTRADAY_COLUMNS
+
+
+def make_eod(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 + rng.standard_normal(rows).cumsum()
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("1980-01-01", periods=rows, freq="D").strftime("%Y-%m-%d"),
+            "open": close + rng.random(rows),
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "adjusted_close": close * 0.98,
+            "volume": rng.integers(0, 10_000_000, rows),
+        }
+    )
+
+
+def make_intraday(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    timestamps = 1_600_000_000 + 60 * np.arange(rows)
+    close = 100 + rng.standard_normal(rows).cumsum()
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "gmtoffset": 0,
+            "datetime": pd.to_datetime(timestamps, unit="s").strftime("%Y-%m-%d %H:%M:%S"),
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.integers(0, 100_000, rows),
+        }
+    )
+
+
+def legacy_eod(df_data: pd.DataFrame, symbol: str, interval: str) -> pd.DataFrame:
+    """The conversion get_historical_data performed before the typed path."""
+    df_data = df_data.copy()
+    df_data["symbol"] = symbol
+    df_data["interval"] = interval
+    tsidx = pd.DatetimeIndex(pd.to_datetime(df_data["date"]).dt.strftime("%Y-%m-%d"))
+    df_data.set_index(tsidx, inplace=True)
+    df_data = df_data.drop(columns=["date"])
+    df_data.columns = ["open", "high", "low", "close", "adjusted_close", "volume", "symbol", "interval"]
+    df_data.fillna(0, inplace=True)
+    for column in ("open", "high", "low", "close", "adjusted_close", "volume"):
+        df_data[column] = df_data[column].astype(object)
+    return df_data[["symbol", "interval", "open", "high", "low", "close", "adjusted_close", "volume"]]
+
+
+def legacy_intraday(df_data: pd.DataFrame, symbol: str, interval: str) -> pd.DataFrame:
+    df_data = df_data.copy()
+    df_data["symbol"] = symbol
+    df_data["interval"] = interval
+    tsidx = pd.DatetimeIndex(pd.to_datetime(df_data["datetime"]).dt.strftime("%Y-%m-%d %H:%M:%S"))
+    df_data.set_index(tsidx, inplace=True)
+    df_data = df_data.drop(columns=["datetime"])
+    df_data.columns = ["epoch", "gmtoffset", "open", "high", "low", "close", "volume", "symbol", "interval"]
+    df_data.fillna(0, inplace=True)
+    for column in ("epoch", "gmtoffset", "open", "high", "low", "close", "volume"):
+        df_data[column] = df_data[column].astype(object)
+    return df_data[["epoch", "gmtoffset", "symbol", "interval", "open", "high", "low", "close", "volume"]]
+
+
+def best(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    client = APIClient("demo")
+
+    eod = make_eod(rows)
+    intraday = make_intraday(rows)
+    cases = [
+        ("eod build", lambda: legacy_eod(eod, "AAPL.US", "d"),
+         lambda: client._to_time_series(eod, "AAPL.US", "d", "date", "%Y-%m-%d", _EOD_COLUMNS)),
+        ("intraday build", lambda: legacy_intraday(intraday, "AAPL.US", "1m"),
+         lambda: client._to_time_series(intraday, "AAPL.US", "1m", "datetime", "%Y-%m-%d %H:%M:%S",
+                                        _INTRADAY_COLUMNS)),
+    ]
+
+    legacy_frame = legacy_eod(eod, "AAPL.US", "d")
+    typed_frame = client._to_time_series(eod, "AAPL.US", "d", "date", "%Y-%m-%d", _EOD_COLUMNS)
+    cases.append(("rolling(20) mean", lambda: legacy_frame["close"].rolling(20).mean(),
+                  lambda: typed_frame["close"].rolling(20).mean()))
+
+    print(f"{rows} rows, best of {repeat}")
+    print(f"{'case':<18}{'legacy ms':>12}{'typed ms':>12}{'speedup':>10}")
+    for name, legacy, typed in cases:
+        legacy_time = best(legacy, repeat)
+        typed_time = best(typed, repeat)
+        print(f"{name:<18}{legacy_time * 1e3:>12.2f}{typed_time * 1e3:>12.2f}{legacy_time / typed_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,30 @@
 # APIs/BaseAPI.py
 
+import json
 from json.decoder import JSONDecodeError
 from urllib.parse import quote
 import requests
 from requests import ConnectionError as requests_ConnectionError
 from requests import Timeout as requests_Timeout
+from requests.exceptions import ChunkedEncodingError
 from rich.console import Console
 
+from eodhd.decoders import to_columns
+from eodhd.streaming import iter_json_records
 from eodhd.errors import EODHDHTTPError, EODHDConnectionError, EODHDTimeoutError
 
 
 class BaseAPI:
 
-    def __init__(self, session: requests.Session = None, timeout: tuple = (5.0, 30.0)) -> None:
+    def __init__(self, session: requests.Session = None, timeout: tuple = (5.0, 30.0), rate_limiter=None,
+                 retry_policy=None, cache=None, json_decoder=None) -> None:
         self._api_url = "https://eodhd.com/api"
         self._session = session
         self._timeout = timeout
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._cache = cache
+        self._json_decoder = json_decoder
         self.console = Console()
 
     @staticmethod
@@ -89,46 +98,94 @@ class BaseAPI:
             query_string += f"&page[limit]={page_limit}"
         return query_string
 
-    def _do_get(self, url: str):
+    def _throttle(self, endpoint: str) -> None:
+        """Block until the rate limiter (if any) admits a request to `endpoint`."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(endpoint)
+
+    def _do_get(self, url: str, stream: bool = False):
         """Execute GET using session if available, else bare requests.get."""
+        kwargs = {"timeout": self._timeout}
+        if stream:
+            kwargs["stream"] = True
         if self._session is not None:
-            return self._session.get(url, timeout=self._timeout)
-        return requests.get(url, timeout=self._timeout)
+            return self._session.get(url, **kwargs)
+        return requests.get(url, **kwargs)
 
-    def _rest_get_method(self, api_key: str, endpoint: str = "", uri: str = "", querystring: str = ""):
-        """Generic REST GET — raises EODHDHTTPError/EODHDConnectionError/EODHDTimeoutError on failure."""
+    def _raise_http_error(self, resp):
+        """Raise EODHDHTTPError for a non-200 response, using the API's message if any."""
+        try:
+            body = resp.text
+        except Exception:
+            body = ""
+
+        try:
+            data = resp.json()
+            message = data.get("message", "") or str(data.get("errors", ""))
+        except (JSONDecodeError, ValueError):
+            message = ""
+
+        raise EODHDHTTPError(
+            status_code=resp.status_code,
+            response_body=body,
+            message=f"({resp.status_code}) {self._api_url} - {message}" if message else f"HTTP {resp.status_code}",
+        )
+
+    def _get_response(self, api_key: str, endpoint: str, uri: str, querystring: str, stream: bool = False):
+        """GET an API URL, applying the rate limiter and retry policy; return the 200 response.
+
+        Only GETs are retried (they are idempotent); each attempt is throttled
+        separately since each one is charged by the API. With stream=True the
+        body is left unread for the caller to consume."""
 
         if endpoint.strip() == "":
             raise ValueError("endpoint is empty!")
 
         url = f"{self._api_url}/{endpoint}/{uri}?api_token={api_key}&fmt=json{querystring}"
 
-        try:
-            resp = self._do_get(url)
-        except requests_ConnectionError as err:
-            raise EODHDConnectionError(str(err)) from err
-        except requests_Timeout as err:
-            raise EODHDTimeoutError(str(err)) from err
+        policy = self._retry_policy
+        if policy is not None:
+            policy.start()
 
-        if resp.status_code != 200:
-            try:
-                body = resp.text
-            except Exception:
-                body = ""
+        attempt = 1
+        while True:
+            self._throttle(endpoint)
 
             try:
-                data = resp.json()
-                message = data.get("message", "") or str(data.get("errors", ""))
-            except (JSONDecodeError, ValueError):
-                message = ""
-
-            raise EODHDHTTPError(
-                status_code=resp.status_code,
-                response_body=body,
-                message=f"({resp.status_code}) {self._api_url} - {message}" if message else f"HTTP {resp.status_code}",
-            )
-
+                resp = self._do_get(url, stream=stream)
+            except requests_ConnectionError as err:
+                if policy is not None and policy.retry_error(timeout=False, attempt=attempt):
+                    attempt += 1
+                    continue
+                raise EODHDConnectionError(str(err)) from err
+            except requests_Timeout as err:
+                if policy is not None and policy.retry_error(timeout=True, attempt=attempt):
+                    attempt += 1
+                    continue
+                raise EODHDTimeoutError(str(err)) from err
+
+            if resp.status_code == 200:
+                return resp
+
+            if policy is not None and policy.retry_status(resp, attempt=attempt):
+                # Hand the connection back to the pool (a streamed body is never read).
+                resp.close()
+                attempt += 1
+                continue
+
+            self._raise_http_error(resp)
+
+    def _loads(self, body):
+        """Decode a JSON body with the configured decoder (stdlib json when none is set)."""
+        if self._json_decoder is not None:
+            return self._json_decoder.loads(body)
+        return json.loads(body)
+
+    def _decode(self, resp):
+        """Decode a 200 response; raises EODHDHTTPError if the body is not valid JSON."""
         try:
+            if self._json_decoder is not None:
+                return self._json_decoder.loads(resp.content)
             return resp.json()
         except (JSONDecodeError, ValueError) as err:
             raise EODHDHTTPError(
@@ -137,40 +194,64 @@ class BaseAPI:
                 message=f"Invalid JSON response: {err}",
             ) from err
 
-    def _rest_get_raw(self, api_key: str, endpoint: str = "", uri: str = "", querystring: str = ""):
-        """Generic REST GET returning raw bytes (for binary endpoints like logo)."""
+    def _rest_get_method(self, api_key: str, endpoint: str = "", uri: str = "", querystring: str = ""):
+        """Generic REST GET — raises EODHDHTTPError/EODHDConnectionError/EODHDTimeoutError on failure."""
 
-        if endpoint.strip() == "":
-            raise ValueError("endpoint is empty!")
+        if self._cache is not None:
+            body = self._cache.get(endpoint, uri, querystring)
+            if body is not None:
+                return self._loads(body)
 
-        url = f"{self._api_url}/{endpoint}/{uri}?api_token={api_key}&fmt=json{querystring}"
+        resp = self._get_response(api_key, endpoint, uri, querystring)
+        data = self._decode(resp)
+
+        if self._cache is not None:
+            self._cache.put(endpoint, uri, querystring, resp.content)
+        return data
+
+    def _rest_get_columns(self, api_key: str, endpoint: str = "", uri: str = "", querystring: str = "",
+                          dtypes: dict = None) -> dict:
+        """REST GET of a list-of-records endpoint, returned as {field: numpy array} (see decoders.to_columns)."""
+
+        return to_columns(self._rest_get_method(api_key, endpoint, uri, querystring), dtypes)
 
+    def _rest_get_stream(self, api_key: str, endpoint: str = "", uri: str = "", querystring: str = "",
+                         chunk_size: int = 1 << 16):
+        """Generic streaming REST GET: yield the records of a JSON array (or object
+        values) as the body arrives, keeping memory bounded by the largest record.
+
+        The response cache is bypassed. Retries only cover the initial request; a
+        connection lost mid-body raises EODHDConnectionError."""
+
+        resp = self._get_response(api_key, endpoint, uri, querystring, stream=True)
         try:
-            resp = self._do_get(url)
-        except requests_ConnectionError as err:
+            yield from iter_json_records(resp.iter_content(chunk_size=chunk_size))
+        except (requests_ConnectionError, ChunkedEncodingError) as err:
             raise EODHDConnectionError(str(err)) from err
         except requests_Timeout as err:
             raise EODHDTimeoutError(str(err)) from err
+        except ValueError as err:
+            raise EODHDHTTPError(
+                status_code=resp.status_code,
+                response_body="",
+                message=f"Invalid JSON response: {err}",
+            ) from err
+        finally:
+            resp.close()
 
-        if resp.status_code != 200:
-            try:
-                body = resp.text
-            except Exception:
-                body = ""
+    def _rest_get_raw(self, api_key: str, endpoint: str = "", uri: str = "", querystring: str = ""):
+        """Generic REST GET returning raw bytes (for binary endpoints like logo)."""
 
-            try:
-                data = resp.json()
-                message = data.get("message", "") or str(data.get("errors", ""))
-            except (JSONDecodeError, ValueError):
-                message = ""
+        if self._cache is not None:
+            body = self._cache.get(endpoint, uri, querystring)
+            if body is not None:
+                return body
 
-            raise EODHDHTTPError(
-                status_code=resp.status_code,
-                response_body=body,
-                message=f"({resp.status_code}) {self._api_url} - {message}" if message else f"HTTP {resp.status_code}",
-            )
+        content = self._get_response(api_key, endpoint, uri, querystring).content
 
-        return resp.content
+        if self._cache is not None:
+            self._cache.put(endpoint, uri, querystring, content)
+        return content
 
     def _rest_post_method(self, api_key: str, endpoint: str = "", uri: str = "", querystring: str = "", body=None):
         """Generic REST POST with JSON body."""
@@ -180,6 +261,8 @@ class BaseAPI:
 
         url = f"{self._api_url}/{endpoint}/{uri}?api_token={api_key}&fmt=json{querystring}"
 
+        self._throttle(endpoint)
+
         try:
             if self._session is not None:
                 resp = self._session.post(url, json=body, timeout=self._timeout)
@@ -191,28 +274,6 @@ class BaseAPI:
             raise EODHDTimeoutError(str(err)) from err
 
         if resp.status_code != 200:
-            try:
-                resp_body = resp.text
-            except Exception:
-                resp_body = ""
-
-            try:
-                data = resp.json()
-                message = data.get("message", "") or str(data.get("errors", ""))
-            except (JSONDecodeError, ValueError):
-                message = ""
+            self._raise_http_error(resp)
 
-            raise EODHDHTTPError(
-                status_code=resp.status_code,
-                response_body=resp_body,
-                message=f"({resp.status_code}) {self._api_url} - {message}" if message else f"HTTP {resp.status_code}",
-            )
-
-        try:
-            return resp.json()
-        except (JSONDecodeError, ValueError) as err:
-            raise EODHDHTTPError(
-                status_code=resp.status_code,
-                response_body=resp.text,
-                message=f"Invalid JSON response: {err}",
-            ) from err
+        return self._decode(resp)
@@ -5,12 +5,8 @@ from .BaseAPI import BaseAPI
 
 class BulkEodSplitsDividendsDataAPI(BaseAPI):
 
-    def get_eod_splits_dividends_data(self, api_token: str, country='US', type=None, date=None,
-                                      symbols=None, filter=None):
-
-        endpoint = 'eod-bulk-last-day'
-        uri = f'{country}'
-
+    @staticmethod
+    def _query_string(type=None, date=None, symbols=None, filter=None):
         query_string = ''
 
         if type is not None:
@@ -21,5 +17,31 @@ class BulkEodSplitsDividendsDataAPI(BaseAPI):
             query_string += '&symbols=' + str(symbols)
         if filter is not None:
             query_string += '&filter=' + str(filter)
+        return query_string
+
+    def get_eod_splits_dividends_data(self, api_token: str, country='US', type=None, date=None,
+                                      symbols=None, filter=None, output='json'):
+        """output='json' returns the list of records; output='columns' returns
+        {field: numpy array}, see eodhd.decoders.to_columns."""
+
+        if output not in ('json', 'columns'):
+            raise ValueError("output must be 'json' or 'columns'")
 
+        endpoint = 'eod-bulk-last-day'
+        uri = f'{country}'
+        query_string = self._query_string(type, date, symbols, filter)
+
+        if output == 'columns':
+            return self._rest_get_columns(api_key=api_token, endpoint=endpoint, querystring=query_string, uri=uri)
         return self._rest_get_method(api_key=api_token, endpoint=endpoint, querystring=query_string, uri=uri)
+
+    def iter_eod_splits_dividends_data(self, api_token: str, country='US', type=None, date=None,
+                                       symbols=None, filter=None, chunk_size=1 << 16):
+        """Same request as get_eod_splits_dividends_data, streamed: yields one record at a time."""
+
+        endpoint = 'eod-bulk-last-day'
+        uri = f'{country}'
+        query_string = self._query_string(type, date, symbols, filter)
+
+        return self._rest_get_stream(api_key=api_token, endpoint=endpoint, querystring=query_string, uri=uri,
+                                     chunk_size=chunk_size)
@@ -10,6 +10,21 @@ class BulkFundamentalsAPI(BaseAPI):
         GET /api/bulk-fundamentals/{exchange}
     """
 
+    @staticmethod
+    def _bulk_query(exchange: str, symbols: str = None, offset: int = None, limit: int = None):
+        """Validate the arguments shared by every bulk fundamentals call; return (uri, querystring)."""
+        if not exchange or not isinstance(exchange, str) or exchange.strip() == "":
+            raise ValueError("Parameter 'exchange' is required and must be a non-empty string.")
+
+        querystring = ""
+        if symbols is not None:
+            querystring += f"&symbols={symbols}"
+        if offset is not None:
+            querystring += f"&offset={int(offset)}"
+        if limit is not None:
+            querystring += f"&limit={int(limit)}"
+        return exchange.strip(), querystring
+
     def get_bulk_fundamentals(self, api_token: str, exchange: str, symbols: str = None, offset: int = None, limit: int = None):
         """
         Get fundamental data in bulk for an entire exchange.
@@ -32,23 +47,10 @@ class BulkFundamentalsAPI(BaseAPI):
         list[dict] or dict
             Bulk fundamentals data.
         """
-        if not exchange or not isinstance(exchange, str) or exchange.strip() == "":
-            raise ValueError("Parameter 'exchange' is required and must be a non-empty string.")
-
-        endpoint = "bulk-fundamentals"
-        uri = exchange.strip()
-        querystring = ""
-
-        if symbols is not None:
-            querystring += f"&symbols={symbols}"
-        if offset is not None:
-            querystring += f"&offset={int(offset)}"
-        if limit is not None:
-            querystring += f"&limit={int(limit)}"
-
+        uri, querystring = self._bulk_query(exchange, symbols, offset, limit)
         return self._rest_get_method(
             api_key=api_token,
-            endpoint=endpoint,
+            endpoint="bulk-fundamentals",
             uri=uri,
             querystring=querystring,
         )
@@ -76,23 +78,36 @@ class BulkFundamentalsAPI(BaseAPI):
         list[dict] or dict
             Bulk fundamentals data.
         """
-        if not exchange or not isinstance(exchange, str) or exchange.strip() == "":
-            raise ValueError("Parameter 'exchange' is required and must be a non-empty string.")
+        uri, querystring = self._bulk_query(exchange, symbols, offset, limit)
+        return self._rest_get_method(
+            api_key=api_token,
+            endpoint="v1.1/bulk-fundamentals",
+            uri=uri,
+            querystring=querystring,
+        )
 
-        endpoint = "v1.1/bulk-fundamentals"
-        uri = exchange.strip()
-        querystring = ""
+    def iter_bulk_fundamentals(self, api_token: str, exchange: str, symbols: str = None, offset: int = None,
+                               limit: int = None, version: str = "1.0", chunk_size: int = 1 << 16):
+        """
+        Stream bulk fundamentals one company at a time as the response arrives.
 
-        if symbols is not None:
-            querystring += f"&symbols={symbols}"
-        if offset is not None:
-            querystring += f"&offset={int(offset)}"
-        if limit is not None:
-            querystring += f"&limit={int(limit)}"
+        Takes the same parameters as get_bulk_fundamentals, plus `version`
+        ("1.0" or "1.1") and the network read size `chunk_size`. Only one
+        company's record is held in memory at a time.
 
-        return self._rest_get_method(
+        Yields
+        ------
+        dict
+            One company's fundamentals.
+        """
+        if version not in ("1.0", "1.1"):
+            raise ValueError("version must be '1.0' or '1.1'.")
+
+        uri, querystring = self._bulk_query(exchange, symbols, offset, limit)
+        return self._rest_get_stream(
             api_key=api_token,
-            endpoint=endpoint,
+            endpoint="bulk-fundamentals" if version == "1.0" else "v1.1/bulk-fundamentals",
             uri=uri,
             querystring=querystring,
+            chunk_size=chunk_size,
         )
@@ -1,6 +1,7 @@
 # APIs/MPUnicornbayExtrasAPI.py
 
 from .BaseAPI import BaseAPI
+from eodhd.ticks import ticks_to_numpy
 
 
 class MPUnicornbayExtrasAPI(BaseAPI):
@@ -12,7 +13,7 @@ class MPUnicornbayExtrasAPI(BaseAPI):
     """
 
     def get_tickdata(self, api_token: str, symbol: str, from_timestamp: int = None, to_timestamp: int = None,
-                     page_offset: int = None, page_limit: int = None):
+                     page_offset: int = None, page_limit: int = None, output: str = "json"):
         """
         Get tick-level data for a symbol.
 
@@ -28,14 +29,19 @@ class MPUnicornbayExtrasAPI(BaseAPI):
             Pagination offset.
         page_limit : int, optional
             Pagination limit.
+        output : str, optional
+            "json" (default) for the response envelope, or "numpy" for the
+            page's ticks as a structured array (see eodhd.ticks.ticks_to_numpy).
 
         Returns
         -------
-        dict
-            Tick data with meta, data, and links.
+        dict or numpy.ndarray
+            Tick data with meta, data, and links, or the ticks array.
         """
         if not symbol or not isinstance(symbol, str):
             raise ValueError("Parameter 'symbol' is required.")
+        if output not in ("json", "numpy"):
+            raise ValueError("Parameter 'output' must be 'json' or 'numpy'.")
 
         querystring = f"&symbol={symbol.strip()}"
 
@@ -48,11 +54,12 @@ class MPUnicornbayExtrasAPI(BaseAPI):
         if page_limit is not None:
             querystring += f"&page[limit]={int(page_limit)}"
 
-        return self._rest_get_method(
+        data = self._rest_get_method(
             api_key=api_token,
             endpoint="mp/unicornbay/tickdata/ticks",
             querystring=querystring,
         )
+        return ticks_to_numpy(data) if output == "numpy" else data
 
     def get_logo(self, api_token: str, symbol: str):
         """
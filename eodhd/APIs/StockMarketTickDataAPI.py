@@ -1,11 +1,14 @@
 #APIs/StockMarketTickDataAPI.py
 
 from .BaseAPI import BaseAPI
+from eodhd.ticks import ticks_to_numpy
 
 class StockMarketTickDataAPI(BaseAPI):
 
     def get_stock_market_tick_data(self, api_token: str, symbol: str, from_timestamp: str, to_timestamp: str,
-                                   limit: int):
+                                   limit: int, output: str = 'json'):
+        """output='json' returns the decoded response (parallel arrays per field);
+        output='numpy' returns a structured array, see eodhd.ticks.ticks_to_numpy."""
 
         endpoint = 'ticks'
 
@@ -17,6 +20,8 @@ class StockMarketTickDataAPI(BaseAPI):
             raise ValueError("from_timestamp is empty. Need to add from_timestamp to args")
         if to_timestamp is None:
             raise ValueError("to_timestamp is empty. Need to add to_timestamp to args")
+        if output not in ('json', 'numpy'):
+            raise ValueError("output must be 'json' or 'numpy'")
 
         query_string += '&s=' + str(symbol)
         query_string += '&from=' + str(from_timestamp)
@@ -25,4 +30,6 @@ class StockMarketTickDataAPI(BaseAPI):
         if limit is not None:
             query_string += '&limit=' + str(limit)
 
-        return self._rest_get_method(api_key=api_token, endpoint=endpoint, querystring=query_string)
\ No newline at end of file
+        data = self._rest_get_method(api_key=api_token, endpoint=endpoint, querystring=query_string)
+        # /ticks reports ts in milliseconds
+        return ticks_to_numpy(data, ts_unit='ms') if output == 'numpy' else data
\ No newline at end of file
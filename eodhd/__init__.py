@@ -2,9 +2,23 @@
 
 from eodhd.apiclient import APIClient
 from eodhd.apiclient import ScannerClient
+from eodhd.asyncclient import AsyncAPIClient
+from eodhd.asyncwebsocketclient import AsyncWebSocketClient
+from eodhd.bars import BarAggregator
 from eodhd.eodhdgraphs import EODHDGraphs
+from eodhd.eventqueue import EventQueue
+from eodhd.historystore import HistoryStore
+from eodhd.indicators import IndicatorEngine, Screen
+from eodhd.ringbuffer import TickBuffers, TickRingBuffer
+from eodhd.sinks import Sink, ParquetSink, FeatherSink, CSVSink, make_sink
+from eodhd.streammanager import StreamManager
+from eodhd.technical import TechnicalIndicators
+from eodhd.tickdownloader import TickDownloader
 from eodhd.websocketclient import WebSocketClient
-from eodhd.errors import EODHDError, EODHDHTTPError, EODHDConnectionError, EODHDTimeoutError
+from eodhd.errors import EODHDError, EODHDHTTPError, EODHDConnectionError, EODHDTimeoutError, EODHDRateLimitError
+from eodhd.cache import ResponseCache
+from eodhd.ratelimiter import RateLimiter
+from eodhd.retry import RetryPolicy
 from eodhd import APIs
 
 
@@ -1,21 +1,32 @@
 #apiclient.py
 
 import sys
-from json.decoder import JSONDecodeError
+import functools
+import inspect
+from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
 from datetime import timedelta
 from re import compile as re_compile
 from typing import Any
 import pandas as pd
 import numpy as np
 import requests
-from requests import ConnectionError as requests_ConnectionError
-from requests import Timeout as requests_Timeout
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.progress import track
 
-from eodhd.errors import EODHDHTTPError, EODHDConnectionError, EODHDTimeoutError
+from eodhd.cache import MemoryCache, ResponseCache
+from eodhd.decoders import JSONDecoder, get_decoder, to_columns
+from eodhd.indicators import IndicatorEngine, Screen
+from eodhd.pagination import fetch_all_pages, iter_pages, iter_records, merge_pages
+from eodhd.streaming import iter_batches
+from eodhd.timeutils import unix_time
+from eodhd.ratelimiter import RateLimiter
+from eodhd.retry import RetryPolicy
+
+from eodhd.APIs.BaseAPI import BaseAPI
 
 from eodhd.APIs import HistoricalDividendsAPI, UpcomingDividendsAPI
 from eodhd.APIs import HistoricalSplitsAPI
@@ -69,6 +80,46 @@ from eodhd.APIs import MPUnicornbayExtrasAPI
 sys.tracebacklimit = 1
 
 
+def _reference_data(method):
+    """Memoise an APIClient method returning slowly changing reference data.
+
+    Results are kept in the client's in-memory reference cache, keyed by method
+    name and arguments. Callers always receive a deep copy, so mutating a result
+    never alters what later calls return."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self._reference_cache
+        if cache is None:
+            return method(self, *args, **kwargs)
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        return deepcopy(cache.get_or_load(key, lambda: method(self, *args, **kwargs)))
+
+    return wrapper
+
+
+def _fetch_all_mode(method):
+    """Give a paginated APIClient method `fetch_all` and `max_workers` keywords.
+
+    With fetch_all=True the call returns every page merged into one envelope
+    (see APIClient.fetch_all_pages) instead of the single page requested."""
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, fetch_all: bool = False, max_workers: int = 8, **kwargs):
+        if not fetch_all:
+            return method(self, *args, **kwargs)
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        arguments.pop("self")
+        return self.fetch_all_pages(method.__name__, max_workers=max_workers, **arguments)
+
+    return wrapper
+
+
 class Interval(Enum):
     """Enum: infraday"""
 
@@ -120,10 +171,58 @@ class DateUtils:
         return str(yesterday.date()) + " 23:59:00"
 
 
+# Largest page[offset] accepted by paginated endpoints that have one.
+_MAX_PAGE_OFFSETS = {
+    "get_us_options_eod": 10000,
+    "get_us_options_contracts": 10000,
+}
+
+# Longest from/to span in days the intraday endpoint accepts per interval. The
+# API documents 1m, 5m and 1h; 15m and 30m get the conservative 1m limit.
+_INTRADAY_MAX_DAYS = {"1m": 120, "5m": 600, "15m": 120, "30m": 120, "1h": 7200}
+
+
+# Output columns of get_historical_data: name -> (response field, dtype).
+# Volume is float64: crypto and forex volumes are fractional.
+_EOD_COLUMNS = {
+    "symbol": (None, object),
+    "interval": (None, object),
+    "open": ("open", np.float64),
+    "high": ("high", np.float64),
+    "low": ("low", np.float64),
+    "close": ("close", np.float64),
+    "adjusted_close": ("adjusted_close", np.float64),
+    "volume": ("volume", np.float64),
+}
+
+_INTRADAY_COLUMNS = {
+    "epoch": ("timestamp", np.int64),
+    "gmtoffset": ("gmtoffset", np.int64),
+    "symbol": (None, object),
+    "interval": (None, object),
+    "open": ("open", np.float64),
+    "high": ("high", np.float64),
+    "low": ("low", np.float64),
+    "close": ("close", np.float64),
+    "volume": ("volume", np.float64),
+}
+
+# Response fields of the intraday endpoint and their dtypes, so get_intraday_range
+# and get_historical_data type the same bars alike.
+_INTRADAY_FIELDS = {field: dtype for field, dtype in _INTRADAY_COLUMNS.values() if field is not None}
+
+_SCAN_COLUMNS = list(_EOD_COLUMNS) + [
+    "sma50", "sma200", "bull_market", "ema12", "ema26", "next_action", "atr14", "atr14_pcnt",
+]
+
+
 class APIClient:
     """API class"""
 
-    def __init__(self, api_key: str, timeout: tuple = (5.0, 30.0)) -> None:
+    def __init__(self, api_key: str, timeout: tuple = (5.0, 30.0), rate_limiter: RateLimiter = None,
+                 retry_policy: RetryPolicy = None, cache: ResponseCache = None,
+                 reference_cache_ttl: float = None, reference_cache_size: int = 128,
+                 json_decoder="json") -> None:
         # Validate API key
         prog = re_compile(r"^[A-z0-9.]{16,32}$")
         if api_key != "demo" and not prog.match(api_key):
@@ -133,6 +232,17 @@ class APIClient:
         self._api_url = "https://eodhd.com/api"
         self._timeout = timeout
         self._session = requests.Session()
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._cache = cache
+        self.json_decoder = json_decoder
+        self._pool_maxsize = 10
+
+        # Opt-in in-memory cache for slowly changing reference lists (see _reference_data),
+        # kept for reference_cache_ttl seconds; None or 0 disables it.
+        self._reference_cache = None
+        if reference_cache_ttl:
+            self._reference_cache = MemoryCache(maxsize=reference_cache_size, ttl=reference_cache_ttl)
 
         self.console = Console()
 
@@ -146,51 +256,217 @@ class APIClient:
     def __exit__(self, *args):
         self.close()
 
-    def _rest_get(self, endpoint: str = "", uri: str = "", querystring: str = "") -> pd.DataFrame():
-        """Generic REST GET — raises EODHDHTTPError/EODHDConnectionError/EODHDTimeoutError on failure."""
+    def _ensure_pool_size(self, size: int) -> None:
+        """Grow the session's HTTPS connection pool so `size` threads can share it
+        without urllib3 discarding connections ("Connection pool is full")."""
+        if size > self._pool_maxsize:
+            self._session.mount("https://", HTTPAdapter(pool_connections=size, pool_maxsize=size))
+            self._pool_maxsize = size
+
+    def _batch_method(self, name):
+        """Resolve a public APIClient method by name for fetch_many."""
+        if not isinstance(name, str) or name.startswith("_") or not callable(getattr(self, name, None)):
+            raise ValueError(f"Unknown APIClient method: {name}")
+        return getattr(self, name)
+
+    def fetch_many(self, calls, method: str = None, max_workers: int = 8, sink=None, **kwargs) -> dict:
+        """Run many APIClient calls concurrently over a thread pool.
+
+        Two calling conventions are supported:
+
+        - ``calls`` is a list of ``(method_name, kwargs)`` pairs, e.g.
+          ``[("get_fundamentals_data", {"ticker": "AAPL.US"}), ...]``.
+          Results are keyed by the position of the pair in ``calls``.
+        - ``calls`` is a list of symbols and ``method`` names one APIClient method,
+          e.g. ``fetch_many(["AAPL.US", "MSFT.US"], method="get_eod_historical_stock_market_data",
+          period="d")``. Each symbol is passed as the method's first argument along
+          with ``**kwargs``; results are keyed by symbol. Duplicate symbols are
+          fetched once.
+
+        All calls share this client's requests.Session. A failing item does not
+        abort the batch: its value in the returned dict is the exception it
+        raised (EODHDHTTPError, EODHDConnectionError, ValueError, or any other
+        error) instead of a result. The returned dict follows the order of ``calls``.
+
+        With ``sink`` (an eodhd.sinks.Sink), each result is written to the sink
+        on the worker thread that fetched it, into the dataset of the method's
+        endpoint and partitioned by the call's symbol; the returned values are
+        then the lists of written file paths instead of the results. An error
+        writing one item (e.g. an OSError from a full disk) is captured for that
+        item like a failed request.
+        """
+        if isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+
+        jobs = {}
+        if method is not None:
+            target = self._batch_method(method)
+            for symbol in dict.fromkeys(calls):
+                jobs[symbol] = functools.partial(target, symbol, **kwargs)
+                if sink is not None:
+                    jobs[symbol] = functools.partial(self._write_to_sink, sink, jobs[symbol], method, symbol)
+        else:
+            if kwargs:
+                raise ValueError("Keyword arguments can only be used together with 'method'.")
+            for index, call in enumerate(calls):
+                name, call_kwargs = call
+                call_kwargs = call_kwargs or {}
+                jobs[index] = functools.partial(self._batch_method(name), **call_kwargs)
+                if sink is not None:
+                    symbol = next((call_kwargs[key] for key in self._SYMBOL_ARGUMENTS if key in call_kwargs), None)
+                    jobs[index] = functools.partial(self._write_to_sink, sink, jobs[index], name, symbol)
+
+        if not jobs:
+            return {}
+
+        workers = min(max_workers, len(jobs))
+        self._ensure_pool_size(workers)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eodhd-batch") as executor:
+            futures = {executor.submit(job): key for key, job in jobs.items()}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as err:
+                    results[futures[future]] = err
 
-        if endpoint.strip() == "":
-            raise ValueError("endpoint is empty!")
+        return {key: results[key] for key in jobs}
 
-        url = f"{self._api_url}/{endpoint}/{uri}?api_token={self._api_key}&fmt=json{querystring}"
+    # Keyword arguments naming the symbol of a (method_name, kwargs) call, for sink partitioning.
+    _SYMBOL_ARGUMENTS = ("symbol", "ticker", "code")
 
-        try:
-            resp = self._session.get(url, timeout=self._timeout)
-        except requests_ConnectionError as err:
-            raise EODHDConnectionError(str(err)) from err
-        except requests_Timeout as err:
-            raise EODHDTimeoutError(str(err)) from err
+    @staticmethod
+    def _write_to_sink(sink, job, dataset: str, symbol) -> list:
+        return sink.write(job(), dataset, symbol=symbol)
+
+    def _api_options(self) -> dict:
+        """Transport settings shared by every endpoint wrapper this client creates."""
+        return {
+            "session": self._session,
+            "timeout": self._timeout,
+            "rate_limiter": self._rate_limiter,
+            "retry_policy": self._retry_policy,
+            "cache": self._cache,
+            "json_decoder": self._json_decoder,
+        }
+
+    @property
+    def rate_limiter(self):
+        """The RateLimiter applied to every request, or None."""
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, rate_limiter):
+        self._rate_limiter = rate_limiter
+
+    @property
+    def retry_policy(self):
+        """The RetryPolicy applied to every GET request, or None (no retries)."""
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, retry_policy):
+        self._retry_policy = retry_policy
+
+    @property
+    def cache(self):
+        """The ResponseCache used for GET responses, or None (no caching)."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache):
+        self._cache = cache
+
+    @property
+    def json_decoder(self):
+        """The JSONDecoder used for response bodies, or None when requests decodes them
+        (resp.json(), the stdlib backend); set a backend name ("auto", "orjson",
+        "msgspec", "json") or instance."""
+        return self._json_decoder
+
+    @json_decoder.setter
+    def json_decoder(self, backend):
+        decoder = get_decoder(backend)
+        # The stdlib backend is what resp.json() does already.
+        self._json_decoder = None if type(decoder) is JSONDecoder else decoder
+
+    def clear_reference_cache(self, method: str = None) -> None:
+        """Invalidate memoised reference data: everything, or one method's results (e.g. "get_exchanges")."""
+        if self._reference_cache is None:
+            return
+        if method is None:
+            self._reference_cache.invalidate()
+        else:
+            self._reference_cache.invalidate(lambda key: key[0] == method)
+
+    def reference_cache_stats(self) -> dict:
+        """Hit/miss/eviction counters of the reference-data cache (empty dict when disabled)."""
+        if self._reference_cache is None:
+            return {}
+        return self._reference_cache.stats()
+
+    def enable_account_rate_limit(self, per_second: float = None, per_minute: float = 1000) -> RateLimiter:
+        """Install a RateLimiter seeded from get_user_info().
+
+        The daily budget is what is left of the account's quota today
+        (dailyRateLimit + extraLimit - apiRequests); each request is charged its
+        endpoint's API-call cost. Returns the installed limiter."""
+        self._rate_limiter = RateLimiter.from_user_info(
+            self.get_user_info(), per_second=per_second, per_minute=per_minute
+        )
+        return self._rate_limiter
 
-        if resp.status_code != 200:
-            try:
-                body = resp.text
-            except Exception:
-                body = ""
-            try:
-                data = resp.json()
-                message = data.get("message", "") or str(data.get("errors", ""))
-            except (JSONDecodeError, ValueError):
-                message = ""
-            raise EODHDHTTPError(
-                status_code=resp.status_code,
-                response_body=body,
-                message=f"({resp.status_code}) {self._api_url} - {message}" if message else f"HTTP {resp.status_code}",
-            )
+    def _rest_get(self, endpoint: str = "", uri: str = "", querystring: str = "") -> pd.DataFrame():
+        """Generic REST GET — raises EODHDHTTPError/EODHDConnectionError/EODHDTimeoutError on failure."""
 
-        try:
-            json_data = resp.json()
-        except (JSONDecodeError, ValueError) as err:
-            raise EODHDHTTPError(
-                status_code=resp.status_code,
-                response_body=resp.text,
-                message=f"Invalid JSON response: {err}",
-            ) from err
+        json_data = BaseAPI(**self._api_options())._rest_get_method(
+            api_key=self._api_key, endpoint=endpoint, uri=uri, querystring=querystring
+        )
 
         if isinstance(json_data, list):
-            return pd.DataFrame.from_dict(json_data)
+            # Records are transposed into typed numpy columns in one pass instead of
+            # letting pandas infer every row.
+            try:
+                return pd.DataFrame(to_columns(json_data))
+            except ValueError:
+                return pd.DataFrame.from_dict(json_data)
         else:
             return pd.DataFrame(json_data, index=[0])
 
+    def _to_time_series(
+        self,
+        df_data: pd.DataFrame,
+        symbol: str,
+        interval: str,
+        time_column: str,
+        time_format: str,
+        columns: dict,
+        object_dtype: bool = False,
+    ) -> pd.DataFrame:
+        """Build the typed time series returned by get_historical_data.
+
+        `columns` maps output column names to (response field, dtype). Columns are
+        picked by name, converted in one vectorised pass each and indexed by the
+        parsed `time_column`; missing values become 0 as before."""
+        index = pd.DatetimeIndex(pd.to_datetime(df_data[time_column].to_numpy(), format=time_format))
+
+        data = {}
+        for name, (field, dtype) in columns.items():
+            if name == "symbol":
+                values = np.full(len(df_data), symbol, dtype=object)
+            elif name == "interval":
+                values = np.full(len(df_data), interval, dtype=object)
+            elif field in df_data.columns:
+                values = pd.to_numeric(df_data[field], errors="coerce").fillna(0).to_numpy(dtype=dtype)
+            else:
+                values = np.zeros(len(df_data), dtype=dtype)
+            if object_dtype and dtype is not object:
+                values = values.astype(object)
+            data[name] = values
+
+        return pd.DataFrame(data, index=index, columns=list(columns))
+
     def _strip_free_tier_warning(self, df_data: pd.DataFrame) -> pd.DataFrame:
         """Free API keys append a 'warning' column (e.g. data limited to one year)
         to historical responses. Surface the message and drop the column so the
@@ -209,6 +485,7 @@ class APIClient:
                 return df_data.iloc[0:0]
         return df_data
 
+    @_reference_data
     def get_exchanges(self) -> pd.DataFrame:
         """Get supported exchanges"""
 
@@ -272,8 +549,14 @@ class APIClient:
         iso8601_start: str = "",
         iso8601_end: str = "",
         results: int = 300,
+        object_dtype: bool = False,
     ) -> pd.DataFrame:
-        """Initiates a REST API call"""
+        """Initiates a REST API call
+
+        Prices are returned as float64 and volumes as int64 on a DatetimeIndex.
+        Pass object_dtype=True to get object columns instead, which print large
+        floats without scientific notation (the behaviour of earlier versions).
+        """
 
         # validate symbol
         prog = re_compile(r"^[A-z0-9-$\.+]{1,48}$")
@@ -356,51 +639,9 @@ class APIClient:
             elif iso8601_start != "" and iso8601_end == "":
                 df_data = df_data.head(results)
 
-            df_data["symbol"] = symbol
-            df_data["interval"] = interval
-
-            # convert dataframe to a time series
-            if interval == "d" or interval == "w" or interval == "m":
-                tsidx = pd.DatetimeIndex(pd.to_datetime(df_data["date"]).dt.strftime("%Y-%m-%d"))
-                df_data.set_index(tsidx, inplace=True)
-                df_data = df_data.drop(columns=["date"])
-            else:
-                tsidx = pd.DatetimeIndex(pd.to_datetime(df_data["datetime"]).dt.strftime("%Y-%m-%d %H:%M:%S"))
-                df_data.set_index(tsidx, inplace=True)
-                df_data = df_data.drop(columns=["datetime"])
-
-            df_data.columns = [
-                "open",
-                "high",
-                "low",
-                "close",
-                "adjusted_close",
-                "volume",
-                "symbol",
-                "interval",
-            ]
-
-            # set object type to display large floats
-            df_data.fillna(0, inplace=True)
-            df_data["open"] = df_data["open"].astype(object)
-            df_data["high"] = df_data["high"].astype(object)
-            df_data["low"] = df_data["low"].astype(object)
-            df_data["close"] = df_data["close"].astype(object)
-            df_data["adjusted_close"] = df_data["adjusted_close"].astype(object)
-            df_data["volume"] = df_data["volume"].astype(object)
-
-            return df_data[
-                [
-                    "symbol",
-                    "interval",
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "adjusted_close",
-                    "volume",
-                ]
-            ]
+            return self._to_time_series(
+                df_data, symbol, interval, "date", "%Y-%m-%d", _EOD_COLUMNS, object_dtype
+            )
 
         elif interval == "1m" or interval == "5m" or interval == "1h":
             # api expects date in yyyy-mm-dd format
@@ -468,54 +709,9 @@ class APIClient:
             elif iso8601_start != "" and iso8601_end == "":
                 df_data = df_data.head(results)
 
-            df_data["symbol"] = symbol
-            df_data["interval"] = interval
-
-            # convert dataframe to a time series
-            if interval == "d" or interval == "w" or interval == "m":
-                tsidx = pd.DatetimeIndex(pd.to_datetime(df_data["date"]).dt.strftime("%Y-%m-%d"))
-                df_data.set_index(tsidx, inplace=True)
-                df_data = df_data.drop(columns=["date"])
-            else:
-                tsidx = pd.DatetimeIndex(pd.to_datetime(df_data["datetime"]).dt.strftime("%Y-%m-%d %H:%M:%S"))
-                df_data.set_index(tsidx, inplace=True)
-                df_data = df_data.drop(columns=["datetime"])
-
-            df_data.columns = [
-                "epoch",
-                "gmtoffset",
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume",
-                "symbol",
-                "interval",
-            ]
-
-            # set object type to display large floats
-            df_data.fillna(0, inplace=True)
-            df_data["gmtoffset"] = df_data["gmtoffset"].astype(object)
-            df_data["epoch"] = df_data["epoch"].astype(object)
-            df_data["open"] = df_data["open"].astype(object)
-            df_data["high"] = df_data["high"].astype(object)
-            df_data["low"] = df_data["low"].astype(object)
-            df_data["close"] = df_data["close"].astype(object)
-            df_data["volume"] = df_data["volume"].astype(object)
-
-            return df_data[
-                [
-                    "epoch",
-                    "gmtoffset",
-                    "symbol",
-                    "interval",
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "volume",
-                ]
-            ]
+            return self._to_time_series(
+                df_data, symbol, interval, "datetime", "%Y-%m-%d %H:%M:%S", _INTRADAY_COLUMNS, object_dtype
+            )
 
         else:
             self.console.log("invalid interval (1m, 5m, 1h, 1d, w, m):", iso8601_start)
@@ -530,7 +726,7 @@ class APIClient:
         For more information visit: https://eodhistoricaldata.com/financial-apis/api-splits-dividends/
         """
 
-        api_call = HistoricalDividendsAPI(session=self._session, timeout=self._timeout)
+        api_call = HistoricalDividendsAPI(**self._api_options())
         return api_call.get_historical_dividends_data(api_token=self._api_key, ticker=ticker, date_from=date_from, date_to=date_to)
 
     def get_historical_splits_data(self, ticker, date_to=None, date_from=None) -> list:
@@ -542,7 +738,7 @@ class APIClient:
         For more information visit: https://eodhistoricaldata.com/financial-apis/api-splits-dividends/
         """
 
-        api_call = HistoricalSplitsAPI(session=self._session, timeout=self._timeout)
+        api_call = HistoricalSplitsAPI(**self._api_options())
         return api_call.get_historical_splits_data(api_token=self._api_key, ticker=ticker, date_from=date_from, date_to=date_to)
 
     def get_technical_indicator_data(
@@ -605,7 +801,7 @@ class APIClient:
         For those functions use this parameters to set periods.
         """
 
-        api_call = TechnicalIndicatorAPI(session=self._session, timeout=self._timeout)
+        api_call = TechnicalIndicatorAPI(**self._api_options())
         return api_call.get_technical_indicator_data(
             api_token=self._api_key,
             ticker=ticker,
@@ -636,7 +832,7 @@ class APIClient:
         For more information visit: https://eodhistoricaldata.com/financial-apis/live-realtime-stocks-api/
         """
 
-        api_call = LiveStockPricesAPI(session=self._session, timeout=self._timeout)
+        api_call = LiveStockPricesAPI(**self._api_options())
         return api_call.get_live_stock_prices(api_token=self._api_key, ticker=ticker, s=s)
 
     def get_us_extended_quotes(self, s, page_limit=None, page_offset=None, fmt=None) -> list:
@@ -666,7 +862,7 @@ class APIClient:
         For more information visit:
           https://eodhd.com/financial-apis/live-v2-for-us-stocks-extended-quotes-2025
         """
-        api_call = LiveExtendedQuotesAPI(session=self._session, timeout=self._timeout)
+        api_call = LiveExtendedQuotesAPI(**self._api_options())
         return api_call.get_us_extended_quotes(
             api_token=self._api_key,
             symbols=s,
@@ -693,7 +889,7 @@ class APIClient:
         For more information visit: https://eodhistoricaldata.com/financial-apis/economic-events-data-api/
         """
 
-        api_call = EconomicEventsDataAPI(session=self._session, timeout=self._timeout)
+        api_call = EconomicEventsDataAPI(**self._api_options())
         return api_call.get_economic_events_data(
             api_token=self._api_key,
             date_from=date_from,
@@ -720,7 +916,7 @@ class APIClient:
         For more information visit: https://eodhistoricaldata.com/financial-apis/insider-transactions-api/
         """
 
-        api_call = InsiderTransactionsAPI(session=self._session, timeout=self._timeout)
+        api_call = InsiderTransactionsAPI(**self._api_options())
         return api_call.get_insider_transactions_data(
             api_token=self._api_key,
             date_from=date_from,
@@ -738,7 +934,7 @@ class APIClient:
         reshapes the response (e.g. ``General::Code`` returns a scalar string),
         so the return type is ``Any``: an unfiltered or top-level call yields a
         dict, a scalar filter yields a str (see issue #71)."""
-        api_call = FundamentalDataAPI(session=self._session, timeout=self._timeout)
+        api_call = FundamentalDataAPI(**self._api_options())
         return api_call.get_fundamentals_data(
             api_token=self._api_key, ticker=ticker, filter=filter, historical=historical,
             from_date=from_date, to_date=to_date, version=version, no_cache=no_cache,
@@ -753,13 +949,14 @@ class APIClient:
         reshapes the response (e.g. ``General::Code`` returns a scalar string),
         so the return type is ``Any``: an unfiltered or top-level call yields a
         dict, a scalar filter yields a str (see issue #71)."""
-        api_call = FundamentalDataAPI(session=self._session, timeout=self._timeout)
+        api_call = FundamentalDataAPI(**self._api_options())
         return api_call.get_fundamentals_data_v1_1(
             api_token=self._api_key, ticker=ticker, filter=filter, historical=historical,
             from_date=from_date, to_date=to_date, version=version, no_cache=no_cache,
         )
 
-    def get_eod_splits_dividends_data(self, country="US", type=None, date=None, symbols=None, filter=None) -> list:
+    def get_eod_splits_dividends_data(self, country="US", type=None, date=None, symbols=None, filter=None,
+                                      output="json"):
         """Available args:
         type (not required) - can get splits, empty or dividends.
             for splits function returns all splits for US stocks in bulk for a particular day
@@ -771,10 +968,12 @@ class APIClient:
             for MSFT and AAPL, you can add the ‘symbols’ parameter. For non-US tickers,
             you should use the exchange code, for example, BMW.XETRA or SAP.F
             If you want get data for several codes you need to input in the next type of format: AAPL,BMW.XETRA,SAP.F
+        output (not required) - 'json' (default) for the list of records, or 'columns' for
+            {field: numpy array} (see eodhd.decoders.to_columns)
         For more information visit: https://eodhistoricaldata.com/financial-apis/bulk-api-eod-splits-dividends/
         """
 
-        api_call = BulkEodSplitsDividendsDataAPI(session=self._session, timeout=self._timeout)
+        api_call = BulkEodSplitsDividendsDataAPI(**self._api_options())
         return api_call.get_eod_splits_dividends_data(
             api_token=self._api_key,
             country=country,
@@ -782,7 +981,23 @@ class APIClient:
             date=date,
             symbols=symbols,
             filter=filter,
+            output=output,
+        )
+
+    def iter_eod_splits_dividends_data(self, country="US", type=None, date=None, symbols=None, filter=None,
+                                       batch_size=None):
+        """Streaming variant of get_eod_splits_dividends_data for whole-exchange downloads.
+
+        Yields one record at a time as the response arrives (or lists of up to
+        `batch_size` records), so memory stays bounded regardless of the size of
+        the exchange. The response cache is not used.
+        """
+
+        api_call = BulkEodSplitsDividendsDataAPI(**self._api_options())
+        records = api_call.iter_eod_splits_dividends_data(
+            api_token=self._api_key, country=country, type=type, date=date, symbols=symbols, filter=filter,
         )
+        return records if batch_size is None else iter_batches(records, batch_size)
 
     def get_upcoming_earnings_data(self, from_date=None, to_date=None, symbols=None) -> list:
         """Available args:
@@ -794,7 +1009,7 @@ class APIClient:
         For more information visit: https://eodhistoricaldata.com/financial-apis/calendar-upcoming-earnings-ipos-and-splits/#Upcoming_Earnings_API
         """
 
-        api_call = UpcomgingEarningsAPI(session=self._session, timeout=self._timeout)
+        api_call = UpcomgingEarningsAPI(**self._api_options())
         return api_call.get_upcoming_earnings_data(
             api_token=self._api_key,
             from_date=from_date,
@@ -809,7 +1024,7 @@ class APIClient:
             ou can use one symbol: ‘AAPL.US’ or several symbols separated by a comma: ‘AAPL.US, MS’
         For more information visit: https://eodhistoricaldata.com/financial-apis/calendar-upcoming-earnings-ipos-and-splits/#Earnings_Trends_API
         """
-        api_call = EarningTrendsAPI(session=self._session, timeout=self._timeout)
+        api_call = EarningTrendsAPI(**self._api_options())
         return api_call.get_earning_trends_data(api_token=self._api_key, symbols=symbols)
 
     def get_upcoming_IPOs_data(self, from_date=None, to_date=None) -> list:
@@ -819,7 +1034,7 @@ class APIClient:
         For more information visit: https://eodhistoricaldata.com/financial-apis/calendar-upcoming-earnings-ipos-and-splits/#Upcoming_Earnings_API
         """
 
-        api_call = UpcomingIPOsAPI(session=self._session, timeout=self._timeout)
+        api_call = UpcomingIPOsAPI(**self._api_options())
         return api_call.get_upcoming_IPOs_data(api_token=self._api_key, from_date=from_date, to_date=to_date)
 
     def get_upcoming_splits_data(self, from_date=None, to_date=None) -> list:
@@ -829,7 +1044,7 @@ class APIClient:
         For more information visit: https://eodhistoricaldata.com/financial-apis/calendar-upcoming-earnings-ipos-and-splits/#Upcoming_Earnings_API
         """
 
-        api_call = UpcomingSplitsAPI(session=self._session, timeout=self._timeout)
+        api_call = UpcomingSplitsAPI(**self._api_options())
         return api_call.get_upcoming_splits_data(api_token=self._api_key, from_date=from_date, to_date=to_date)
 
     def get_upcoming_dividends_data(
@@ -855,7 +1070,7 @@ class APIClient:
         Note:
             API requires at least one of `symbol` or `date_eq`.
         """
-        api_call = UpcomingDividendsAPI(session=self._session, timeout=self._timeout)
+        api_call = UpcomingDividendsAPI(**self._api_options())
         return api_call.get_upcoming_dividends_data(
             api_token=self._api_key,
             symbol=symbol,
@@ -875,16 +1090,17 @@ class APIClient:
         All possible indicators will be avaliable on: https://eodhistoricaldata.com/financial-apis/macroeconomics-data-and-macro-indicators-api/
         """
 
-        api_call = MacroIndicatorsAPI(session=self._session, timeout=self._timeout)
+        api_call = MacroIndicatorsAPI(**self._api_options())
         return api_call.get_macro_indicators_data(api_token=self._api_key, country=country, indicator=indicator)
 
 
+    @_reference_data
     def get_list_of_exchanges(self):
         """Available args:
         Function returns list of avaliable exchanges
         """
 
-        api_call = ListOfExchangesAPI(session=self._session, timeout=self._timeout)
+        api_call = ListOfExchangesAPI(**self._api_options())
         return api_call.get_list_of_exchanges(api_token=self._api_key)
 
     def get_list_of_tickers(self, code: str, delisted: int = 0, include_delisted: bool = False):
@@ -914,7 +1130,7 @@ class APIClient:
         if delisted not in (0, 1):
             raise ValueError("Parameter 'delisted' must be 0 or 1.")
 
-        api_call = ListOfExchangesAPI(session=self._session, timeout=self._timeout)
+        api_call = ListOfExchangesAPI(**self._api_options())
 
         if not include_delisted:
             return api_call.get_list_of_tickers(api_token=self._api_key, delisted=delisted, code=code)
@@ -952,7 +1168,7 @@ class APIClient:
         For more information visit: https://eodhistoricaldata.com/financial-apis/exchanges-api-trading-hours-and-stock-market-holidays/
         """
 
-        api_call = TradingHours_StockMarketHolidays_SymbolsChangeHistoryAPI(session=self._session, timeout=self._timeout)
+        api_call = TradingHours_StockMarketHolidays_SymbolsChangeHistoryAPI(**self._api_options())
         return api_call.get_details_trading_hours_stock_market_holidays(api_token=self._api_key, code=code, from_date=from_date, to_date=to_date)
 
     def symbol_change_history(self, from_date=None, to_date=None):
@@ -961,9 +1177,10 @@ class APIClient:
             If you need data from Jul 22, 2022, to Aug 10, 2022, you should use from=2022-07-22 and to=2022-08-10.
         For more information visit: https://eodhistoricaldata.com/financial-apis/exchanges-api-trading-hours-and-stock-market-holidays/
         """
-        api_call = TradingHours_StockMarketHolidays_SymbolsChangeHistoryAPI(session=self._session, timeout=self._timeout)
+        api_call = TradingHours_StockMarketHolidays_SymbolsChangeHistoryAPI(**self._api_options())
         return api_call.symbol_change_history(api_token=self._api_key, from_date=from_date, to_date=to_date)
 
+    @_reference_data
     def get_exchange_details_v2_list(self):
         """Get list of all supported exchanges with basic details (v2).
 
@@ -971,7 +1188,7 @@ class APIClient:
         Endpoint: GET /api/v2/exchange-details
         For more information visit: https://eodhd.com/financial-apis/exchanges-api-trading-hours-and-stock-market-holidays/
         """
-        api_call = ExchangeDetailsV2API(session=self._session, timeout=self._timeout)
+        api_call = ExchangeDetailsV2API(**self._api_options())
         return api_call.get_exchange_details_v2_list(api_token=self._api_key)
 
     def get_exchange_details_v2(self, code: str):
@@ -984,7 +1201,7 @@ class APIClient:
         Endpoint: GET /api/v2/exchange-details/{code}
         For more information visit: https://eodhd.com/financial-apis/exchanges-api-trading-hours-and-stock-market-holidays/
         """
-        api_call = ExchangeDetailsV2API(session=self._session, timeout=self._timeout)
+        api_call = ExchangeDetailsV2API(**self._api_options())
         return api_call.get_exchange_details_v2(api_token=self._api_key, code=code)
 
     def stock_market_screener(self, sort=None, filters=None, limit=None, signals=None, offset=None):
@@ -999,7 +1216,7 @@ class APIClient:
             For example, to get 100 symbols starting from 200 you should use limit=100 and offset=200.
         """
 
-        api_call = StockMarketScreenerAPI(session=self._session, timeout=self._timeout)
+        api_call = StockMarketScreenerAPI(**self._api_options())
         return api_call.stock_market_screener(
             api_token=self._api_key,
             filters=filters,
@@ -1026,7 +1243,7 @@ class APIClient:
             symbol(string): Required - consists of two parts: {SYMBOL_NAME}.{EXCHANGE_ID},
                 then you can use, for example, AAPL.MX for Mexican Stock Exchange. or AAPL.US for NASDAQ
             interval(string) Optional - the possible intervals: ‘5m’ for 5-minutes, ‘1h’ for 1 hour, and ‘1m’ for 1-minute intervals.
-            from_unix_time(string) and to_unix_time(string): Optional - Parameters should be passed in UNIX time with UTC timezone, for example,
+            fromunix_time(string) and tounix_time(string): Optional - Parameters should be passed in UNIX time with UTC timezone, for example,
                 these values are correct: “from=1627896900&to=1630575300” and correspond to
                 ‘ 2021-08-02 09:35:00 ‘ and ‘ 2021-09-02 09:35:00 ‘.
                 The maximum periods between ‘from’ and ‘to’ are 120 days for 1-minute intervals,
@@ -1038,7 +1255,7 @@ class APIClient:
         List of supported exchanges: https://eodhd.com/financial-apis/exchanges-api-list-of-tickers-and-trading-hours/
         For more information visit: https://eodhd.com/financial-apis/intraday-historical-data-api/
         """
-        api_call = IntradayDataAPI(session=self._session, timeout=self._timeout)
+        api_call = IntradayDataAPI(**self._api_options())
         return api_call.get_intraday_historical_data(
             api_token=self._api_key,
             symbol=symbol,
@@ -1047,6 +1264,71 @@ class APIClient:
             from_unix_time=from_unix_time
         )
 
+    @staticmethod
+    def _intraday_windows(interval: str, start: int, end: int) -> list:
+        """Split [start, end] into consecutive (from, to) windows no longer than the API allows for `interval`."""
+        span = _INTRADAY_MAX_DAYS[interval] * 86400
+        windows = []
+        while True:
+            window_end = min(start + span, end)
+            windows.append((start, window_end))
+            if window_end >= end:
+                return windows
+            start = window_end
+
+    def get_intraday_range(self, symbol, interval="5m", start=None, end=None, max_workers: int = 8) -> pd.DataFrame:
+        """
+        Intraday bars for an arbitrary time range, beyond the per-request limits of
+        get_intraday_historical_data (120 days for 1m, 600 days for 5m, 7200 days for 1h).
+
+        The range is split into windows the API accepts, the windows are fetched
+        concurrently (through the client's rate limiter and retry policy), bars
+        repeated at window boundaries are dropped by timestamp, and one frame
+        sorted by time is returned.
+
+        Args:
+            symbol      [REQUIRED] - e.g. "AAPL.US"
+            interval    [OPTIONAL] - 1m, 5m, 15m, 30m or 1h
+            start       [REQUIRED] - UNIX seconds, datetime/date or "YYYY-MM-DD[THH:MM:SS]" (UTC)
+            end         [OPTIONAL] - same formats, default now
+            max_workers [OPTIONAL] - concurrent requests
+
+        Returns: DataFrame indexed by the bar time (UTC) with timestamp, gmtoffset,
+        open, high, low, close and volume columns. Raises the first error if any
+        window fails, rather than returning a range with gaps.
+        """
+        if interval not in _INTRADAY_MAX_DAYS:
+            raise ValueError(f"Interval must be in {list(_INTRADAY_MAX_DAYS)} values")
+        if start is None:
+            raise ValueError("start is required.")
+        start_time = unix_time(start)
+        end_time = unix_time(end) if end is not None else int(datetime.now(timezone.utc).timestamp())
+        if start_time >= end_time:
+            raise ValueError("start must be before end.")
+
+        calls = [
+            ("get_intraday_historical_data",
+             {"symbol": symbol, "interval": interval, "from_unix_time": window_start, "to_unix_time": window_end})
+            for window_start, window_end in self._intraday_windows(interval, start_time, end_time)
+        ]
+        results = self.fetch_many(calls, max_workers=max_workers)
+
+        records = []
+        for result in results.values():
+            if isinstance(result, Exception):
+                raise result
+            if isinstance(result, list):
+                records.extend(record for record in result if isinstance(record, dict) and "timestamp" in record)
+
+        df_data = pd.DataFrame.from_records(records, columns=list(_INTRADAY_FIELDS))
+        for column, dtype in _INTRADAY_FIELDS.items():
+            values = pd.to_numeric(df_data[column], errors="coerce")
+            df_data[column] = values.fillna(0).astype(dtype) if dtype is np.int64 else values.astype(dtype)
+
+        df_data = df_data.drop_duplicates(subset="timestamp", keep="last").sort_values("timestamp")
+        df_data.index = pd.DatetimeIndex(pd.to_datetime(df_data["timestamp"].to_numpy(), unit="s"), name="datetime")
+        return df_data
+
     def get_eod_historical_stock_market_data(
         self,
         symbol,
@@ -1068,7 +1350,7 @@ class APIClient:
         List of supported exchanges: https://eodhd.com/financial-apis/exchanges-api-list-of-tickers-and-trading-hours/
         For more information visit: https://eodhd.com/financial-apis/api-for-historical-data-and-volumes/
         """
-        api_call = EodHistoricalStockMarketDataAPI(session=self._session, timeout=self._timeout)
+        api_call = EodHistoricalStockMarketDataAPI(**self._api_options())
         return api_call.get_eod_historical_stock_market_data(
             api_token=self._api_key,
             symbol=symbol,
@@ -1084,7 +1366,8 @@ class APIClient:
         symbol,
         from_timestamp,
         to_timestamp,
-        limit=None
+        limit=None,
+        output="json"
     ):
         """
         Available args:
@@ -1096,14 +1379,17 @@ class APIClient:
                 for example, these values are correct: “from=1627896900&to=1630575300” and
                 correspond to ' 2021-08-02 09:35:00 ' and ' 2021-09-02 09:35:00 '.
             limit - the maximum number of ticks will be provided.
+            output - 'json' (default) for the decoded response, or 'numpy' for a structured array with
+                ts (int64 ns), price (float64), shares (int32) and the remaining fields (see eodhd.ticks).
         """
-        api_call = StockMarketTickDataAPI(session=self._session, timeout=self._timeout)
+        api_call = StockMarketTickDataAPI(**self._api_options())
         return api_call.get_stock_market_tick_data(
             api_token=self._api_key,
             symbol=symbol,
             to_timestamp=to_timestamp,
             from_timestamp=from_timestamp,
-            limit=limit
+            limit=limit,
+            output=output
         )
 
     def financial_news(self, s=None, t=None, from_date=None, to_date=None, limit=None, offset=None):
@@ -1116,7 +1402,7 @@ class APIClient:
             limit (not required) - Number of results (default: 50, min: 1, max: 1000)
             offset (not required) - Offset for pagination (default: 0)
         """
-        api_call = FinancialNewsAPI(session=self._session, timeout=self._timeout)
+        api_call = FinancialNewsAPI(**self._api_options())
         return api_call.financial_news(
             api_token=self._api_key,
             s=s,
@@ -1133,7 +1419,7 @@ class APIClient:
             s [REQUIRED] - One or more comma-separated tickers (e.g. "BTC-USD.CC,AAPL.US")
             from_date, to_date [NOT REQUIRED] - YYYY-MM-DD
         """
-        api_call = FinancialNewsAPI(session=self._session, timeout=self._timeout)
+        api_call = FinancialNewsAPI(**self._api_options())
         return api_call.get_sentiment(
             api_token=self._api_key,
             s=s,
@@ -1151,7 +1437,7 @@ class APIClient:
             date_to   [NOT REQUIRED] - YYYY-MM-DD (maps to filter[date_to])
             limit     [NOT REQUIRED] - Number of top words to return (maps to page[limit])
         """
-        api_call = FinancialNewsAPI(session=self._session, timeout=self._timeout)
+        api_call = FinancialNewsAPI(**self._api_options())
         return api_call.news_word_weights(
             api_token=self._api_key,
             s=s,
@@ -1175,7 +1461,7 @@ class APIClient:
             For more information visit: https://eodhd.com/financial-apis/historical-market-capitalization-api/
         """
 
-        api_call = HistoricalMarketCapitalizationAPI(session=self._session, timeout=self._timeout)
+        api_call = HistoricalMarketCapitalizationAPI(**self._api_options())
         return api_call.get_historical_market_capitalization_data(
             api_token=self._api_key,
             ticker=ticker,
@@ -1205,7 +1491,7 @@ class APIClient:
                 date="2017-02-01"
             )
         """
-        api_call = CBOEIndexFeedAPI(session=self._session, timeout=self._timeout)
+        api_call = CBOEIndexFeedAPI(**self._api_options())
         return api_call.get_cboe_index_data(
             api_token=self._api_key,
             index_code=index_code,
@@ -1214,6 +1500,7 @@ class APIClient:
             fmt=fmt,
         )
 
+    @_reference_data
     def get_cboe_indices_list(self, fmt=None):
         """
         CBOE Indices List API
@@ -1226,12 +1513,13 @@ class APIClient:
         Returns:
             dict with keys: meta, data, links (links.next for pagination)
         """
-        api_call = CBOEIndexFeedAPI(session=self._session, timeout=self._timeout)
+        api_call = CBOEIndexFeedAPI(**self._api_options())
         return api_call.get_cboe_indices_list(
             api_token=self._api_key,
             fmt=fmt,
         )
 
+    @_fetch_all_mode
     def get_id_mapping(
             self,
             symbol=None,
@@ -1256,10 +1544,13 @@ class APIClient:
         Pagination:
             page_limit (1..1000), page_offset (>=0)
 
+        fetch_all=True fetches every page (in parallel when meta.total is known, up to
+        max_workers at a time) and returns them merged into one envelope.
+
         Returns:
             dict with meta/data/links (links.next for pagination)
         """
-        api_call = IDMappingAPI(session=self._session, timeout=self._timeout)
+        api_call = IDMappingAPI(**self._api_options())
         return api_call.get_id_mapping(
             api_token=self._api_key,
             symbol=symbol,
@@ -1287,7 +1578,7 @@ class APIClient:
         Example:
             client.get_commodity_history(code="WTI", interval="monthly")
         """
-        api_call = CommoditiesAPI()
+        api_call = CommoditiesAPI(**self._api_options())
         return api_call.get_commodity_history(
             api_token=self._api_key,
             code=code,
@@ -1295,6 +1586,7 @@ class APIClient:
         )
 
     # marketplace endpoints, provided by EODHD
+    @_reference_data
     def mp_indices_list(self):
         """
         Marketplace: S&P Global / UnicornBay indices list
@@ -1305,7 +1597,7 @@ class APIClient:
         Returns:
             list[dict] - list of indices with fields like Code, Name, Constituents, etc.
         """
-        api_call = MPIndicesListAPI(session=self._session, timeout=self._timeout)
+        api_call = MPIndicesListAPI(**self._api_options())
         return api_call.get_indices_list(api_token=self._api_key)
 
     def mp_index_components(self, symbol, historical=None, from_date=None, to_date=None):
@@ -1325,7 +1617,7 @@ class APIClient:
             dict - JSON with keys like "General", "Components",
                    and optionally historical keys.
         """
-        api_call = MPIndexComponentsAPI(session=self._session, timeout=self._timeout)
+        api_call = MPIndexComponentsAPI(**self._api_options())
         return api_call.get_index_components(
             api_token=self._api_key,
             symbol=symbol,
@@ -1334,6 +1626,7 @@ class APIClient:
             to_date=to_date,
         )
 
+    @_fetch_all_mode
     def get_us_options_contracts(
             self,
             underlying_symbol=None,
@@ -1376,10 +1669,13 @@ class APIClient:
         Fields:
             fields[options-contracts] as "a,b,c" or ["a","b","c"]
 
+        fetch_all=True fetches every page (in parallel when meta.total is known, up to
+        max_workers at a time) and returns them merged into one envelope.
+
         Returns:
             dict with meta, data[], links.next (pagination)
         """
-        api_call = MPUSOptionsContractsAPI(session=self._session, timeout=self._timeout)
+        api_call = MPUSOptionsContractsAPI(**self._api_options())
         return api_call.get_us_options_contracts(
             api_token=self._api_key,
             underlying_symbol=underlying_symbol,
@@ -1401,6 +1697,7 @@ class APIClient:
             fmt=fmt,
         )
 
+    @_fetch_all_mode
     def get_us_options_eod(
             self,
             underlying_symbol=None,
@@ -1447,10 +1744,13 @@ class APIClient:
         Compact:
             compact=1 to minimize payload (array-style response)
 
+        fetch_all=True fetches every page (in parallel when meta.total is known, up to
+        max_workers at a time) and returns them merged into one envelope.
+
         Returns:
             dict with meta, data[], links.next (pagination)
         """
-        api_call = MPUSOptionsEODAPI(session=self._session, timeout=self._timeout)
+        api_call = MPUSOptionsEODAPI(**self._api_options())
         return api_call.get_us_options_eod(
             api_token=self._api_key,
             underlying_symbol=underlying_symbol,
@@ -1473,6 +1773,7 @@ class APIClient:
             fmt=fmt,
         )
 
+    @_reference_data
     def get_us_options_underlyings(self, page_offset=None, page_limit=None, fmt="json"):
         """
         US Stock Options Data API - Underlying symbols list
@@ -1487,7 +1788,7 @@ class APIClient:
         Returns:
             dict with meta, data (list of symbols), links.next
         """
-        api_call = MPUSOptionsUnderlyingSymbolsAPI(session=self._session, timeout=self._timeout)
+        api_call = MPUSOptionsUnderlyingSymbolsAPI(**self._api_options())
         return api_call.get_us_options_underlyings(
             api_token=self._api_key,
             page_offset=page_offset,
@@ -1499,7 +1800,7 @@ class APIClient:
 
     def search(self, query, limit=None, type=None, exchange=None, bonds_only=None):
         """GET /api/search/{query}"""
-        api_call = SearchAPI(session=self._session, timeout=self._timeout)
+        api_call = SearchAPI(**self._api_options())
         return api_call.search(
             api_token=self._api_key, query=query, limit=limit,
             type=type, exchange=exchange, bonds_only=bonds_only,
@@ -1512,7 +1813,7 @@ class APIClient:
 
         Returns: bytes (PNG image data)
         """
-        api_call = LogoAPI(session=self._session, timeout=self._timeout)
+        api_call = LogoAPI(**self._api_options())
         return api_call.get_logo(api_token=self._api_key, symbol=symbol)
 
     def get_logo_svg(self, symbol):
@@ -1522,7 +1823,7 @@ class APIClient:
 
         Returns: bytes (SVG image data)
         """
-        api_call = LogoAPI(session=self._session, timeout=self._timeout)
+        api_call = LogoAPI(**self._api_options())
         return api_call.get_logo_svg(api_token=self._api_key, symbol=symbol)
 
     def get_user_info(self):
@@ -1532,7 +1833,7 @@ class APIClient:
 
         Returns: dict with subscription details and API usage
         """
-        api_call = UserAPI(session=self._session, timeout=self._timeout)
+        api_call = UserAPI(**self._api_options())
         return api_call.get_user_info(api_token=self._api_key)
 
     def get_bulk_fundamentals(self, exchange, symbols=None, offset=None, limit=None):
@@ -1546,24 +1847,41 @@ class APIClient:
             offset   [OPTIONAL] - Pagination offset
             limit    [OPTIONAL] - Maximum number of results
         """
-        api_call = BulkFundamentalsAPI(session=self._session, timeout=self._timeout)
+        api_call = BulkFundamentalsAPI(**self._api_options())
         return api_call.get_bulk_fundamentals(
             api_token=self._api_key, exchange=exchange, symbols=symbols, offset=offset, limit=limit,
         )
 
     def get_bulk_fundamentals_v1_1(self, exchange, symbols=None, offset=None, limit=None):
         """GET /api/v1.1/bulk-fundamentals/{exchange}"""
-        api_call = BulkFundamentalsAPI(session=self._session, timeout=self._timeout)
+        api_call = BulkFundamentalsAPI(**self._api_options())
         return api_call.get_bulk_fundamentals_v1_1(
             api_token=self._api_key, exchange=exchange, symbols=symbols, offset=offset, limit=limit,
         )
 
+    def iter_bulk_fundamentals(self, exchange, symbols=None, offset=None, limit=None, version="1.0",
+                               batch_size=None):
+        """
+        Streaming Bulk Fundamentals
+        Endpoint: GET /api/bulk-fundamentals/{exchange} (version="1.1": /api/v1.1/bulk-fundamentals/{exchange})
+
+        Yields one company's fundamentals at a time as the response arrives, or
+        lists of up to `batch_size` companies, instead of materialising the whole
+        exchange in memory. Arguments are as for get_bulk_fundamentals. The
+        response cache is not used.
+        """
+        api_call = BulkFundamentalsAPI(**self._api_options())
+        records = api_call.iter_bulk_fundamentals(
+            api_token=self._api_key, exchange=exchange, symbols=symbols, offset=offset, limit=limit, version=version,
+        )
+        return records if batch_size is None else iter_batches(records, batch_size)
+
     def get_treasury_bill_rates(self, from_date=None, to_date=None):
         """
         US Treasury Bill Rates
         Endpoint: GET /api/ust/bill-rates
         """
-        api_call = TreasuryAPI(session=self._session, timeout=self._timeout)
+        api_call = TreasuryAPI(**self._api_options())
         return api_call.get_treasury_bill_rates(api_token=self._api_key, from_date=from_date, to_date=to_date)
 
     def get_treasury_yield_rates(self, from_date=None, to_date=None):
@@ -1571,7 +1889,7 @@ class APIClient:
         US Treasury Yield Curve Rates
         Endpoint: GET /api/ust/yield-rates
         """
-        api_call = TreasuryAPI(session=self._session, timeout=self._timeout)
+        api_call = TreasuryAPI(**self._api_options())
         return api_call.get_treasury_yield_rates(api_token=self._api_key, from_date=from_date, to_date=to_date)
 
     def get_treasury_long_term_rates(self, from_date=None, to_date=None):
@@ -1579,7 +1897,7 @@ class APIClient:
         US Treasury Long-Term Rates
         Endpoint: GET /api/ust/long-term-rates
         """
-        api_call = TreasuryAPI(session=self._session, timeout=self._timeout)
+        api_call = TreasuryAPI(**self._api_options())
         return api_call.get_treasury_long_term_rates(api_token=self._api_key, from_date=from_date, to_date=to_date)
 
     def get_treasury_real_yield_rates(self, from_date=None, to_date=None):
@@ -1587,7 +1905,7 @@ class APIClient:
         US Treasury Real Yield Curve Rates
         Endpoint: GET /api/ust/real-yield-rates
         """
-        api_call = TreasuryAPI(session=self._session, timeout=self._timeout)
+        api_call = TreasuryAPI(**self._api_options())
         return api_call.get_treasury_real_yield_rates(api_token=self._api_key, from_date=from_date, to_date=to_date)
 
     # ── Phase 2: Marketplace ──────────────────────────────────────
@@ -1596,46 +1914,49 @@ class APIClient:
 
     def mp_esg_companies(self):
         """Marketplace: InvestVerte - Companies list."""
-        api_call = MPInvestVerteAPI(session=self._session, timeout=self._timeout)
+        api_call = MPInvestVerteAPI(**self._api_options())
         return api_call.get_companies(api_token=self._api_key)
 
     def mp_esg_countries(self):
         """Marketplace: InvestVerte - Countries list."""
-        api_call = MPInvestVerteAPI(session=self._session, timeout=self._timeout)
+        api_call = MPInvestVerteAPI(**self._api_options())
         return api_call.get_countries(api_token=self._api_key)
 
     def mp_esg_sectors(self):
         """Marketplace: InvestVerte - Sectors list."""
-        api_call = MPInvestVerteAPI(session=self._session, timeout=self._timeout)
+        api_call = MPInvestVerteAPI(**self._api_options())
         return api_call.get_sectors(api_token=self._api_key)
 
     def mp_esg(self, symbol):
         """Marketplace: InvestVerte - ESG data for a company."""
-        api_call = MPInvestVerteAPI(session=self._session, timeout=self._timeout)
+        api_call = MPInvestVerteAPI(**self._api_options())
         return api_call.get_esg(api_token=self._api_key, symbol=symbol)
 
     def mp_esg_country(self, symbol):
         """Marketplace: InvestVerte - Country-level ESG data."""
-        api_call = MPInvestVerteAPI(session=self._session, timeout=self._timeout)
+        api_call = MPInvestVerteAPI(**self._api_options())
         return api_call.get_country(api_token=self._api_key, symbol=symbol)
 
     def mp_esg_sector(self, symbol):
         """Marketplace: InvestVerte - Sector-level ESG data."""
-        api_call = MPInvestVerteAPI(session=self._session, timeout=self._timeout)
+        api_call = MPInvestVerteAPI(**self._api_options())
         return api_call.get_sector(api_token=self._api_key, symbol=symbol)
 
     # --- Unicornbay Extras (2 methods) ---
 
-    def mp_tickdata(self, symbol, from_timestamp=None, to_timestamp=None, page_offset=None, page_limit=None):
+    def mp_tickdata(self, symbol, from_timestamp=None, to_timestamp=None, page_offset=None, page_limit=None,
+                    output="json"):
         """
         Marketplace: Unicornbay - Tick data
         Endpoint: GET /api/mp/unicornbay/tickdata/ticks
+
+        output="numpy" returns the page's ticks as a structured array (see eodhd.ticks).
         """
-        api_call = MPUnicornbayExtrasAPI(session=self._session, timeout=self._timeout)
+        api_call = MPUnicornbayExtrasAPI(**self._api_options())
         return api_call.get_tickdata(
             api_token=self._api_key, symbol=symbol,
             from_timestamp=from_timestamp, to_timestamp=to_timestamp,
-            page_offset=page_offset, page_limit=page_limit,
+            page_offset=page_offset, page_limit=page_limit, output=output,
         )
 
     def mp_unicornbay_logo(self, symbol):
@@ -1645,7 +1966,7 @@ class APIClient:
 
         Returns: bytes (image data)
         """
-        api_call = MPUnicornbayExtrasAPI(session=self._session, timeout=self._timeout)
+        api_call = MPUnicornbayExtrasAPI(**self._api_options())
         return api_call.get_logo(api_token=self._api_key, symbol=symbol)
 
     # ------------------------------------------------------------------
@@ -1664,7 +1985,7 @@ class APIClient:
             page_offset / page_limit [OPTIONAL] - pagination
         Returns: dict envelope { data, meta, links }
         """
-        api_call = CreditSovereignRiskAPI(session=self._session, timeout=self._timeout)
+        api_call = CreditSovereignRiskAPI(**self._api_options())
         return api_call.get_sovereign_risk_premium(
             api_token=self._api_key, country=country, region=region, as_of=as_of,
             page_offset=page_offset, page_limit=page_limit,
@@ -1682,7 +2003,7 @@ class APIClient:
             page_offset / page_limit [OPTIONAL] - pagination
         Returns: dict envelope { data, meta, links }
         """
-        api_call = CreditSovereignRiskAPI(session=self._session, timeout=self._timeout)
+        api_call = CreditSovereignRiskAPI(**self._api_options())
         return api_call.get_sovereign_credit_ratings(
             api_token=self._api_key, country=country, as_of=as_of,
             page_offset=page_offset, page_limit=page_limit,
@@ -1700,7 +2021,7 @@ class APIClient:
             page_offset / page_limit [OPTIONAL] - pagination
         Returns: dict envelope { data, meta, links }
         """
-        api_call = CreditSovereignRiskAPI(session=self._session, timeout=self._timeout)
+        api_call = CreditSovereignRiskAPI(**self._api_options())
         return api_call.get_sovereign_cds_spreads(
             api_token=self._api_key, country=country, as_of=as_of,
             page_offset=page_offset, page_limit=page_limit,
@@ -1718,7 +2039,7 @@ class APIClient:
             page_offset / page_limit [OPTIONAL] - pagination
         Returns: dict envelope { data, meta, links }
         """
-        api_call = CreditSovereignRiskAPI(session=self._session, timeout=self._timeout)
+        api_call = CreditSovereignRiskAPI(**self._api_options())
         return api_call.get_sovereign_default_spreads(
             api_token=self._api_key, rating=rating, as_of=as_of,
             page_offset=page_offset, page_limit=page_limit,
@@ -1736,7 +2057,7 @@ class APIClient:
             page_offset / page_limit [OPTIONAL] - pagination
         Returns: dict envelope { data, meta, links }
         """
-        api_call = CreditSovereignRiskAPI(session=self._session, timeout=self._timeout)
+        api_call = CreditSovereignRiskAPI(**self._api_options())
         return api_call.get_corporate_cmdi(
             api_token=self._api_key, from_date=from_date, to_date=to_date,
             page_offset=page_offset, page_limit=page_limit,
@@ -1756,7 +2077,7 @@ class APIClient:
             page_offset / page_limit [OPTIONAL] - pagination
         Returns: dict envelope { data, meta, links }
         """
-        api_call = CreditSovereignRiskAPI(session=self._session, timeout=self._timeout)
+        api_call = CreditSovereignRiskAPI(**self._api_options())
         return api_call.get_corporate_hqm_yields(
             api_token=self._api_key, tenor=tenor, yield_type=yield_type, from_date=from_date,
             to_date=to_date, page_offset=page_offset, page_limit=page_limit,
@@ -1779,7 +2100,7 @@ class APIClient:
             page_offset / page_limit [OPTIONAL] - pagination
         Returns: dict envelope { data, meta, links }
         """
-        api_call = CreditSovereignRiskAPI(session=self._session, timeout=self._timeout)
+        api_call = CreditSovereignRiskAPI(**self._api_options())
         return api_call.get_cds_market_aggregates(
             api_token=self._api_key, metric=metric, dimension=dimension,
             value=value, region=region, from_date=from_date, to_date=to_date,
@@ -1789,6 +2110,7 @@ class APIClient:
     # ------------------------------------------------------------------
     # Sanctions API (/api/sanctions)
     # ------------------------------------------------------------------
+    @_fetch_all_mode
     def get_sanctions_entities(self, q=None, program=None, country=None, source=None,
                                entity_type=None, active=None,
                                page_offset=None, page_limit=None):
@@ -1806,9 +2128,11 @@ class APIClient:
             entity_type [OPTIONAL] - type: "individual"|"entity"|"vessel"|"aircraft"
             active      [OPTIONAL] - "true"/"false" (bool accepted)
             page_offset / page_limit [OPTIONAL] - pagination
+            fetch_all   [OPTIONAL] - True: fetch every page (in parallel when meta.total is known)
+                          and return them merged into one envelope; max_workers caps concurrency
         Returns: dict envelope { data, meta, links }
         """
-        api_call = SanctionsAPI(session=self._session, timeout=self._timeout)
+        api_call = SanctionsAPI(**self._api_options())
         return api_call.get_entities(
             api_token=self._api_key, q=q, program=program, country=country,
             source=source, entity_type=entity_type, active=active,
@@ -1834,13 +2158,14 @@ class APIClient:
             page_offset / page_limit [OPTIONAL] - pagination
         Returns: dict envelope { data, meta, links }
         """
-        api_call = SanctionsAPI(session=self._session, timeout=self._timeout)
+        api_call = SanctionsAPI(**self._api_options())
         return api_call.get_vessels(
             api_token=self._api_key, q=q, imo=imo, flag=flag, vessel_type=vessel_type,
             program=program, source=source,
             page_offset=page_offset, page_limit=page_limit,
         )
 
+    @_reference_data
     def get_sanctions_programs(self):
         """
         Sanctions: list of sanctions programs
@@ -1849,9 +2174,10 @@ class APIClient:
         Takes no params and is not paginated.
         Returns: dict envelope { data, meta, links }; data items have program, count.
         """
-        api_call = SanctionsAPI(session=self._session, timeout=self._timeout)
+        api_call = SanctionsAPI(**self._api_options())
         return api_call.get_programs(api_token=self._api_key)
 
+    @_reference_data
     def get_sanctions_sources(self):
         """
         Sanctions: list of sanctions sources
@@ -1860,7 +2186,7 @@ class APIClient:
         Takes no params and is not paginated.
         Returns: dict envelope { data, meta, links }; data items have name.
         """
-        api_call = SanctionsAPI(session=self._session, timeout=self._timeout)
+        api_call = SanctionsAPI(**self._api_options())
         return api_call.get_sources(api_token=self._api_key)
 
     # ------------------------------------------------------------------
@@ -1881,7 +2207,7 @@ class APIClient:
             page_offset / page_limit [OPTIONAL] - pagination
         Returns: dict envelope { data, meta, links }
         """
-        api_call = InterestRatesAPI(session=self._session, timeout=self._timeout)
+        api_call = InterestRatesAPI(**self._api_options())
         return api_call.get_reference_rates(
             api_token=self._api_key, code=code, currency=currency,
             from_date=from_date, to_date=to_date,
@@ -1904,7 +2230,7 @@ class APIClient:
             page_offset / page_limit [OPTIONAL] - pagination
         Returns: dict envelope { data, meta, links }
         """
-        api_call = InterestRatesAPI(session=self._session, timeout=self._timeout)
+        api_call = InterestRatesAPI(**self._api_options())
         return api_call.get_policy_rates(
             api_token=self._api_key, code=code, country=country,
             central_bank=central_bank, from_date=from_date, to_date=to_date,
@@ -1924,7 +2250,7 @@ class APIClient:
             to_date   [OPTIONAL] - filter[to], YYYY-MM-DD
         Returns: dict envelope { data, meta, links }
         """
-        api_call = InterestRatesAPI(session=self._session, timeout=self._timeout)
+        api_call = InterestRatesAPI(**self._api_options())
         return api_call.get_funding_stress(
             api_token=self._api_key, code=code, from_date=from_date, to_date=to_date,
         )
@@ -1941,7 +2267,7 @@ class APIClient:
         Returns: dict envelope { data, meta, links }
         For more information visit: https://eodhd.com/financial-apis/real-estate-data-api
         """
-        api_call = RealEstateAPI(session=self._session, timeout=self._timeout)
+        api_call = RealEstateAPI(**self._api_options())
         return api_call.get_real_estate_countries(
             api_token=self._api_key, sort=sort,
             page_limit=page_limit, page_offset=page_offset,
@@ -1966,13 +2292,14 @@ class APIClient:
         Returns: dict envelope { data, meta, links }
         For more information visit: https://eodhd.com/financial-apis/real-estate-data-api
         """
-        api_call = RealEstateAPI(session=self._session, timeout=self._timeout)
+        api_call = RealEstateAPI(**self._api_options())
         return api_call.get_real_estate_selected_prices(
             api_token=self._api_key, code=code, type=type, metric=metric,
             from_date=from_date, to_date=to_date, sort=sort,
             page_limit=page_limit, page_offset=page_offset,
         )
 
+    @_fetch_all_mode
     def get_real_estate_detailed_prices(self, code, area=None, property_type=None, vintage=None,
                                         freq=None, from_date=None, to_date=None, sort=None,
                                         page_limit=None, page_offset=None):
@@ -1991,10 +2318,12 @@ class APIClient:
             sort          [OPTIONAL] - one of period, -period, value, -value
             page_limit    [OPTIONAL] - 1..500 (default 50)
             page_offset   [OPTIONAL] - >= 0 (default 0)
+            fetch_all   [OPTIONAL] - True: fetch every page (in parallel when meta.total is known)
+                          and return them merged into one envelope; max_workers caps concurrency
         Returns: dict envelope { data, meta, links }
         For more information visit: https://eodhd.com/financial-apis/real-estate-data-api
         """
-        api_call = RealEstateAPI(session=self._session, timeout=self._timeout)
+        api_call = RealEstateAPI(**self._api_options())
         return api_call.get_real_estate_detailed_prices(
             api_token=self._api_key, code=code, area=area, property_type=property_type,
             vintage=vintage, freq=freq, from_date=from_date, to_date=to_date,
@@ -2013,11 +2342,110 @@ class APIClient:
         Returns: dict envelope { data, meta }
         For more information visit: https://eodhd.com/financial-apis/real-estate-data-api
         """
-        api_call = RealEstateAPI(session=self._session, timeout=self._timeout)
+        api_call = RealEstateAPI(**self._api_options())
         return api_call.get_real_estate_detailed_series(
             api_token=self._api_key, code=code,
         )
 
+    # ------------------------------------------------------------------
+    # Auto-pagination (page[offset] / page[limit] endpoints)
+    # ------------------------------------------------------------------
+    def _page_fetcher(self, method: str, kwargs: dict):
+        """Split page_offset/page_limit out of `kwargs`; return (fetch_page, page_offset, page_limit, max_offset)."""
+        call = getattr(self, method)
+        page_offset = kwargs.pop("page_offset", None) or 0
+        page_limit = kwargs.pop("page_limit", None)
+
+        def fetch_page(offset, limit):
+            params = dict(kwargs, page_offset=offset)
+            if limit is not None:
+                params["page_limit"] = limit
+            return call(**params)
+
+        return fetch_page, page_offset, page_limit, _MAX_PAGE_OFFSETS.get(method)
+
+    def iter_pages(self, method: str, prefetch: bool = False, **kwargs):
+        """
+        Iterate over every page envelope ({data, meta, links}) returned by a
+        paginated APIClient method, e.g.::
+
+            for page in client.iter_pages("get_sanctions_entities", program="SDN", page_limit=100):
+                ...
+
+        `kwargs` are passed to `method`; page_offset (default 0) is where to
+        start and page_limit the page size. Pages are followed through
+        links.next until the last one. prefetch=True fetches the next page in
+        the background while the current one is being processed. Requests go
+        through this client's rate limiter and retry policy.
+        """
+        fetch_page, page_offset, page_limit, max_offset = self._page_fetcher(method, kwargs)
+        return iter_pages(fetch_page, page_offset, page_limit, prefetch=prefetch, max_offset=max_offset)
+
+    def fetch_all_pages(self, method: str, max_workers: int = 8, **kwargs) -> dict:
+        """
+        Fetch all pages of a paginated APIClient method and return them merged
+        into one {data, meta, links} envelope, in page order.
+
+        When the first page reports meta.total, the remaining pages are fetched
+        concurrently on up to `max_workers` threads (still subject to the rate
+        limiter); otherwise links.next is followed page by page. Endpoints with
+        a maximum page[offset] (US options: 10000) stop there; a warning is
+        logged if meta.total says more data exists, so narrow the filters.
+        """
+        fetch_page, page_offset, page_limit, max_offset = self._page_fetcher(method, kwargs)
+        self._ensure_pool_size(max_workers)
+        merged = merge_pages(fetch_all_pages(fetch_page, page_offset, page_limit, max_workers, max_offset))
+
+        total = merged["meta"].get("total")
+        if max_offset is not None and isinstance(total, int) and merged["meta"]["count"] < total - page_offset:
+            self.console.log(
+                f"{method}: fetched {merged['meta']['count']} of {total} records; the API does not page "
+                f"beyond offset {max_offset}, narrow the filters to get the rest."
+            )
+        return merged
+
+    def iter_us_options_eod(self, prefetch: bool = False, **kwargs):
+        """Yield every options EOD record matching the filters of get_us_options_eod, across all pages
+        (page[offset] is capped at 10000 by the API)."""
+        return iter_records(self.iter_pages("get_us_options_eod", prefetch, **kwargs))
+
+    def iter_us_options_contracts(self, prefetch: bool = False, **kwargs):
+        """Yield every contract matching the filters of get_us_options_contracts, across all pages
+        (page[offset] is capped at 10000 by the API)."""
+        return iter_records(self.iter_pages("get_us_options_contracts", prefetch, **kwargs))
+
+    def iter_id_mapping(self, prefetch: bool = False, **kwargs):
+        """Yield every mapping record for the identifiers given as in get_id_mapping, across all pages."""
+        return iter_records(self.iter_pages("get_id_mapping", prefetch, **kwargs))
+
+    def iter_sanctions_entities(self, prefetch: bool = False, **kwargs):
+        """Yield every sanctioned entity matching the filters of get_sanctions_entities, across all pages."""
+        return iter_records(self.iter_pages("get_sanctions_entities", prefetch, **kwargs))
+
+    def iter_sanctions_vessels(self, prefetch: bool = False, **kwargs):
+        """Yield every sanctioned vessel matching the filters of get_sanctions_vessels, across all pages."""
+        return iter_records(self.iter_pages("get_sanctions_vessels", prefetch, **kwargs))
+
+    def iter_real_estate_countries(self, prefetch: bool = False, **kwargs):
+        """Yield every country record of get_real_estate_countries, across all pages."""
+        return iter_records(self.iter_pages("get_real_estate_countries", prefetch, **kwargs))
+
+    def iter_real_estate_selected_prices(self, code, prefetch: bool = False, **kwargs):
+        """Yield every observation of get_real_estate_selected_prices(code, ...), across all pages."""
+        return iter_records(self.iter_pages("get_real_estate_selected_prices", prefetch, code=code, **kwargs))
+
+    def iter_real_estate_detailed_prices(self, code, prefetch: bool = False, **kwargs):
+        """Yield every observation of get_real_estate_detailed_prices(code, ...), across all pages."""
+        return iter_records(self.iter_pages("get_real_estate_detailed_prices", prefetch, code=code, **kwargs))
+
+    def iter_mp_tickdata(self, symbol, prefetch: bool = False, **kwargs):
+        """Yield every tick of mp_tickdata(symbol, ...), across all pages."""
+        return iter_records(self.iter_pages("mp_tickdata", prefetch, symbol=symbol, **kwargs))
+
+    def iter_us_extended_quotes(self, s, prefetch: bool = False, **kwargs):
+        """Yield (symbol, quote) pairs for every symbol of get_us_extended_quotes(s, ...), across all pages."""
+        return iter_records(self.iter_pages("get_us_extended_quotes", prefetch, s=s, **kwargs))
+
 
 class ScannerClient:
     """Scanner class"""
@@ -2030,20 +2458,67 @@ class ScannerClient:
 
         self.api = APIClient(api_key, timeout=timeout)
 
+    # Indicators of scan_markets, on the latest bar of symbols with at least 200 bars.
+    TREND_SCREEN = Screen(
+        "trend",
+        {
+            **{name: ("field", {"column": name}) for name in ("open", "high", "low", "close", "adjusted_close", "volume")},
+            "sma50": ("sma", {"period": 50, "field": "adjusted_close"}),
+            "sma200": ("sma", {"period": 200, "field": "adjusted_close"}),
+            "ema12": ("ema", {"period": 12, "field": "adjusted_close"}),
+            "ema26": ("ema", {"period": 26, "field": "adjusted_close"}),
+            "atr14": ("atr", {"period": 14, "close": "adjusted_close"}),
+        },
+        lookback=200,
+    )
+
+    @staticmethod
+    def run_screens(histories: dict, screens) -> dict:
+        """Evaluate many screens (eodhd.indicators.Screen) over already fetched histories
+        ({symbol: DataFrame}); indicators shared between screens are computed once.
+        Returns {screen name: DataFrame of latest values, one row per symbol}."""
+        return IndicatorEngine(histories).run(screens)
+
+    def _trend_rows(self, histories: dict, interval: str) -> pd.DataFrame:
+        df_data = self.run_screens(histories, [self.TREND_SCREEN])[self.TREND_SCREEN.name]
+        symbols = list(df_data.index)
+        df_data = df_data.reset_index(drop=True)
+        df_data.index = pd.Index([histories[symbol].index[-1] for symbol in symbols])
+
+        df_data.insert(0, "symbol", symbols)
+        df_data.insert(1, "interval", interval)
+        df_data["volume"] = df_data["volume"].astype(np.int64)
+        df_data["bull_market"] = df_data["sma50"] >= df_data["sma200"]
+        df_data["next_action"] = np.where(df_data["ema12"] > df_data["ema26"], "sell", "buy")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            df_data["atr14_pcnt"] = (df_data["atr14"] / df_data["adjusted_close"] * 100).round(2)
+        return df_data[_SCAN_COLUMNS]
+
     def scan_markets(
         self,
         market_type: str = "CC",
-        interval: str = Interval,
+        interval: str = "d",
         quote_currency: str = "USD",
         request_limit: int = 5000,
-    ):
-        """Scan markets"""
+        max_workers: int = 8,
+        output_file: str = None,
+        batch_size: int = 500,
+    ) -> pd.DataFrame:
+        """Scan markets
+
+        Fetches the history of every `market_type` symbol quoted in
+        `quote_currency` (at most `request_limit` requests) on up to `max_workers`
+        threads, `batch_size` symbols at a time. For symbols with at least 200
+        bars, SMA50/SMA200, EMA12/EMA26 and ATR14 (TREND_SCREEN) are computed for
+        the whole batch at once on stacked float arrays; the last bar of each
+        symbol becomes one row of the returned DataFrame, sorted by
+        bull_market, next_action, volume and atr14_pcnt. Symbols whose download
+        fails are skipped. The result is written to `output_file` (CSV) if given.
+        """
 
         if request_limit < 0 or request_limit > 100000:
             raise ValueError("request limit is out of bounds!")
 
-        df_dataset = pd.DataFrame()
-
         resp = self.api.get_exchange_symbols(market_type)
         symbol_list = resp[resp.Code.str.endswith(f"-{quote_currency}", na=False)].Code.to_numpy()
 
@@ -2051,27 +2526,19 @@ class ScannerClient:
             # truncate symbol list to request limit minus symbol list request
             symbol_list = symbol_list[0 : request_limit - 1]
 
-        for symbol in track(symbol_list, description="Processing..."):
-            df_data = self.api.get_historical_data(f"{symbol}.{market_type}", interval)
-            if len(df_data) >= 200:
-                df_data["sma50"] = df_data.adjusted_close.rolling(50, min_periods=1).mean()
-                df_data["sma200"] = df_data.adjusted_close.rolling(200, min_periods=1).mean()
-                df_data["bull_market"] = df_data.sma50 >= df_data.sma200
-
-                df_data["ema12"] = df_data.adjusted_close.ewm(span=12, adjust=False).mean()
-                df_data["ema26"] = df_data.adjusted_close.ewm(span=26, adjust=False).mean()
-                df_data.loc[df_data["ema12"] > df_data["ema26"], "next_action"] = "sell"
-                df_data["next_action"].fillna("buy", inplace=True)
+        symbols = [f"{symbol}.{market_type}" for symbol in symbol_list]
+        parts, failed = [], 0
+        for batch in track(list(iter_batches(symbols, batch_size)), description="Processing..."):
+            results = self.api.fetch_many(batch, method="get_historical_data", max_workers=max_workers,
+                                          interval=interval)
+            histories = {symbol: df_data for symbol, df_data in results.items() if isinstance(df_data, pd.DataFrame)}
+            failed += len(results) - len(histories)
+            parts.append(self._trend_rows(histories, interval))
 
-                high_low = df_data["high"] - df_data["low"]
-                high_close = abs(df_data["high"] - df_data["adjusted_close"].shift())
-                low_close = abs(df_data["low"] - df_data["adjusted_close"].shift())
-                ranges = pd.concat([high_low, high_close, low_close], axis=1)
-                true_range = np.max(ranges, axis=1)
-                df_data["atr14"] = true_range.rolling(14).sum() / 14
-                df_data["atr14_pcnt"] = (df_data["atr14"] / df_data["adjusted_close"] * 100).round(2)
+        if failed:
+            self.api.console.log(f"{failed} of {len(symbols)} symbols could not be downloaded")
 
-                df_dataset = df_dataset.append(df_data.tail(1))
+        df_dataset = pd.concat(parts) if parts else pd.DataFrame(columns=_SCAN_COLUMNS)
 
         # drop infinite values
         df_dataset.replace([np.inf, -np.inf], np.nan, inplace=True)
@@ -2082,6 +2549,7 @@ class ScannerClient:
             ascending=[False, True, False, False],
             inplace=True,
         )
-        df_dataset.to_csv("dataset.csv")
+        if output_file is not None:
+            df_dataset.to_csv(output_file)
 
-        return df_dataset
\ No newline at end of file
+        return df_dataset
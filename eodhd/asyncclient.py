@@ -0,0 +1,100 @@
+"""asyncclient.py"""
+
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from eodhd.apiclient import APIClient
+from eodhd.cache import ResponseCache
+from eodhd.ratelimiter import RateLimiter
+from eodhd.retry import RetryPolicy
+
+
+class AsyncAPIClient:
+    """Asyncio facade over APIClient.
+
+    Every public APIClient method is available here as a coroutine with the same
+    name, arguments and return value, e.g.::
+
+        async with AsyncAPIClient(api_key, max_concurrency=32) as client:
+            frames = await asyncio.gather(*(
+                client.get_eod_historical_stock_market_data(symbol, "d") for symbol in symbols
+            ))
+
+    Requests are executed by the same requests.Session based transport as
+    APIClient (so error handling is identical), on a private thread pool sized
+    to ``max_concurrency``. At most ``max_concurrency`` requests are in flight
+    at any time; further calls wait in the event loop without blocking it.
+    An optional RateLimiter, RetryPolicy and ResponseCache apply to every
+    request, as with APIClient.
+    """
+
+    def __init__(self, api_key: str, timeout: tuple = (5.0, 30.0), max_concurrency: int = 16,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None,
+                 cache: ResponseCache = None, json_decoder="json") -> None:
+        if isinstance(max_concurrency, bool) or not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+
+        self._client = APIClient(
+            api_key, timeout=timeout, rate_limiter=rate_limiter, retry_policy=retry_policy, cache=cache,
+            json_decoder=json_decoder,
+        )
+        self._max_concurrency = max_concurrency
+
+        self._client._ensure_pool_size(max_concurrency)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="eodhd-async")
+        self._semaphore = None
+
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of requests in flight."""
+        return self._max_concurrency
+
+    async def _call(self, name: str, *args, **kwargs):
+        """Run APIClient.<name>(*args, **kwargs) on the worker pool."""
+        # Created lazily so the semaphore binds to the loop that awaits it.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        loop = asyncio.get_running_loop()
+        method = functools.partial(getattr(self._client, name), *args, **kwargs)
+        async with self._semaphore:
+            return await loop.run_in_executor(self._executor, method)
+
+    async def aclose(self):
+        """Shut down the worker pool and close the underlying HTTP session.
+
+        Waits for in-flight requests on a separate thread, so the event loop keeps running."""
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+        self._client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+
+def _make_coroutine(name: str):
+    method = getattr(APIClient, name)
+
+    @functools.wraps(method)
+    async def coroutine(self, *args, **kwargs):
+        return await self._call(name, *args, **kwargs)
+
+    return coroutine
+
+
+# Mirror APIClient method-for-method. Generator methods are skipped: their
+# results are lazy and would block the event loop while being consumed.
+# Streaming iter_* methods return lazy iterators over an open response and are
+# not wrapped; call them on a plain APIClient from a worker thread instead.
+for _name, _member in inspect.getmembers(APIClient, inspect.isfunction):
+    if (_name.startswith("_") or _name.startswith("iter_") or _name == "close"
+            or inspect.isgeneratorfunction(_member)):
+        continue
+    setattr(AsyncAPIClient, _name, _make_coroutine(_name))
+
+del _name, _member
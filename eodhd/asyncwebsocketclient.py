@@ -0,0 +1,151 @@
+"""asyncwebsocketclient.py"""
+
+import asyncio
+import inspect
+import json
+
+import websockets
+from websockets.exceptions import WebSocketException
+
+from eodhd.errors import EODHDConnectionError
+from eodhd.websocketclient import MAX_SYMBOLS, STREAM_URL, validate_subscription, validate_symbols
+
+# Errors after which the connection is re-established.
+_CONNECTION_ERRORS = (WebSocketException, OSError, asyncio.TimeoutError)
+
+
+class AsyncWebSocketClient:
+    """Asyncio client for the real-time WebSocket feeds (us, us-quote, forex, crypto).
+
+    Iterating the client yields every parsed JSON message of the stream::
+
+        async with AsyncWebSocketClient(api_key, "crypto", ["BTC-USD", "ETH-USD"]) as client:
+            async for message in client:
+                print(message["s"], message["p"])
+
+    Everything runs in the event loop, with no threads: ping/pong keepalive is
+    handled by the websockets library (`ping_interval`, `ping_timeout`). When
+    the connection drops, the client reconnects with exponential back-off
+    (`reconnect_base_delay` * 2 ** n) and re-subscribes to the current symbols;
+    after `max_reconnect_attempts` consecutive failures iteration raises
+    EODHDConnectionError. subscribe() / unsubscribe() change the symbols of a
+    live connection. `on_connect(client)` (a function or coroutine function)
+    is called after every successful (re)connection and subscription; the
+    `connections` attribute counts them. Arguments are validated like
+    WebSocketClient's.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        endpoint: str,
+        symbols: list,
+        max_reconnect_attempts: int = 5,
+        reconnect_base_delay: float = 1.0,
+        ping_interval: float = 20.0,
+        ping_timeout: float = 20.0,
+        connect=None,
+        on_connect=None,
+    ) -> None:
+        validate_subscription(api_key, endpoint, symbols)
+
+        self._api_key = api_key
+        self._endpoint = endpoint
+        self._symbols = list(dict.fromkeys(symbols))
+        self._max_reconnect_attempts = max_reconnect_attempts
+        self._reconnect_base_delay = reconnect_base_delay
+        self._ping_interval = ping_interval
+        self._ping_timeout = ping_timeout
+        self._connect = connect or websockets.connect
+        self._on_connect = on_connect
+
+        self._ws = None
+        self._closed = False
+        self.connections = 0
+
+    @property
+    def endpoint(self) -> str:
+        return self._endpoint
+
+    @property
+    def symbols(self) -> list:
+        return list(self._symbols)
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    async def _send(self, action: str, symbols) -> None:
+        if self._ws is not None and symbols:
+            await self._ws.send(json.dumps({"action": action, "symbols": ",".join(symbols)}))
+
+    async def subscribe(self, symbols) -> None:
+        """Add `symbols` to the subscription (on the live connection, if any)."""
+        new = [symbol for symbol in dict.fromkeys(symbols) if symbol not in self._symbols]
+        validate_symbols(new)
+        if len(self._symbols) + len(new) > MAX_SYMBOLS:
+            raise ValueError(f"Max symbol subscription count is {MAX_SYMBOLS}!")
+        self._symbols.extend(new)
+        await self._send("subscribe", new)
+
+    async def unsubscribe(self, symbols) -> None:
+        """Remove `symbols` from the subscription (on the live connection, if any)."""
+        removed = [symbol for symbol in dict.fromkeys(symbols) if symbol in self._symbols]
+        self._symbols = [symbol for symbol in self._symbols if symbol not in removed]
+        await self._send("unsubscribe", removed)
+
+    async def messages(self):
+        """Async generator of parsed messages; reconnects as described in the class docstring.
+
+        Messages that are not valid JSON are skipped."""
+        url = STREAM_URL.format(endpoint=self._endpoint, api_key=self._api_key)
+        attempt = 0
+        while not self._closed:
+            error = None
+            try:
+                async with self._connect(url, ping_interval=self._ping_interval, ping_timeout=self._ping_timeout) as ws:
+                    self._ws = ws
+                    await self._send("subscribe", self._symbols)
+                    self.connections += 1
+                    if self._on_connect is not None:
+                        result = self._on_connect(self)
+                        if inspect.isawaitable(result):
+                            await result
+                    async for raw in ws:
+                        # Only a connection that delivered data counts as recovered.
+                        attempt = 0
+                        try:
+                            message = json.loads(raw)
+                        except ValueError:
+                            continue
+                        yield message
+            except _CONNECTION_ERRORS as err:
+                error = err
+            finally:
+                self._ws = None
+
+            # The connection failed or was closed by the server.
+            if self._closed:
+                break
+            attempt += 1
+            if attempt > self._max_reconnect_attempts:
+                raise EODHDConnectionError(
+                    f"Max reconnect attempts ({self._max_reconnect_attempts}) reached: {error or 'connection closed'}"
+                ) from error
+            await asyncio.sleep(self._reconnect_base_delay * (2 ** (attempt - 1)))
+
+    def __aiter__(self):
+        return self.messages()
+
+    async def close(self) -> None:
+        """Stop iterating and close the connection."""
+        self._closed = True
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            await ws.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
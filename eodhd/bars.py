@@ -0,0 +1,243 @@
+"""bars.py"""
+
+import re
+
+import numpy as np
+
+from eodhd.ticks import ticks_to_numpy
+
+BAR_KINDS = ("time", "tick", "volume", "dollar")
+
+# Bars as returned by BarAggregator.aggregate(): t is the bar start in epoch milliseconds
+# (the interval start for time bars, the first trade otherwise), n the number of trades.
+BAR_DTYPE = np.dtype([
+    ("t", np.int64), ("o", np.float64), ("h", np.float64), ("l", np.float64), ("c", np.float64),
+    ("v", np.float64), ("n", np.int64),
+])
+
+# Open bar of every symbol, one row per symbol; n == 0 means no bar is open.
+# bar is the interval start (time bars) or the bar number (other kinds), total the
+# trades / volume / dollars seen since the start (other kinds).
+_STATE_DTYPE = np.dtype([
+    ("bar", np.int64), ("t", np.int64), ("o", np.float64), ("h", np.float64), ("l", np.float64),
+    ("c", np.float64), ("v", np.float64), ("n", np.int64), ("total", np.float64),
+])
+
+_UNIT_SECONDS = {
+    "s": 1, "sec": 1, "secs": 1, "second": 1, "seconds": 1,
+    "m": 60, "min": 60, "mins": 60, "minute": 60, "minutes": 60,
+    "h": 3600, "hr": 3600, "hour": 3600, "hours": 3600,
+    "d": 86400, "day": 86400, "days": 86400,
+}
+_INTERVAL = re.compile(r"^\s*(\d+)\s*([a-z]+)\s*$")
+
+
+def parse_interval(interval) -> float:
+    """Seconds of a bar interval: a number of seconds, or text such as "1 minute",
+    "5 minutes", "15m", "4h" or "1 day". Raises ValueError for anything else."""
+    if isinstance(interval, str):
+        match = _INTERVAL.match(interval.lower())
+        if match and match.group(2) in _UNIT_SECONDS and int(match.group(1)) > 0:
+            return int(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+    elif isinstance(interval, (int, float)) and not isinstance(interval, bool) and interval >= 0.001:
+        return interval
+    raise ValueError(f"Unsupported interval: {interval}")
+
+
+def parse_trade(message_json):
+    """(symbol, price, size, timestamp_ms) of a stream message, or None if it is not a price update.
+
+    Trades carry the price in "p" and the size in "q" (crypto) or "v" (US);
+    quotes (forex, us-quote) have no trade price and use the bid/ask midpoint
+    with size 0."""
+    if not isinstance(message_json, dict) or "s" not in message_json:
+        return None
+    try:
+        if "p" in message_json:
+            price = float(message_json["p"])
+            size = float(message_json.get("q", message_json.get("v", 0)) or 0)
+        elif "a" in message_json and "b" in message_json:
+            price, size = (float(message_json["a"]) + float(message_json["b"])) / 2.0, 0.0
+        elif "ap" in message_json and "bp" in message_json:
+            price, size = (float(message_json["ap"]) + float(message_json["bp"])) / 2.0, 0.0
+        else:
+            return None
+    except (TypeError, ValueError):
+        return None
+    return message_json["s"], price, size, message_json.get("t")
+
+
+class BarAggregator:
+    """Builds OHLCV bars from trades, for any number of symbols.
+
+    `kind` and `size` choose the bars:
+
+    - "time": one bar per `size` interval (seconds, or text such as
+      "1 minute" or "4h", see parse_interval), aligned to the epoch. A bar is
+      complete when the first trade of a later interval arrives; a late trade
+      of an earlier interval than the latest one seen is ignored (counted in
+      `late`).
+    - "tick": a bar every `size` trades.
+    - "volume": a bar when the traded volume reaches each multiple of `size`.
+    - "dollar": a bar when the traded value (price * size) reaches each multiple of `size`.
+
+    Trades are not split: the trade that crosses a volume or dollar threshold
+    completes the bar, and the surplus counts towards the next threshold.
+
+    update() feeds live trades and returns each completed bar as a dict with
+    the keys of WebSocketClient candles (t, m, g, o, h, l, c, v) plus n, the
+    number of trades; g is the bar size (seconds for time bars). The open bar
+    of every symbol is kept in one NumPy structured array, so the state of
+    thousands of symbols takes a few hundred kilobytes.
+
+    aggregate() builds the same bars from a historical tick array (such as
+    ``get_stock_market_tick_data(..., output="numpy")``) with vectorised NumPy
+    operations, so research and live bars match.
+    """
+
+    def __init__(self, kind: str = "time", size=60) -> None:
+        if kind not in BAR_KINDS:
+            raise ValueError(f"kind must be one of {list(BAR_KINDS)}.")
+        if kind == "time":
+            size = parse_interval(size)
+            self._step = int(round(size * 1000))
+        elif isinstance(size, bool) or not isinstance(size, (int, float)) or size <= 0:
+            raise ValueError("size must be a positive number.")
+        elif kind == "tick" and not isinstance(size, int):
+            raise ValueError("size of tick bars must be an integer.")
+        self.kind = kind
+        self.size = size
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every symbol and open bar."""
+        self.late = 0
+        self._rows = {}
+        self._state = np.zeros(16, dtype=_STATE_DTYPE)
+
+    @property
+    def symbols(self) -> list:
+        return list(self._rows)
+
+    def _row(self, symbol: str) -> int:
+        row = self._rows.get(symbol)
+        if row is None:
+            row = self._rows[symbol] = len(self._rows)
+            if row == len(self._state):
+                grown = np.zeros(2 * len(self._state), dtype=_STATE_DTYPE)
+                grown[:row] = self._state
+                self._state = grown
+        return row
+
+    def _bar(self, symbol: str, state) -> dict:
+        return {
+            "t": int(state["t"]), "m": symbol, "g": self.size, "o": float(state["o"]), "h": float(state["h"]),
+            "l": float(state["l"]), "c": float(state["c"]), "v": float(state["v"]), "n": int(state["n"]),
+        }
+
+    def update(self, symbol: str, price: float, size: float = 0.0, timestamp: int = None):
+        """Add a trade (timestamp in epoch milliseconds); return the bar it completes, or None.
+
+        Time bars need the timestamp: trades without one are ignored."""
+        row = self._row(symbol)
+        state = self._state[row]
+        closed = None
+
+        if self.kind == "time":
+            if timestamp is None:
+                return None
+            bar = timestamp // self._step * self._step
+            if bar < state["bar"]:
+                self.late += 1
+                return None
+            if state["n"] and bar > state["bar"]:
+                closed = self._bar(symbol, state)
+                state["n"] = 0
+        else:
+            bar = np.floor(state["total"] / self.size)
+
+        if not state["n"]:
+            state["bar"] = bar
+            state["t"] = bar if self.kind == "time" else (timestamp or 0)
+            state["o"] = state["h"] = state["l"] = price
+            state["v"] = 0.0
+        state["c"] = price
+        if price > state["h"]:
+            state["h"] = price
+        elif price < state["l"]:
+            state["l"] = price
+        state["v"] += size
+        state["n"] += 1
+
+        if self.kind != "time":
+            state["total"] += self._measure(price, size)
+            if np.floor(state["total"] / self.size) > state["bar"]:
+                closed = self._bar(symbol, state)
+                state["n"] = 0
+        return closed
+
+    def _measure(self, price, size):
+        if self.kind == "tick":
+            return 1.0
+        if self.kind == "volume":
+            return size
+        return price * size
+
+    def update_message(self, message_json):
+        """update() with a parsed stream message; messages without a price are ignored."""
+        trade = parse_trade(message_json)
+        if trade is None:
+            return None
+        return self.update(*trade)
+
+    def current(self, symbol: str):
+        """The open bar of `symbol` as a dict, or None."""
+        row = self._rows.get(symbol)
+        if row is None or not self._state[row]["n"]:
+            return None
+        return self._bar(symbol, self._state[row])
+
+    def flush(self) -> list:
+        """Close and return the open bar of every symbol (e.g. at the end of a session)."""
+        bars = [self.current(symbol) for symbol in self._rows]
+        self._state["n"] = 0
+        return [bar for bar in bars if bar is not None]
+
+    def aggregate(self, ticks) -> np.ndarray:
+        """Bars of one symbol's historical ticks as a structured array of BAR_DTYPE.
+
+        `ticks` is a tick array from eodhd.ticks.ticks_to_numpy (ts in ns,
+        price, shares) or a raw /ticks payload. The last bar is included even
+        if it is not complete yet. As in update(), time bars skip trades older
+        than the latest interval seen. This does not touch the live state."""
+        if not isinstance(ticks, np.ndarray):
+            ticks = ticks_to_numpy(ticks, ts_unit="ms")
+        if len(ticks) == 0:
+            return np.empty(0, dtype=BAR_DTYPE)
+        timestamps = ticks["ts"] // 1_000_000
+        prices = ticks["price"].astype(np.float64)
+        sizes = ticks["shares"].astype(np.float64) if "shares" in ticks.dtype.names else np.zeros(len(ticks))
+
+        if self.kind == "time":
+            keys = timestamps // self._step * self._step
+            if np.any(keys[1:] < keys[:-1]):
+                on_time = keys >= np.maximum.accumulate(keys)
+                keys, timestamps, prices, sizes = keys[on_time], timestamps[on_time], prices[on_time], sizes[on_time]
+        else:
+            measures = np.ones(len(ticks)) if self.kind == "tick" else sizes if self.kind == "volume" else prices * sizes
+            # Same running total as update(): a bar is the trades that arrive while
+            # floor(total / size) is unchanged.
+            before = np.concatenate(([0.0], np.cumsum(measures)[:-1]))
+            keys = np.floor(before / self.size)
+
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        ends = np.append(starts[1:], len(keys))
+        bars = np.empty(len(starts), dtype=BAR_DTYPE)
+        bars["t"] = keys[starts] if self.kind == "time" else timestamps[starts]
+        bars["o"] = prices[starts]
+        bars["h"] = np.maximum.reduceat(prices, starts)
+        bars["l"] = np.minimum.reduceat(prices, starts)
+        bars["c"] = prices[ends - 1]
+        bars["v"] = np.add.reduceat(sizes, starts)
+        bars["n"] = ends - starts
+        return bars
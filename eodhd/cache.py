@@ -0,0 +1,248 @@
+"""cache.py"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from urllib.parse import parse_qsl, urlencode
+
+
+# Seconds a response stays fresh, by endpoint. 0 disables caching for the
+# endpoint and None keeps the response until it is evicted. A key also matches
+# its sub-paths. Endpoints not listed use ResponseCache.default_ttl.
+DEFAULT_TTLS = {
+    "exchanges-list": 86400,
+    "exchange-symbol-list": 86400,
+    "v2/exchange-details": 86400,
+    "exchange-details": 86400,
+    "fundamentals": 86400,
+    "v1.1/fundamentals": 86400,
+    "bulk-fundamentals": 86400,
+    "v1.1/bulk-fundamentals": 86400,
+    "eod": 3600,
+    "intraday": 300,
+    "ticks": 300,
+    "real-time": 0,
+    "us-quote-delayed": 0,
+    "user": 0,
+}
+
+# Endpoints whose response for a `to` date strictly in the past never changes.
+_CLOSED_RANGE_ENDPOINTS = ("eod", "intraday", "ticks")
+
+
+class ResponseCache:
+    """Persistent SQLite cache of raw API response bodies.
+
+    Entries are keyed by (endpoint, uri, normalised query string); the api_token
+    is never part of the key or stored. Freshness is decided per endpoint
+    (see DEFAULT_TTLS, overridable with `ttls`); EOD, intraday and tick requests
+    whose `to` bound lies before today are historical and kept indefinitely.
+
+    The store is bounded by `max_bytes` of response data; when it grows past
+    that, least recently used entries are evicted. One instance may be shared
+    by many threads and clients.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024, default_ttl: float = 3600,
+                 ttls: dict = None) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0.")
+
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self._ttls.update(ttls)
+
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, endpoint TEXT, body BLOB, size INTEGER,"
+                " expires REAL, accessed REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    @staticmethod
+    def normalize_query(querystring: str) -> str:
+        """Sort query params and drop api_token so equivalent requests share a key."""
+        params = [(k, v) for k, v in parse_qsl(querystring.lstrip("&"), keep_blank_values=True) if k != "api_token"]
+        return urlencode(sorted(params))
+
+    @classmethod
+    def make_key(cls, endpoint: str, uri: str = "", querystring: str = "") -> str:
+        return f"{endpoint.strip('/')}|{uri.strip('/')}|{cls.normalize_query(querystring)}"
+
+    def _lookup_ttl(self, endpoint: str):
+        path = endpoint.strip("/")
+        while path:
+            if path in self._ttls:
+                return self._ttls[path]
+            path = path.rpartition("/")[0]
+        return self.default_ttl
+
+    def ttl(self, endpoint: str, uri: str = "", querystring: str = ""):
+        """Freshness lifetime in seconds for a request (0 = not cached, None = forever)."""
+        base = endpoint.strip("/")
+        ttl = self._lookup_ttl(base)
+        if ttl != 0 and base in _CLOSED_RANGE_ENDPOINTS:
+            to_value = dict(parse_qsl(querystring.lstrip("&"))).get("to")
+            if to_value and self._is_past(to_value):
+                return None
+        return ttl
+
+    @staticmethod
+    def _is_past(value: str) -> bool:
+        """True if a `to` bound (YYYY-MM-DD or UNIX seconds) falls before today (UTC)."""
+        today = datetime.now(timezone.utc).date()
+        try:
+            if value.isdigit():
+                return datetime.fromtimestamp(int(value), tz=timezone.utc).date() < today
+            return date.fromisoformat(value[:10]) < today
+        except (ValueError, OverflowError, OSError):
+            return False
+
+    def get(self, endpoint: str, uri: str = "", querystring: str = ""):
+        """Return the cached body for a request, or None on a miss or expired entry."""
+        if self.ttl(endpoint, uri, querystring) == 0:
+            return None
+
+        key = self.make_key(endpoint, uri, querystring)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT body, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                if row is not None:
+                    with self._conn:
+                        self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._stats["misses"] += 1
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._stats["hits"] += 1
+            return bytes(row[0])
+
+    def put(self, endpoint: str, uri: str, querystring: str, body: bytes) -> None:
+        """Store a response body, then evict least recently used entries over max_bytes."""
+        ttl = self.ttl(endpoint, uri, querystring)
+        if ttl == 0 or not isinstance(body, (bytes, bytearray)) or len(body) > self.max_bytes:
+            return
+
+        key = self.make_key(endpoint, uri, querystring)
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, endpoint, body, size, expires, accessed)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, endpoint.strip("/"), bytes(body), len(body), expires, now),
+                )
+            self._stats["stores"] += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        with self._conn:
+            for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed ASC").fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                total -= size
+                self._stats["evictions"] += 1
+
+    def invalidate(self, endpoint: str = None) -> None:
+        """Drop all entries, or only those for `endpoint` (and its sub-paths)."""
+        with self._lock, self._conn:
+            if endpoint is None:
+                self._conn.execute("DELETE FROM responses")
+            else:
+                base = endpoint.strip("/")
+                self._conn.execute("DELETE FROM responses WHERE endpoint = ? OR endpoint LIKE ?", (base, base + "/%"))
+
+    def stats(self) -> dict:
+        """Hit/miss/store/eviction counters plus current entry count and size in bytes."""
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            return dict(self._stats, entries=entries, bytes=size)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache with a time-to-live, for small hot values.
+
+    Holds at most `maxsize` entries; each expires `ttl` seconds after it was
+    stored. Hit/miss counts are available from stats()."""
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 128, ttl: float = 3600) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1.")
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key, default=None):
+        """Return the live value for `key`, or `default`."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return default
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get_or_load(self, key, loader):
+        """Return the cached value for `key`, calling `loader()` and storing its result on a miss.
+
+        The loader runs outside the lock, so concurrent misses on one key may
+        each call it; the last result wins."""
+        value = self.get(key, self._MISSING)
+        if value is self._MISSING:
+            value = loader()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, predicate=None) -> None:
+        """Drop every entry, or only those whose key satisfies `predicate(key)`."""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if predicate(k)]:
+                    del self._entries[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
@@ -0,0 +1,129 @@
+"""decoders.py"""
+
+import json
+
+import numpy as np
+
+
+class JSONDecoder:
+    """Turns a response body (bytes) into Python objects.
+
+    Subclasses wrap one JSON library; every decoder raises ValueError on
+    malformed input so callers handle all backends the same way."""
+
+    name = "json"
+
+    def loads(self, body):
+        return json.loads(body)
+
+
+class OrjsonDecoder(JSONDecoder):
+    """orjson backend (https://github.com/ijl/orjson)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads = orjson.loads
+
+    def loads(self, body):
+        # orjson.JSONDecodeError subclasses ValueError
+        return self._loads(body)
+
+
+class MsgspecDecoder(JSONDecoder):
+    """msgspec backend (https://jcristharif.com/msgspec/)."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+        self._error = msgspec.DecodeError
+
+    def loads(self, body):
+        try:
+            return self._decoder.decode(body)
+        except self._error as err:
+            raise ValueError(str(err)) from err
+
+
+_BACKENDS = {
+    "orjson": OrjsonDecoder,
+    "msgspec": MsgspecDecoder,
+    "json": JSONDecoder,
+}
+
+# Order in which "auto" tries the backends.
+_PREFERENCE = ("orjson", "msgspec", "json")
+
+
+def available_backends() -> list:
+    """Names of the JSON backends importable in this environment, fastest first."""
+    names = []
+    for name in _PREFERENCE:
+        try:
+            _BACKENDS[name]()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_decoder(backend="auto") -> JSONDecoder:
+    """Return a decoder for `backend`: "auto" (fastest installed), "orjson",
+    "msgspec", "json" (stdlib), or a ready JSONDecoder instance.
+
+    An explicitly named backend that is not installed raises ImportError."""
+    if isinstance(backend, JSONDecoder):
+        return backend
+    if backend == "auto":
+        return _BACKENDS[available_backends()[0]]()
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {backend}. Use one of {['auto', *_PREFERENCE]}.")
+    try:
+        return _BACKENDS[backend]()
+    except ImportError as err:
+        raise ImportError(f"JSON backend '{backend}' is not installed: pip install {backend}") from err
+
+
+def _to_array(values: list, dtype=None) -> np.ndarray:
+    if dtype is not None:
+        return np.asarray(values, dtype=dtype)
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    kinds = {type(value) for value in values if value is not None}
+    if kinds == {bool} and None not in values:
+        return array.astype(bool)
+    if kinds and kinds <= {int, float}:
+        try:
+            if kinds == {int} and not any(value is None for value in values):
+                return array.astype(np.int64)
+            return array.astype(np.float64)
+        except OverflowError:
+            # Integers wider than 64 bits stay exact Python ints.
+            return array
+    return array
+
+
+def to_columns(records: list, dtypes: dict = None) -> dict:
+    """Transpose a list of JSON records into {field: numpy array}.
+
+    Fields are ordered by first appearance; a record missing a field yields None
+    (NaN in numeric columns). Integer fields become int64 (float64 when any
+    value is missing), mixed int/float fields float64 and everything else
+    (including integers beyond 64 bits) an object array; all-boolean fields become bool. `dtypes` forces the dtype of
+    selected fields."""
+    if not isinstance(records, list) or any(not isinstance(record, dict) for record in records):
+        raise ValueError("Expected a list of JSON objects.")
+
+    dtypes = dtypes or {}
+    fields = list(dict.fromkeys(field for record in records for field in record))
+    return {
+        field: _to_array([record.get(field) for record in records], dtypes.get(field))
+        for field in fields
+    }
+
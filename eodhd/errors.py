@@ -21,3 +21,7 @@ class EODHDConnectionError(EODHDError):
 
 class EODHDTimeoutError(EODHDError):
     """Raised when an API request times out."""
+
+
+class EODHDRateLimitError(EODHDError):
+    """Raised when the client-side daily API call budget is exhausted."""
@@ -0,0 +1,112 @@
+"""eventqueue.py"""
+
+import queue
+import threading
+import time
+from collections import deque, namedtuple
+
+# kind is "tick", "candle" or "error"; interval is the candle interval (None otherwise);
+# data is the parsed message, the closed candle or the exception.
+StreamEvent = namedtuple("StreamEvent", ["kind", "symbol", "interval", "data"])
+
+QUEUE_POLICIES = ("drop-oldest", "block", "coalesce")
+
+
+class EventQueue:
+    """Bounded thread-safe queue between a stream's receive thread and its consumers.
+
+    What happens when the queue is full depends on `policy`:
+
+    - "drop-oldest": the oldest event is discarded (counted in `dropped`), so
+      the producer never waits.
+    - "block": put() waits until a consumer makes room (or the queue is closed),
+      which slows the producer down to the consumer's pace.
+    - "coalesce": an event replaces the pending one with the same key (for
+      stream events: kind, symbol and interval) in its place in the queue, so
+      consumers see the latest state of every key. When the queue is full and
+      holds no event with the key, the oldest event is dropped.
+
+    get() raises queue.Empty on timeout, like queue.Queue."""
+
+    def __init__(self, maxsize: int = 10000, policy: str = "drop-oldest") -> None:
+        if isinstance(maxsize, bool) or not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"policy must be one of {list(QUEUE_POLICIES)}.")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+        self._items = deque()
+        # coalesce: key -> the [key, item] entry in the deque, so a newer item can replace it in place.
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item, key=None) -> bool:
+        """Add `item`; return False if it was not queued (the queue is closed)."""
+        with self._lock:
+            if self.closed:
+                return False
+            if self.policy == "coalesce":
+                if key is None:
+                    # Stream events coalesce by kind, symbol and interval; other items never.
+                    key = (item.kind, item.symbol, item.interval) if isinstance(item, StreamEvent) else object()
+                entry = self._pending.get(key)
+                if entry is not None:
+                    entry[1] = item
+                    return True
+                entry = [key, item]
+                self._pending[key] = entry
+            else:
+                entry = item
+
+            if len(self._items) >= self.maxsize:
+                if self.policy == "block":
+                    while len(self._items) >= self.maxsize and not self.closed:
+                        self._not_full.wait()
+                    if self.closed:
+                        return False
+                else:
+                    self._discard_oldest()
+            self._items.append(entry)
+            self._not_empty.notify()
+            return True
+
+    def _discard_oldest(self) -> None:
+        oldest = self._items.popleft()
+        if self.policy == "coalesce":
+            del self._pending[oldest[0]]
+        self.dropped += 1
+
+    def get(self, block: bool = True, timeout: float = None):
+        with self._lock:
+            if block:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while not self._items and not self.closed:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self._not_empty.wait(remaining)
+            if not self._items:
+                raise queue.Empty
+            entry = self._items.popleft()
+            if self.policy == "coalesce":
+                del self._pending[entry[0]]
+                entry = entry[1]
+            self._not_full.notify()
+            return entry
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def close(self) -> None:
+        """Stop accepting events and wake up every waiting thread; queued events can still be read."""
+        with self._lock:
+            self.closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
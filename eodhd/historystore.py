@@ -0,0 +1,170 @@
+"""historystore.py"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from eodhd.sinks import parquet_available
+
+
+class HistoryStore:
+    """Local store of EOD price history that only downloads what is missing.
+
+    One file per symbol and period is kept under ``directory/<period>/``
+    (Parquet when pyarrow or fastparquet is installed, CSV otherwise). sync()
+    requests only the range from the last stored date to today and merges it
+    in. The last stored bar is always re-downloaded, since it may have been a
+    partial day/week/month.
+
+    Dividends and splits re-scale adjusted_close for all earlier dates. sync()
+    detects this by comparing adjusted_close / close on the overlapping bar;
+    when the ratio has changed, the symbol's whole history is downloaded again.
+
+    Usage::
+
+        store = HistoryStore(APIClient(api_key), "data/eod")
+        df = store.sync("AAPL.US")
+        results = store.sync_many(symbols, max_workers=16)
+    """
+
+    COLUMNS = ["open", "high", "low", "close", "adjusted_close", "volume"]
+    PERIODS = ("d", "w", "m")
+
+    def __init__(self, client, directory: str, file_format: str = None) -> None:
+        if file_format is None:
+            file_format = "parquet" if parquet_available() else "csv"
+        if file_format not in ("parquet", "csv"):
+            raise ValueError("file_format must be 'parquet' or 'csv'.")
+
+        self._client = client
+        self._directory = directory
+        self._format = file_format
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    @property
+    def file_format(self) -> str:
+        return self._format
+
+    def path(self, symbol: str, period: str = "d") -> str:
+        """File holding the stored history of `symbol` at `period`."""
+        if period not in self.PERIODS:
+            raise ValueError("period must be in ['d', 'w', 'm'] values")
+        if symbol is None or str(symbol).strip() == "":
+            raise ValueError("Ticker is empty. You need to add ticker to args")
+        name = str(symbol).strip().replace("/", "_").replace(os.sep, "_")
+        return os.path.join(self._directory, period, f"{name}.{self._format}")
+
+    def _lock(self, path: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def load(self, symbol: str, period: str = "d") -> pd.DataFrame:
+        """Stored history indexed by date (an empty frame if nothing is stored yet)."""
+        path = self.path(symbol, period)
+        if not os.path.exists(path):
+            return self._empty()
+        if self._format == "parquet":
+            return pd.read_parquet(path)
+        return pd.read_csv(path, index_col="date", parse_dates=["date"])
+
+    def _save(self, path: str, df_data: pd.DataFrame) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        if self._format == "parquet":
+            df_data.to_parquet(tmp_path)
+        else:
+            df_data.to_csv(tmp_path)
+        os.replace(tmp_path, path)
+
+    def _empty(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {column: pd.Series(dtype="float64") for column in self.COLUMNS},
+            index=pd.DatetimeIndex([], name="date"),
+        )
+
+    def _fetch(self, symbol: str, period: str, from_date=None) -> pd.DataFrame:
+        records = self._client.get_eod_historical_stock_market_data(
+            symbol, period=period, from_date=from_date, to_date=datetime.today().strftime("%Y-%m-%d")
+        )
+        if not isinstance(records, list) or len(records) == 0:
+            return self._empty()
+
+        df_data = pd.DataFrame.from_records(records)
+        if "date" not in df_data.columns:
+            return self._empty()
+
+        df_data = df_data.dropna(subset=["date"])
+        df_data.index = pd.DatetimeIndex(pd.to_datetime(df_data["date"], format="%Y-%m-%d"), name="date")
+        df_data = df_data.reindex(columns=self.COLUMNS)
+        return df_data.apply(pd.to_numeric, errors="coerce").astype("float64").sort_index()
+
+    @staticmethod
+    def _adjustment_changed(stored_row: pd.Series, fetched_row: pd.Series) -> bool:
+        """True when the adjusted/unadjusted ratio of the same bar differs (new split or dividend)."""
+        old_ratio = stored_row["adjusted_close"] / stored_row["close"] if stored_row["close"] else np.nan
+        new_ratio = fetched_row["adjusted_close"] / fetched_row["close"] if fetched_row["close"] else np.nan
+        if np.isnan(old_ratio) and np.isnan(new_ratio):
+            return False
+        return not np.isclose(old_ratio, new_ratio, rtol=1e-6, atol=0.0)
+
+    def sync(self, symbol: str, period: str = "d", from_date: str = None) -> pd.DataFrame:
+        """Bring the stored history of `symbol` up to date and return all of it.
+
+        `from_date` (YYYY-MM-DD) only applies to the first download or to a full
+        re-download after an adjustment change; otherwise the start of the
+        stored history is kept."""
+        path = self.path(symbol, period)
+        with self._lock(path):
+            stored = self.load(symbol, period)
+
+            if stored.empty:
+                merged = self._fetch(symbol, period, from_date)
+            else:
+                last = stored.index[-1]
+                fetched = self._fetch(symbol, period, last.strftime("%Y-%m-%d"))
+                if fetched.empty:
+                    return stored
+
+                if last in fetched.index and self._adjustment_changed(stored.loc[last], fetched.loc[last]):
+                    start = from_date or stored.index[0].strftime("%Y-%m-%d")
+                    merged = self._fetch(symbol, period, start)
+                else:
+                    merged = pd.concat([stored[stored.index < fetched.index[0]], fetched])
+
+            if not merged.empty:
+                self._save(path, merged)
+            return merged
+
+    def sync_many(self, symbols, period: str = "d", from_date: str = None, max_workers: int = 8) -> dict:
+        """sync() many symbols over a thread pool.
+
+        Returns {symbol: DataFrame}; a symbol that failed maps to the exception
+        it raised instead (EODHDError, ValueError, an OSError writing its file,
+        or any other error), without aborting the others."""
+        if isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+
+        workers = min(max_workers, len(symbols))
+        ensure_pool_size = getattr(self._client, "_ensure_pool_size", None)
+        if ensure_pool_size is not None:
+            ensure_pool_size(workers)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eodhd-store") as executor:
+            futures = {executor.submit(self.sync, symbol, period, from_date): symbol for symbol in symbols}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as err:
+                    results[futures[future]] = err
+
+        return {symbol: results[symbol] for symbol in symbols}
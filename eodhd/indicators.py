@@ -0,0 +1,239 @@
+"""indicators.py"""
+
+import inspect
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Registered indicators: name -> function(engine, **params) returning a
+# (symbols x time) float64 array aligned with engine.field() arrays.
+_REGISTRY = {}
+
+
+def register_indicator(name: str):
+    """Decorator registering `function(engine, **params)` as indicator `name`.
+
+    The function returns a 2-D float array (symbols x time). It may use other
+    indicators through engine.compute(), which are then computed only once per
+    engine however many indicators and screens share them."""
+    def decorator(function):
+        _REGISTRY[name] = function
+        return function
+    return decorator
+
+
+def available_indicators() -> list:
+    return sorted(_REGISTRY)
+
+
+# Kernels. All take and return float64 arrays of shape (symbols, time) and work
+# along the last axis. A window touching a NaN (e.g. the left padding of a
+# symbol with a shorter history) yields NaN.
+
+def shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    out = np.full(values.shape, np.nan)
+    if periods < values.shape[-1]:
+        out[..., periods:] = values[..., :values.shape[-1] - periods]
+    return out
+
+
+def _rolling(values: np.ndarray, window: int, reduce) -> np.ndarray:
+    if isinstance(window, bool) or not isinstance(window, int) or window < 1:
+        raise ValueError("window must be a positive integer.")
+    out = np.full(values.shape, np.nan)
+    if window <= values.shape[-1]:
+        out[..., window - 1:] = reduce(sliding_window_view(values, window, axis=-1))
+    return out
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    return _rolling(values, window, lambda windows: windows.sum(axis=-1))
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    return _rolling(values, window, lambda windows: windows.mean(axis=-1))
+
+
+def rolling_std(values: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    return _rolling(values, window, lambda windows: windows.std(axis=-1, ddof=ddof))
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    return _rolling(values, window, lambda windows: windows.max(axis=-1))
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    return _rolling(values, window, lambda windows: windows.min(axis=-1))
+
+
+def ewm_mean(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponentially weighted mean, as pandas ewm(alpha=alpha, adjust=False).mean().
+
+    Each row starts at its first valid value; NaNs keep the previous mean. The
+    recursion runs over time once, vectorized across all symbols."""
+    out = np.empty(values.shape)
+    mean = np.full(values.shape[:-1], np.nan)
+    for t in range(values.shape[-1]):
+        current = values[..., t]
+        updated = np.where(np.isnan(mean), current, mean + alpha * (current - mean))
+        mean = np.where(np.isnan(current), mean, updated)
+        out[..., t] = mean
+    return out
+
+
+class IndicatorEngine:
+    """Computes registered indicators for many symbols at once.
+
+    `frames` maps symbols to OHLCV DataFrames (as returned by
+    APIClient.get_historical_data). Each price field is stacked into one
+    (symbols x time) float64 array when first used; shorter histories are
+    right-aligned, so the last column holds every symbol's latest bar, and
+    padded with NaN on the left. Indicator results are cached by name and
+    parameters: an indicator needed by several screens, or used as an input of
+    another indicator (e.g. the EMAs behind MACD), is computed once::
+
+        engine = IndicatorEngine(histories)
+        results = engine.run([Screen("trend", {"sma50": ("sma", {"period": 50})}, lookback=50)])
+    """
+
+    def __init__(self, frames: dict) -> None:
+        self._frames = {symbol: frame for symbol, frame in frames.items() if isinstance(frame, pd.DataFrame)}
+        self.symbols = list(self._frames)
+        self.lengths = np.array([len(frame) for frame in self._frames.values()], dtype=np.int64)
+        self.width = int(self.lengths.max()) if len(self.lengths) else 0
+        self._fields = {}
+        self._results = {}
+
+    def field(self, name: str) -> np.ndarray:
+        """The stacked (symbols x time) array of column `name`."""
+        if name not in self._fields:
+            stacked = np.full((len(self.symbols), self.width), np.nan)
+            for row, frame in enumerate(self._frames.values()):
+                if name not in frame.columns:
+                    raise ValueError(f"Column {name} is missing for {self.symbols[row]}.")
+                if len(frame):
+                    stacked[row, self.width - len(frame):] = frame[name].to_numpy(dtype=np.float64)
+            self._fields[name] = stacked
+        return self._fields[name]
+
+    def compute(self, indicator: str, /, **params) -> np.ndarray:
+        """The (symbols x time) values of `indicator` with `params`, computed at most once."""
+        if indicator not in _REGISTRY:
+            raise ValueError(f"Unknown indicator: {indicator}. Available: {available_indicators()}")
+        function = _REGISTRY[indicator]
+        # Key on the full parameter set, so sma(period=50) and sma(period=50, field="close") share a result.
+        try:
+            bound = inspect.signature(function).bind(self, **params)
+        except TypeError as err:
+            raise ValueError(f"Invalid parameters for {indicator}: {err}") from err
+        bound.apply_defaults()
+        key = (indicator, tuple(sorted(list(bound.arguments.items())[1:])))
+        if key not in self._results:
+            self._results[key] = function(self, **params)
+        return self._results[key]
+
+    def last(self, indicator: str, /, **params) -> np.ndarray:
+        """Value of `indicator` at each symbol's latest bar."""
+        values = self.compute(indicator, **params)
+        return values[:, -1] if values.shape[-1] else np.full(len(self.symbols), np.nan)
+
+    def run(self, screens) -> dict:
+        """Evaluate `screens`; return {screen name: DataFrame of latest values per symbol}.
+
+        All indicators of all screens are computed before any screen is
+        evaluated, each distinct (indicator, params) once."""
+        for screen in screens:
+            for name, params in screen.indicators.values():
+                self.compute(name, **params)
+        return {screen.name: screen.evaluate(self) for screen in screens}
+
+
+class Screen:
+    """A scan over the latest bar of many symbols.
+
+    `indicators` maps output columns to (indicator name, params) pairs, e.g.
+    ``{"sma50": ("sma", {"period": 50}), "volume": ("field", {"column": "volume"})}``.
+    Symbols with fewer than `lookback` bars are left out. `condition`, if
+    given, receives the DataFrame of latest values (one row per symbol) and
+    returns a boolean mask of the rows to keep."""
+
+    def __init__(self, name: str, indicators: dict, lookback: int = 1, condition=None) -> None:
+        for column, spec in indicators.items():
+            if not (isinstance(spec, tuple) and len(spec) == 2 and isinstance(spec[1], dict)):
+                raise ValueError(f"Indicator {column} must be an (indicator name, params) pair.")
+        self.name = name
+        self.indicators = dict(indicators)
+        self.lookback = lookback
+        self.condition = condition
+
+    def evaluate(self, engine: IndicatorEngine) -> pd.DataFrame:
+        data = {column: engine.last(name, **params) for column, (name, params) in self.indicators.items()}
+        df_data = pd.DataFrame(data, index=pd.Index(engine.symbols, name="symbol"), columns=list(self.indicators))
+        df_data = df_data[engine.lengths >= self.lookback]
+        if self.condition is not None:
+            df_data = df_data[np.asarray(self.condition(df_data), dtype=bool)]
+        return df_data
+
+
+@register_indicator("field")
+def _field(engine, column: str = "close"):
+    return engine.field(column)
+
+
+@register_indicator("sma")
+def _sma(engine, period: int = 50, field: str = "close"):
+    return rolling_mean(engine.field(field), period)
+
+
+@register_indicator("ema")
+def _ema(engine, period: int = 50, field: str = "close"):
+    return ewm_mean(engine.field(field), 2.0 / (period + 1))
+
+
+@register_indicator("stddev")
+def _stddev(engine, period: int = 50, field: str = "close"):
+    return rolling_std(engine.field(field), period)
+
+
+@register_indicator("true_range")
+def _true_range(engine, close: str = "close"):
+    high, low = engine.field("high"), engine.field("low")
+    prev_close = shift(engine.field(close))
+    # fmax skips the missing previous close of the first bar.
+    return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+@register_indicator("atr")
+def _atr(engine, period: int = 14, close: str = "close"):
+    """Simple moving average of the true range over `period` bars."""
+    return rolling_mean(engine.compute("true_range", close=close), period)
+
+
+@register_indicator("rsi")
+def _rsi(engine, period: int = 14, field: str = "close"):
+    """Wilder's RSI (gains and losses smoothed with alpha = 1 / period)."""
+    change = np.diff(engine.field(field), axis=-1, prepend=np.nan)
+    gain = ewm_mean(np.where(change > 0, change, np.where(np.isnan(change), np.nan, 0.0)), 1.0 / period)
+    loss = ewm_mean(np.where(change < 0, -change, np.where(np.isnan(change), np.nan, 0.0)), 1.0 / period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(loss == 0, 100.0, 100.0 - 100.0 / (1.0 + gain / loss))
+
+
+@register_indicator("macd")
+def _macd(engine, fast_period: int = 12, slow_period: int = 26, field: str = "close"):
+    return engine.compute("ema", period=fast_period, field=field) - engine.compute("ema", period=slow_period, field=field)
+
+
+@register_indicator("macd_signal")
+def _macd_signal(engine, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9, field: str = "close"):
+    macd = engine.compute("macd", fast_period=fast_period, slow_period=slow_period, field=field)
+    return ewm_mean(macd, 2.0 / (signal_period + 1))
+
+
+@register_indicator("macd_hist")
+def _macd_hist(engine, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9, field: str = "close"):
+    macd = engine.compute("macd", fast_period=fast_period, slow_period=slow_period, field=field)
+    signal = engine.compute("macd_signal", fast_period=fast_period, slow_period=slow_period,
+                            signal_period=signal_period, field=field)
+    return macd - signal
@@ -0,0 +1,153 @@
+"""pagination.py"""
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+
+def _page_data(envelope):
+    data = envelope.get("data") if isinstance(envelope, dict) else None
+    return data if isinstance(data, (list, dict)) else []
+
+
+def _meta_total(envelope):
+    meta = envelope.get("meta") if isinstance(envelope, dict) else None
+    if isinstance(meta, dict):
+        total = meta.get("total")
+        if isinstance(total, int) and not isinstance(total, bool):
+            return total
+    return None
+
+
+def _next_offset(envelope, offset: int, count: int):
+    """Offset of the page after `envelope` (fetched at `offset`, holding `count` items), or None.
+
+    Follows links.next, taking page[offset] from its query string (the URL
+    itself is not requested, since it embeds the API token). Falls back to
+    offset + count when links.next carries no offset, and stops on an empty
+    page or once meta.total items have been seen."""
+    links = envelope.get("links") if isinstance(envelope, dict) else None
+    next_url = links.get("next") if isinstance(links, dict) else None
+    if not next_url or count == 0:
+        return None
+
+    total = _meta_total(envelope)
+    if total is not None and offset + count >= total:
+        return None
+
+    values = parse_qs(urlparse(str(next_url)).query).get("page[offset]")
+    try:
+        next_offset = int(values[0]) if values else offset + count
+    except ValueError:
+        next_offset = offset + count
+    return next_offset if next_offset > offset else None
+
+
+def iter_pages(fetch_page, page_offset: int = 0, page_limit: int = None, prefetch: bool = False,
+               max_offset: int = None):
+    """Yield every page envelope ({data, meta, links}) of a paginated endpoint.
+
+    `fetch_page(page_offset, page_limit)` performs one request. Pages are
+    requested until links.next is empty, meta.total is reached, a page comes
+    back empty, or the next offset would exceed `max_offset` (the endpoint's
+    largest accepted page[offset]).
+
+    With prefetch=True the next page is requested on a background thread as
+    soon as the current one arrives, so the network round trip overlaps with
+    the caller's processing of the current page. At most one request is ahead
+    of the consumer; closing the generator early discards it."""
+    offset = page_offset or 0
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eodhd-page") if prefetch else None
+    pending = None
+    try:
+        envelope = fetch_page(offset, page_limit)
+        while True:
+            next_offset = _next_offset(envelope, offset, len(_page_data(envelope)))
+            if next_offset is not None and max_offset is not None and next_offset > max_offset:
+                next_offset = None
+
+            if executor is not None and next_offset is not None:
+                pending = executor.submit(fetch_page, next_offset, page_limit)
+
+            yield envelope
+
+            if next_offset is None:
+                return
+            if pending is not None:
+                envelope, pending = pending.result(), None
+            else:
+                envelope = fetch_page(next_offset, page_limit)
+            offset = next_offset
+    finally:
+        if executor is not None:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_records(pages):
+    """Flatten page envelopes into their `data` items.
+
+    List payloads yield each item; payloads keyed by id (e.g. us-quote-delayed,
+    keyed by symbol) yield (key, item) pairs."""
+    for envelope in pages:
+        data = _page_data(envelope)
+        if isinstance(data, dict):
+            yield from data.items()
+        else:
+            yield from data
+
+
+def merge_pages(pages: list) -> dict:
+    """Combine page envelopes into one envelope holding all of their data.
+
+    meta is taken from the first page with `count` set to the number of items;
+    links.next is cleared."""
+    if not pages:
+        return {"data": [], "meta": {"count": 0}, "links": {"next": None}}
+
+    if isinstance(_page_data(pages[0]), dict):
+        data = {}
+        for envelope in pages:
+            data.update(_page_data(envelope))
+    else:
+        data = [item for envelope in pages for item in _page_data(envelope)]
+
+    first = pages[0]
+    meta = dict(first.get("meta") or {}) if isinstance(first, dict) else {}
+    meta["count"] = len(data)
+    return {"data": data, "meta": meta, "links": {"next": None}}
+
+
+def fetch_all_pages(fetch_page, page_offset: int = 0, page_limit: int = None, max_workers: int = 8,
+                    max_offset: int = None) -> list:
+    """Fetch every page of a paginated endpoint, concurrently when possible; return them in order.
+
+    The first page is fetched alone. If it reports meta.total, the offsets of
+    all remaining pages are known and they are fetched on up to `max_workers`
+    threads (each call of `fetch_page` is throttled by the client's rate
+    limiter as usual). Otherwise pages are followed one by one as in
+    iter_pages. Offsets beyond `max_offset` are not requested."""
+    if isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError("max_workers must be a positive integer.")
+
+    offset = page_offset or 0
+    first = fetch_page(offset, page_limit)
+    count = len(_page_data(first))
+    next_offset = _next_offset(first, offset, count)
+    if next_offset is None or (max_offset is not None and next_offset > max_offset):
+        return [first]
+
+    total = _meta_total(first)
+    if total is None:
+        return [first] + list(iter_pages(fetch_page, next_offset, page_limit, max_offset=max_offset))
+
+    # links.next tells the page size the server actually applied.
+    step = next_offset - offset
+    offsets = [o for o in range(next_offset, total, step) if max_offset is None or o <= max_offset]
+    if not offsets:
+        # links.next points at or beyond meta.total: nothing is left to fetch.
+        return [first]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets)), thread_name_prefix="eodhd-page") as executor:
+        rest = list(executor.map(lambda o: fetch_page(o, page_limit), offsets))
+    return [first] + rest
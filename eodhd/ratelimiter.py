@@ -0,0 +1,158 @@
+"""ratelimiter.py"""
+
+import asyncio
+import threading
+import time
+
+from eodhd.errors import EODHDRateLimitError
+
+
+# Approximate API-call cost of one request, by endpoint (see "API calls
+# consumption" in the EODHD documentation). Endpoints not listed cost 1 call.
+# A key also matches its sub-paths, e.g. "mp/unicornbay/options" covers
+# "mp/unicornbay/options/eod".
+ENDPOINT_COSTS = {
+    "fundamentals": 10,
+    "v1.1/fundamentals": 10,
+    "bulk-fundamentals": 100,
+    "v1.1/bulk-fundamentals": 100,
+    "eod-bulk-last-day": 100,
+    "technical": 5,
+    "intraday": 5,
+    "ticks": 10,
+    "news": 5,
+    "mp/unicornbay/options": 10,
+    "mp/unicornbay/tickdata": 10,
+}
+
+
+class TokenBucket:
+    """Token bucket holding up to `capacity` tokens, refilled at `rate` tokens/second.
+
+    Not thread-safe on its own; RateLimiter serialises access."""
+
+    def __init__(self, capacity: float, rate: float) -> None:
+        if capacity <= 0 or rate <= 0:
+            raise ValueError("Token bucket capacity and rate must be > 0.")
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Seconds until `tokens` are available (0.0 if available now)."""
+        if self.tokens >= tokens:
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Client-side request rate limiter shared by every call made through a client.
+
+    Two kinds of limits are enforced:
+
+    - request rate: per-second and/or per-minute token buckets; every HTTP
+      request takes one token from each bucket, blocking until one is free;
+    - daily API-call budget (optional): every request is charged its endpoint's
+      API-call cost (see ENDPOINT_COSTS); once the budget cannot cover a request,
+      EODHDRateLimitError is raised instead of sending it.
+
+    acquire() is thread-safe and blocks the calling thread; acquire_async() is
+    the asyncio equivalent and sleeps without blocking the event loop. Both may
+    be used on the same instance.
+    """
+
+    def __init__(self, per_second: float = None, per_minute: float = 1000, daily_budget: int = None,
+                 costs: dict = None) -> None:
+        if per_second is None and per_minute is None and daily_budget is None:
+            raise ValueError("At least one of per_second, per_minute or daily_budget is required.")
+
+        self._buckets = []
+        if per_second is not None:
+            self._buckets.append(TokenBucket(capacity=max(1.0, per_second), rate=per_second))
+        if per_minute is not None:
+            self._buckets.append(TokenBucket(capacity=per_minute, rate=per_minute / 60.0))
+
+        if daily_budget is not None and daily_budget < 0:
+            raise ValueError("daily_budget must be >= 0.")
+        self._budget = daily_budget
+
+        self._costs = dict(ENDPOINT_COSTS)
+        if costs:
+            self._costs.update(costs)
+
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_user_info(cls, user_info: dict, per_second: float = None, per_minute: float = 1000,
+                       costs: dict = None) -> "RateLimiter":
+        """Build a limiter whose daily budget is what is left of the account's quota today.
+
+        `user_info` is the dict returned by APIClient.get_user_info(); the budget is
+        dailyRateLimit + extraLimit - apiRequests."""
+        try:
+            daily_limit = int(user_info["dailyRateLimit"])
+        except (KeyError, TypeError, ValueError) as err:
+            raise ValueError("user_info has no usable 'dailyRateLimit'.") from err
+        used = int(user_info.get("apiRequests") or 0)
+        extra = int(user_info.get("extraLimit") or 0)
+        return cls(per_second=per_second, per_minute=per_minute,
+                   daily_budget=max(0, daily_limit + extra - used), costs=costs)
+
+    @property
+    def remaining_budget(self):
+        """API calls left in the daily budget, or None when no budget is set."""
+        return self._budget
+
+    def cost(self, endpoint: str = "") -> int:
+        """API-call cost of one request to `endpoint`."""
+        path = endpoint.strip("/")
+        while path:
+            if path in self._costs:
+                return self._costs[path]
+            path = path.rpartition("/")[0]
+        return 1
+
+    def _reserve(self, endpoint: str) -> float:
+        """Take a token (and charge the budget) if possible; otherwise return the wait in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            for bucket in self._buckets:
+                bucket.refill(now)
+                wait = max(wait, bucket.wait_time())
+            if wait > 0:
+                return wait
+
+            if self._budget is not None:
+                cost = self.cost(endpoint)
+                if cost > self._budget:
+                    raise EODHDRateLimitError(
+                        f"Daily API call budget exhausted: {endpoint or 'request'} costs {cost}, "
+                        f"{self._budget} left."
+                    )
+                self._budget -= cost
+
+            for bucket in self._buckets:
+                bucket.tokens -= 1.0
+            return 0.0
+
+    def acquire(self, endpoint: str = "") -> None:
+        """Block until a request to `endpoint` may be sent."""
+        while True:
+            wait = self._reserve(endpoint)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, endpoint: str = "") -> None:
+        """Asyncio variant of acquire()."""
+        while True:
+            wait = self._reserve(endpoint)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
@@ -0,0 +1,121 @@
+"""retry.py"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """Retry policy for idempotent GET requests.
+
+    A request is retried when it fails with a connection error, a timeout, or an
+    HTTP status in `retry_statuses` (429 and transient 5xx by default), up to
+    `max_attempts` attempts in total. Between attempts the policy sleeps for the
+    server's Retry-After delay when one is sent, otherwise for a "full jitter"
+    exponential backoff: uniform(0, min(backoff_max, backoff_base * 2 ** (attempt - 1))).
+    A Retry-After longer than `max_retry_after` seconds is not waited out; the
+    error is raised instead.
+
+    Counters are kept per policy (shared by every client using it) and exposed
+    through stats() for monitoring.
+    """
+
+    DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_attempts: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 retry_statuses=DEFAULT_RETRY_STATUSES, max_retry_after: float = 120.0) -> None:
+        if isinstance(max_attempts, bool) or not isinstance(max_attempts, int) or max_attempts < 1:
+            raise ValueError("max_attempts must be a positive integer.")
+        if backoff_base < 0 or backoff_max < 0:
+            raise ValueError("backoff_base and backoff_max must be >= 0.")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = float(max_retry_after)
+
+        self._lock = threading.Lock()
+        self._counters = {}
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counters = {
+                "requests": 0,
+                "retries": 0,
+                "retried_statuses": 0,
+                "retried_connection_errors": 0,
+                "retried_timeouts": 0,
+                "retry_after_waits": 0,
+                "gave_up": 0,
+            }
+
+    def stats(self) -> dict:
+        """Snapshot of the retry counters."""
+        with self._lock:
+            return dict(self._counters)
+
+    def _count(self, *names) -> None:
+        with self._lock:
+            for name in names:
+                self._counters[name] += 1
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered delay before retrying after failed attempt number `attempt` (1-based)."""
+        return random.uniform(0.0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+
+    @staticmethod
+    def retry_after(resp):
+        """Seconds requested by a Retry-After header (delta-seconds or HTTP-date), else None."""
+        try:
+            value = resp.headers.get("Retry-After")
+        except AttributeError:
+            return None
+        if not isinstance(value, str) or value.strip() == "":
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    def start(self) -> None:
+        """Record a new logical request."""
+        self._count("requests")
+
+    def retry_status(self, resp, attempt: int) -> bool:
+        """Sleep and return True if a response with a retryable status should be retried."""
+        if resp.status_code not in self.retry_statuses or attempt >= self.max_attempts:
+            if resp.status_code in self.retry_statuses:
+                self._count("gave_up")
+            return False
+
+        delay = self.retry_after(resp)
+        if delay is not None:
+            if delay > self.max_retry_after:
+                self._count("gave_up")
+                return False
+            self._count("retries", "retried_statuses", "retry_after_waits")
+        else:
+            delay = self.backoff(attempt)
+            self._count("retries", "retried_statuses")
+
+        time.sleep(delay)
+        return True
+
+    def retry_error(self, timeout: bool, attempt: int) -> bool:
+        """Sleep and return True if a connection error / timeout should be retried."""
+        if attempt >= self.max_attempts:
+            self._count("gave_up")
+            return False
+        self._count("retries", "retried_timeouts" if timeout else "retried_connection_errors")
+        time.sleep(self.backoff(attempt))
+        return True
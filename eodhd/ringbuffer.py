@@ -0,0 +1,107 @@
+"""ringbuffer.py"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Columns of a tick buffer: timestamps in epoch milliseconds as sent by the stream.
+TICK_DTYPES = (("timestamp", np.int64), ("price", np.float64), ("size", np.float64))
+
+
+class TickRingBuffer:
+    """The last `capacity` ticks of one symbol in preallocated NumPy columns.
+
+    append() is O(1) and never allocates; once the buffer is full each tick
+    overwrites the oldest one. `total` counts every tick appended (so
+    ``total - len(buffer)`` have been dropped)."""
+
+    def __init__(self, capacity: int) -> None:
+        if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("capacity must be a positive integer.")
+        self.capacity = capacity
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in TICK_DTYPES}
+        self.total = 0
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def append(self, timestamp: int, price: float, size: float = 0.0) -> None:
+        position = self.total % self.capacity
+        self.columns["timestamp"][position] = timestamp
+        self.columns["price"][position] = price
+        self.columns["size"][position] = size
+        self.total += 1
+
+    def snapshot(self) -> dict:
+        """Copies of the buffered columns, oldest tick first."""
+        if self.total <= self.capacity:
+            return {name: column[:self.total].copy() for name, column in self.columns.items()}
+        start = self.total % self.capacity
+        return {name: np.concatenate((column[start:], column[:start])) for name, column in self.columns.items()}
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.snapshot())
+
+    def clear(self) -> None:
+        self.total = 0
+
+
+class TickBuffers:
+    """Thread-safe TickRingBuffer per symbol, created on the first tick of each symbol.
+
+    One thread (e.g. a WebSocketClient receive thread) appends while others
+    take snapshots: both hold a lock for the duration of a single tick or a
+    copy of the columns, so memory stays bounded at
+    ``capacity * 24 bytes`` per symbol however long the stream runs."""
+
+    def __init__(self, capacity: int) -> None:
+        TickRingBuffer(capacity)  # validates capacity
+        self.capacity = capacity
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    @property
+    def symbols(self) -> list:
+        return list(self._buffers)
+
+    def __len__(self) -> int:
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def append(self, symbol: str, timestamp: int, price: float, size: float = 0.0) -> None:
+        with self._lock:
+            buffer = self._buffers.get(symbol)
+            if buffer is None:
+                buffer = self._buffers[symbol] = TickRingBuffer(self.capacity)
+            buffer.append(timestamp, price, size)
+
+    def snapshot(self, symbol: str) -> dict:
+        """Copies of the columns of `symbol` (empty if no tick has arrived yet), oldest first."""
+        with self._lock:
+            buffer = self._buffers.get(symbol)
+            if buffer is None:
+                return {name: np.empty(0, dtype=dtype) for name, dtype in TICK_DTYPES}
+            return buffer.snapshot()
+
+    def to_frame(self, symbol: str = None) -> pd.DataFrame:
+        """DataFrame of the buffered ticks of `symbol`, or of all symbols with a `symbol` column.
+
+        `datetime` is the tick time as a UTC timestamp."""
+        symbols = [symbol] if symbol is not None else self.symbols
+        frames = []
+        for name in symbols:
+            frame = pd.DataFrame(self.snapshot(name))
+            if symbol is None:
+                frame.insert(0, "symbol", name)
+            frames.append(frame)
+        if frames:
+            df_data = pd.concat(frames, ignore_index=True)
+        else:
+            df_data = pd.DataFrame({"symbol": pd.Series(dtype=object), **{
+                name: pd.Series(dtype=dtype) for name, dtype in TICK_DTYPES}})
+        df_data["datetime"] = pd.to_datetime(df_data["timestamp"], unit="ms", utc=True)
+        return df_data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buffers = {}
@@ -0,0 +1,289 @@
+"""sinks.py"""
+
+import abc
+import os
+import threading
+import uuid
+
+import numpy as np
+import pandas as pd
+
+
+def _module_available(*modules) -> bool:
+    for module in modules:
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+def parquet_available() -> bool:
+    """True when pandas can write Parquet (pyarrow or fastparquet is installed)."""
+    return _module_available("pyarrow", "fastparquet")
+
+
+# Column types per dataset, so every file written for an endpoint has the same
+# schema whatever the content of a single response (e.g. a chunk where all
+# volumes are missing). Columns not listed keep the type pandas infers.
+# Volumes are float64, since crypto and forex volumes are fractional.
+SCHEMAS = {
+    "eod": {
+        "date": "datetime64[ns]", "open": "float64", "high": "float64", "low": "float64",
+        "close": "float64", "adjusted_close": "float64", "volume": "float64",
+    },
+    "intraday": {
+        "timestamp": "int64", "gmtoffset": "int64", "datetime": "datetime64[ns]", "open": "float64",
+        "high": "float64", "low": "float64", "close": "float64", "volume": "float64",
+    },
+    "ticks": {
+        "ts": "int64", "price": "float64", "shares": "int32", "seq": "int64",
+        "ex": "string", "mkt": "string", "sub_mkt": "string", "sl": "string",
+    },
+    "eod-bulk-last-day": {
+        "code": "string", "exchange_short_name": "string", "date": "datetime64[ns]", "open": "float64",
+        "high": "float64", "low": "float64", "close": "float64", "adjusted_close": "float64",
+        "volume": "float64",
+    },
+    "div": {
+        "date": "datetime64[ns]", "declarationDate": "datetime64[ns]", "recordDate": "datetime64[ns]",
+        "paymentDate": "datetime64[ns]", "period": "string", "value": "float64",
+        "unadjustedValue": "float64", "currency": "string",
+    },
+    "splits": {"date": "datetime64[ns]", "split": "string"},
+}
+
+# APIClient method names that write to an endpoint's dataset.
+METHOD_DATASETS = {
+    "get_eod_historical_stock_market_data": "eod",
+    "get_intraday_historical_data": "intraday",
+    "get_intraday_range": "intraday",
+    "get_stock_market_tick_data": "ticks",
+    "get_eod_splits_dividends_data": "eod-bulk-last-day",
+    "get_historical_dividends_data": "div",
+    "get_historical_splits_data": "splits",
+}
+
+# Columns a row's partition date is taken from, in order of preference, with the
+# epoch unit of integer timestamps.
+_DATE_COLUMNS = (("date", None), ("datetime", None), ("ts", "ns"), ("timestamp", "s"))
+
+PARTITION_LEVELS = ("symbol", "year", "month", "day")
+
+# Directory value of rows without a date, which Hive-style readers read back as null.
+_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def to_frame(data) -> pd.DataFrame:
+    """Convert an endpoint result into a DataFrame.
+
+    Accepts DataFrames (a non-default index becomes a column), lists of records,
+    {data, meta, links} envelopes, column dicts of equal-length lists, NumPy
+    structured arrays and single (possibly nested) JSON objects, which become
+    one flattened row."""
+    if isinstance(data, pd.DataFrame):
+        if isinstance(data.index, pd.RangeIndex):
+            return data
+        index_name = data.index.name or ("date" if isinstance(data.index, pd.DatetimeIndex) else "index")
+        return data.rename_axis(index_name).reset_index()
+    if isinstance(data, np.ndarray):
+        if data.dtype.names is None:
+            raise ValueError("Only structured NumPy arrays can be written to a sink.")
+        return pd.DataFrame({name: data[name] for name in data.dtype.names})
+    if isinstance(data, dict) and isinstance(data.get("data"), (list, dict)) and ("meta" in data or "links" in data):
+        return to_frame(data["data"])
+    if isinstance(data, dict):
+        values = list(data.values())
+        if values and all(isinstance(value, list) for value in values) and len({len(v) for v in values}) == 1:
+            return pd.DataFrame(data)
+        return pd.json_normalize(data)
+    if isinstance(data, list):
+        return pd.DataFrame.from_records(data) if data else pd.DataFrame()
+    raise ValueError(f"Cannot write {type(data).__name__} to a sink.")
+
+
+def apply_schema(df_data: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    """Cast the columns named in `schema` to their types, adding missing ones as empty columns."""
+    df_data = df_data.copy()
+    for column, dtype in schema.items():
+        values = df_data[column] if column in df_data.columns else pd.Series([None] * len(df_data), index=df_data.index)
+        if dtype.startswith("datetime64"):
+            df_data[column] = pd.to_datetime(values, errors="coerce").astype(dtype)
+        elif dtype == "string":
+            df_data[column] = values.astype("string")
+        else:
+            numeric = pd.to_numeric(values, errors="coerce")
+            if dtype.startswith("int"):
+                numeric = numeric.fillna(0)
+            df_data[column] = numeric.astype(dtype)
+    return df_data
+
+
+def _partition_dates(df_data: pd.DataFrame):
+    """Per-row timestamps from the first date-like column, or None if there is none."""
+    for column, unit in _DATE_COLUMNS:
+        if column not in df_data.columns:
+            continue
+        values = df_data[column]
+        if unit is not None and pd.api.types.is_numeric_dtype(values):
+            return pd.to_datetime(values, unit=unit, errors="coerce")
+        return pd.to_datetime(values, errors="coerce")
+    return None
+
+
+def _safe(value) -> str:
+    return str(value).strip().replace("/", "_").replace(os.sep, "_") or "unknown"
+
+
+class Sink(abc.ABC):
+    """Writes endpoint results as files under `root`, one dataset (endpoint) per directory.
+
+    Files are laid out as ``root/<dataset>/symbol=<symbol>/part-<id>.<ext>``
+    (Hive-style, readable as one partitioned dataset by pyarrow, Spark, DuckDB
+    and others). `partition_by` selects the levels, in order, from "symbol",
+    "year", "month" and "day": the symbol comes from the `symbol` argument of
+    write() or a symbol/code column, the year / month / day (integers) from a
+    date/datetime/ts/timestamp column, e.g. ``("symbol", "year")`` for
+    ``symbol=AAPL.US/year=2024``. A column named like a partition level is
+    not written to the files, since readers take its value from the directory.
+    Columns of known datasets (see SCHEMAS) always get the same types.
+
+    write() may be called from many threads at once. Subclasses implement
+    _write_file().
+    """
+
+    extension = ""
+
+    def __init__(self, root: str, partition_by=("symbol",), schemas: dict = None) -> None:
+        partition_by = tuple(partition_by or ())
+        if any(level not in PARTITION_LEVELS for level in partition_by):
+            raise ValueError(f"partition_by may only contain {list(PARTITION_LEVELS)}.")
+
+        self.root = os.path.expanduser(root)
+        self.partition_by = partition_by
+        self._schemas = dict(SCHEMAS)
+        if schemas:
+            self._schemas.update(schemas)
+        self._lock = threading.Lock()
+        self._files = []
+
+    @property
+    def files(self) -> list:
+        """Paths of all files written by this sink so far."""
+        with self._lock:
+            return list(self._files)
+
+    @abc.abstractmethod
+    def _write_file(self, df_data: pd.DataFrame, path: str) -> None:
+        """Write `df_data` to the file `path`."""
+
+    def write(self, data, dataset: str, symbol: str = None) -> list:
+        """Write one endpoint result to `dataset` (an endpoint name such as "eod",
+        or an APIClient method name); return the paths of the files written."""
+        dataset = METHOD_DATASETS.get(dataset, dataset)
+        df_data = to_frame(data)
+        if df_data.empty:
+            return []
+        if dataset in self._schemas:
+            df_data = apply_schema(df_data, self._schemas[dataset])
+
+        groups = [((), df_data)]
+        for level in self.partition_by:
+            split = []
+            for parts, frame in groups:
+                keys = self._partition_keys(frame, level, symbol)
+                if keys is None:
+                    split.append((parts, frame))
+                    continue
+                split.extend((parts + (f"{level}={_safe(key)}",), part)
+                             for key, part in frame.groupby(keys, sort=level != "symbol"))
+            groups = split
+
+        partition_columns = [level for level in self.partition_by if level in df_data.columns]
+        paths = []
+        for parts, frame in groups:
+            directory = os.path.join(self.root, _safe(dataset), *parts)
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"part-{uuid.uuid4().hex}{self.extension}")
+            self._write_file(frame.drop(columns=partition_columns).reset_index(drop=True), path)
+            paths.append(path)
+
+        with self._lock:
+            self._files.extend(paths)
+        return paths
+
+    @staticmethod
+    def _partition_keys(df_data: pd.DataFrame, level: str, symbol):
+        """Per-row directory values of one partition level, or None if the rows have no such value."""
+        if level == "symbol":
+            if symbol is None:
+                column = next((c for c in ("symbol", "code", "Code") if c in df_data.columns), None)
+                if column is not None:
+                    return df_data[column].astype(str)
+            return pd.Series("unknown" if symbol is None else str(symbol), index=df_data.index)
+        dates = _partition_dates(df_data)
+        if dates is None:
+            return None
+        return getattr(dates.dt, level).map(lambda value: _NULL_PARTITION if pd.isna(value) else str(int(value)))
+
+    def close(self) -> None:
+        """Finish writing. The file sinks here write whole files per call and hold nothing open."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ParquetSink(Sink):
+    """Sink writing Parquet files (requires pyarrow or fastparquet: pip install eodhd[parquet])."""
+
+    extension = ".parquet"
+
+    def __init__(self, root: str, partition_by=("symbol",), schemas: dict = None,
+                 compression: str = "snappy") -> None:
+        if not parquet_available():
+            raise ImportError("ParquetSink requires pyarrow or fastparquet: pip install eodhd[parquet]")
+        super().__init__(root, partition_by, schemas)
+        self.compression = compression
+
+    def _write_file(self, df_data: pd.DataFrame, path: str) -> None:
+        df_data.to_parquet(path, compression=self.compression, index=False)
+
+
+class FeatherSink(Sink):
+    """Sink writing Arrow IPC (Feather v2) files (requires pyarrow: pip install eodhd[parquet])."""
+
+    extension = ".feather"
+
+    def __init__(self, root: str, partition_by=("symbol",), schemas: dict = None) -> None:
+        if not _module_available("pyarrow"):
+            raise ImportError("FeatherSink requires pyarrow: pip install eodhd[parquet]")
+        super().__init__(root, partition_by, schemas)
+
+    def _write_file(self, df_data: pd.DataFrame, path: str) -> None:
+        df_data.to_feather(path)
+
+
+class CSVSink(Sink):
+    """Sink writing CSV files; needs no optional dependency but loses column types on re-reading."""
+
+    extension = ".csv"
+
+    def _write_file(self, df_data: pd.DataFrame, path: str) -> None:
+        df_data.to_csv(path, index=False)
+
+
+_SINKS = {"parquet": ParquetSink, "feather": FeatherSink, "csv": CSVSink}
+
+
+def make_sink(root: str, file_format: str = "auto", **kwargs) -> Sink:
+    """Create a sink for `file_format` ("parquet", "feather", "csv"), or with "auto"
+    Parquet when it can be written and CSV otherwise."""
+    if file_format == "auto":
+        file_format = "parquet" if parquet_available() else "csv"
+    if file_format not in _SINKS:
+        raise ValueError(f"file_format must be one of {['auto', *_SINKS]}.")
+    return _SINKS[file_format](root, **kwargs)
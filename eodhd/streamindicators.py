@@ -0,0 +1,229 @@
+"""streamindicators.py"""
+
+import abc
+import math
+from collections import deque
+
+
+class StreamIndicator(abc.ABC):
+    """Indicator updated in O(1) per trade or per closed candle.
+
+    `on` selects what drives the indicator: "candle" (the close of each
+    finished candle) or "tick" (the price of each trade). `value` is None until
+    enough data has been seen. Subclasses implement update(price, size)."""
+
+    sources = ("tick", "candle")
+
+    def __init__(self, on: str = "candle") -> None:
+        if on not in self.sources:
+            raise ValueError(f"on must be one of {list(self.sources)}.")
+        self.on = on
+        self.value = None
+
+    @property
+    def ready(self) -> bool:
+        return self.value is not None
+
+    @abc.abstractmethod
+    def update(self, price: float, size: float = 0.0):
+        """Feed one price (and the size traded at it); return the new value (or None while warming up)."""
+
+    def on_tick(self, price: float, size: float = 0.0, timestamp=None):
+        if self.on == "tick":
+            return self.update(price, size)
+        return self.value
+
+    def on_candle(self, candle: dict):
+        if self.on == "candle":
+            return self.update(candle["c"])
+        return self.value
+
+    def reset(self) -> None:
+        self.__init__(**self._params())
+
+    def _params(self) -> dict:
+        return {"on": self.on}
+
+
+class EMA(StreamIndicator):
+    """Exponential moving average, seeded with the simple average of the first `period` prices."""
+
+    def __init__(self, period: int = 20, on: str = "candle") -> None:
+        super().__init__(on)
+        if isinstance(period, bool) or not isinstance(period, int) or period < 1:
+            raise ValueError("period must be a positive integer.")
+        self.period = period
+        self._alpha = 2.0 / (period + 1)
+        self._count = 0
+        self._sum = 0.0
+
+    def update(self, price: float, size: float = 0.0):
+        price = float(price)
+        if self.value is None:
+            self._count += 1
+            self._sum += price
+            if self._count == self.period:
+                self.value = self._sum / self.period
+        else:
+            self.value += self._alpha * (price - self.value)
+        return self.value
+
+    def _params(self) -> dict:
+        return {"period": self.period, "on": self.on}
+
+
+class RSI(StreamIndicator):
+    """Wilder's relative strength index over `period` price changes."""
+
+    def __init__(self, period: int = 14, on: str = "candle") -> None:
+        super().__init__(on)
+        if isinstance(period, bool) or not isinstance(period, int) or period < 1:
+            raise ValueError("period must be a positive integer.")
+        self.period = period
+        self._previous = None
+        self._count = 0
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def update(self, price: float, size: float = 0.0):
+        price = float(price)
+        if self._previous is None:
+            self._previous = price
+            return self.value
+        change, self._previous = price - self._previous, price
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+
+        if self._count < self.period:
+            # Warm-up: plain averages of the first `period` changes.
+            self._count += 1
+            self._gain += gain / self.period
+            self._loss += loss / self.period
+            if self._count < self.period:
+                return self.value
+        else:
+            self._gain += (gain - self._gain) / self.period
+            self._loss += (loss - self._loss) / self.period
+
+        self.value = 100.0 if self._loss == 0 else 100.0 - 100.0 / (1.0 + self._gain / self._loss)
+        return self.value
+
+    def _params(self) -> dict:
+        return {"period": self.period, "on": self.on}
+
+
+class ATR(StreamIndicator):
+    """Wilder's average true range of closed candles.
+
+    It is driven by on_candle(); update() counts a bare price as a candle whose
+    high, low and close are that price."""
+
+    sources = ("candle",)
+
+    def __init__(self, period: int = 14, on: str = "candle") -> None:
+        super().__init__(on)
+        if isinstance(period, bool) or not isinstance(period, int) or period < 1:
+            raise ValueError("period must be a positive integer.")
+        self.period = period
+        self._previous_close = None
+        self._count = 0
+        self._sum = 0.0
+
+    def update(self, price: float, size: float = 0.0):
+        return self.update_candle(price, price, price)
+
+    def update_candle(self, high: float, low: float, close: float):
+        high, low, close = float(high), float(low), float(close)
+        if self._previous_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - self._previous_close), abs(low - self._previous_close))
+        self._previous_close = close
+
+        if self.value is None:
+            self._count += 1
+            self._sum += true_range
+            if self._count == self.period:
+                self.value = self._sum / self.period
+        else:
+            self.value += (true_range - self.value) / self.period
+        return self.value
+
+    def on_candle(self, candle: dict):
+        return self.update_candle(candle["h"], candle["l"], candle["c"])
+
+    def _params(self) -> dict:
+        return {"period": self.period, "on": self.on}
+
+
+class VWAP(StreamIndicator):
+    """Volume-weighted average price since the start (or the last reset()).
+
+    With on="tick" every trade counts at its own price; with on="candle" each
+    candle counts at its typical price (high + low + close) / 3 and volume."""
+
+    def __init__(self, on: str = "tick") -> None:
+        super().__init__(on)
+        self._notional = 0.0
+        self._volume = 0.0
+
+    def update(self, price: float, size: float = 0.0):
+        size = float(size)
+        if size > 0:
+            self._notional += float(price) * size
+            self._volume += size
+            self.value = self._notional / self._volume
+        return self.value
+
+    def on_candle(self, candle: dict):
+        if self.on == "candle":
+            return self.update((candle["h"] + candle["l"] + candle["c"]) / 3.0, candle.get("v", 0.0))
+        return self.value
+
+
+class RollingVolatility(StreamIndicator):
+    """Standard deviation of the last `window` log returns, times sqrt(annualization).
+
+    Running sums of the returns in the window are updated as returns enter and
+    leave it, so each update is O(1) regardless of the window length."""
+
+    def __init__(self, window: int = 20, annualization: float = 1.0, on: str = "candle") -> None:
+        super().__init__(on)
+        if isinstance(window, bool) or not isinstance(window, int) or window < 2:
+            raise ValueError("window must be an integer of at least 2.")
+        self.window = window
+        self.annualization = annualization
+        self._previous = None
+        self._returns = deque()
+        self._sum = 0.0
+        self._sum_squares = 0.0
+        self._updates = 0
+
+    def update(self, price: float, size: float = 0.0):
+        price = float(price)
+        if self._previous is None or self._previous <= 0 or price <= 0:
+            self._previous = price
+            return self.value
+        value, self._previous = math.log(price / self._previous), price
+
+        self._returns.append(value)
+        self._sum += value
+        self._sum_squares += value * value
+        if len(self._returns) > self.window:
+            old = self._returns.popleft()
+            self._sum -= old
+            self._sum_squares -= old * old
+
+        # Re-sum now and then so rounding errors of the running sums cannot accumulate.
+        self._updates += 1
+        if self._updates % (64 * self.window) == 0:
+            self._sum = math.fsum(self._returns)
+            self._sum_squares = math.fsum(r * r for r in self._returns)
+
+        count = len(self._returns)
+        if count == self.window:
+            variance = max((self._sum_squares - self._sum * self._sum / count) / (count - 1), 0.0)
+            self.value = math.sqrt(variance * self.annualization)
+        return self.value
+
+    def _params(self) -> dict:
+        return {"window": self.window, "annualization": self.annualization, "on": self.on}
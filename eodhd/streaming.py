@@ -0,0 +1,126 @@
+"""streaming.py"""
+
+import codecs
+import json
+from itertools import islice
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class _ChunkReader:
+    """Text buffer over an iterable of byte chunks, decoded as UTF-8 incrementally."""
+
+    def __init__(self, chunks) -> None:
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def read_more(self) -> bool:
+        """Append the next non-empty chunk; False once the input is exhausted."""
+        while not self.exhausted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.exhausted = True
+                self.buffer += self._utf8.decode(b"", final=True)
+                return False
+            text = self._utf8.decode(chunk)
+            if text:
+                # Drop the consumed prefix so the buffer only holds unparsed data.
+                self.buffer = self.buffer[self.pos:] + text
+                self.pos = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of input), without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_more():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            found = self.peek() or "end of input"
+            raise ValueError(f"Malformed JSON stream: expected '{char}', found '{found}'.")
+        self.pos += 1
+
+    def _number_continues(self, value, end: int) -> bool:
+        """True if a decoded number may be the prefix of a longer one (e.g. "45" of "45.5")."""
+        return (isinstance(value, (int, float)) and not isinstance(value, bool)
+                and self.buffer[end] in _NUMBER_CHARS)
+
+    def value(self, decoder: json.JSONDecoder):
+        """Decode the next complete JSON value, reading as many chunks as it needs.
+
+        A value is only accepted when input that cannot extend it follows (or the
+        input has ended), so a number split across chunks is never cut short. After a
+        failed attempt the next one waits until the pending text has doubled,
+        which keeps parsing of large values linear overall."""
+        self.peek()
+        retry_at = 0
+        while True:
+            pending = len(self.buffer) - self.pos
+            if pending >= retry_at or self.exhausted:
+                try:
+                    value, end = decoder.raw_decode(self.buffer, self.pos)
+                except json.JSONDecodeError:
+                    if self.exhausted:
+                        raise
+                    retry_at = 2 * pending
+                else:
+                    if self.exhausted or (end < len(self.buffer) and not self._number_continues(value, end)):
+                        self.pos = end
+                        return value
+            self.read_more()
+
+
+def iter_json_records(chunks, decoder: json.JSONDecoder = None):
+    """Yield the elements of a top-level JSON array (or the values of a top-level
+    object) from an iterable of byte chunks, holding roughly one element in memory.
+
+    Any other top-level value is yielded whole. Raises ValueError (json.JSONDecodeError)
+    on malformed input."""
+    decoder = decoder or json.JSONDecoder()
+    reader = _ChunkReader(chunks)
+
+    opening = reader.peek()
+    if opening not in ("[", "{"):
+        if opening != "":
+            yield reader.value(decoder)
+        return
+
+    closing = "]" if opening == "[" else "}"
+    reader.pos += 1
+    if reader.peek() == closing:
+        return
+
+    while True:
+        if opening == "{":
+            key = reader.value(decoder)
+            if not isinstance(key, str):
+                raise ValueError("Malformed JSON stream: object keys must be strings.")
+            reader.expect(":")
+        yield reader.value(decoder)
+
+        separator = reader.peek()
+        if separator == closing:
+            return
+        reader.expect(",")
+
+
+def iter_batches(records, size: int):
+    """Group an iterable of records into lists of at most `size` items."""
+    if isinstance(size, bool) or not isinstance(size, int) or size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+    records = iter(records)
+    while True:
+        batch = list(islice(records, size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,225 @@
+"""streammanager.py"""
+
+import asyncio
+import math
+
+from eodhd.asyncwebsocketclient import AsyncWebSocketClient
+from eodhd.errors import EODHDError
+from eodhd.websocketclient import MAX_SYMBOLS, validate_subscription, validate_symbols
+
+# Put on the queue by close() to wake up consumers waiting in get().
+_CLOSED = object()
+
+
+class StreamManager:
+    """Streams any number of symbols by sharding them over several connections.
+
+    `subscriptions` maps endpoints ("us", "us-quote", "forex", "crypto") to
+    symbol lists of any length. Each endpoint's symbols are spread evenly over
+    as few AsyncWebSocketClient connections as `max_symbols_per_connection`
+    (at most 50, the server's limit) allows. All connections feed one
+    asyncio.Queue; iterating the manager yields ``(endpoint, message)`` pairs
+    in the order the messages arrived (the order within each connection is
+    preserved)::
+
+        async with StreamManager(api_key, {"us": sp500, "crypto": ["BTC-USD"]}) as manager:
+            async for endpoint, message in manager:
+                ...
+
+    subscribe() / unsubscribe() change the symbol set on the live connections:
+    new symbols go to connections with room, then to new connections; a
+    connection left without symbols is closed. rebalance() evens out the
+    connections of an endpoint again and runs automatically whenever a
+    connection re-connects. If a connection gives up reconnecting, it is
+    dropped together with its symbols (subscribe() them again to retry) and
+    its EODHDConnectionError is raised by the iteration. close() ends every
+    iteration, including one waiting for the next message.
+
+    Other keyword arguments (max_reconnect_attempts, ping_interval, ...) are
+    passed to each AsyncWebSocketClient.
+    """
+
+    def __init__(self, api_key: str, subscriptions: dict, max_symbols_per_connection: int = MAX_SYMBOLS,
+                 queue_size: int = 10000, **client_options) -> None:
+        if (isinstance(max_symbols_per_connection, bool) or not isinstance(max_symbols_per_connection, int)
+                or not 1 <= max_symbols_per_connection <= MAX_SYMBOLS):
+            raise ValueError(f"max_symbols_per_connection must be an integer from 1 to {MAX_SYMBOLS}.")
+        if not subscriptions:
+            raise ValueError("No subscriptions provided")
+        for endpoint, symbols in subscriptions.items():
+            validate_subscription(api_key, endpoint, list(symbols), max_symbols=None)
+
+        self._api_key = api_key
+        self._subscriptions = {endpoint: list(dict.fromkeys(symbols)) for endpoint, symbols in subscriptions.items()}
+        self._max_symbols = max_symbols_per_connection
+        self._queue_size = queue_size
+        self._client_options = client_options
+
+        self._queue = None
+        self._lock = None
+        self._shards = {endpoint: [] for endpoint in self._subscriptions}
+        self._tasks = {}
+        self._started = False
+        self._closed = False
+
+    @property
+    def shards(self) -> dict:
+        """{endpoint: [symbols of each connection]}."""
+        return {endpoint: [client.symbols for client in clients] for endpoint, clients in self._shards.items()}
+
+    @property
+    def symbols(self) -> dict:
+        return {endpoint: [symbol for client in clients for symbol in client.symbols]
+                for endpoint, clients in self._shards.items()}
+
+    def _split(self, symbols: list) -> list:
+        count = math.ceil(len(symbols) / self._max_symbols)
+        size = math.ceil(len(symbols) / count) if count else 0
+        return [symbols[i:i + size] for i in range(0, len(symbols), size)] if size else []
+
+    def _add_shard(self, endpoint: str, symbols: list) -> AsyncWebSocketClient:
+        client = AsyncWebSocketClient(
+            self._api_key, endpoint, symbols, on_connect=self._connected(endpoint), **self._client_options
+        )
+        self._shards[endpoint].append(client)
+        if self._started:
+            self._tasks[client] = asyncio.ensure_future(self._pump(endpoint, client))
+        return client
+
+    async def _remove_shard(self, endpoint: str, client: AsyncWebSocketClient) -> None:
+        self._shards[endpoint].remove(client)
+        await client.close()
+        task = self._tasks.pop(client, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    def _connected(self, endpoint: str):
+        async def on_connect(client):
+            if client.connections > 1:
+                # Re-connected: the symbol set may have changed meanwhile.
+                await self.rebalance(endpoint)
+        return on_connect
+
+    async def _pump(self, endpoint: str, client: AsyncWebSocketClient) -> None:
+        try:
+            async for message in client:
+                await self._queue.put((endpoint, message))
+        except EODHDError as err:
+            await self._queue.put((endpoint, err))
+            # The connection gave up: drop it so shards / symbols only list live connections.
+            async with self._lock:
+                if client in self._shards.get(endpoint, []):
+                    await self._remove_shard(endpoint, client)
+        finally:
+            self._tasks.pop(client, None)
+
+    async def start(self) -> None:
+        """Open the connections. Called by `async with` and on first iteration."""
+        if self._started:
+            return
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._lock = asyncio.Lock()
+        self._started = True
+        for endpoint, symbols in self._subscriptions.items():
+            for chunk in self._split(symbols):
+                self._add_shard(endpoint, chunk)
+
+    async def subscribe(self, endpoint: str, symbols) -> None:
+        """Add `symbols` of `endpoint`, filling connections with room before opening new ones."""
+        validate_subscription(self._api_key, endpoint, list(symbols), max_symbols=None)
+        await self.start()
+        async with self._lock:
+            clients = self._shards.setdefault(endpoint, [])
+            subscribed = {symbol for client in clients for symbol in client.symbols}
+            pending = [symbol for symbol in dict.fromkeys(symbols) if symbol not in subscribed]
+            for client in clients:
+                room = self._max_symbols - len(client.symbols)
+                if room > 0 and pending:
+                    await client.subscribe(pending[:room])
+                    pending = pending[room:]
+            for chunk in self._split(pending):
+                self._add_shard(endpoint, chunk)
+
+    async def unsubscribe(self, endpoint: str, symbols) -> None:
+        """Remove `symbols` of `endpoint`; connections left without symbols are closed."""
+        validate_symbols(symbols)
+        await self.start()
+        async with self._lock:
+            removed = set(symbols)
+            for client in list(self._shards.get(endpoint, [])):
+                mine = [symbol for symbol in client.symbols if symbol in removed]
+                if len(mine) == len(client.symbols):
+                    await self._remove_shard(endpoint, client)
+                elif mine:
+                    await client.unsubscribe(mine)
+
+    async def rebalance(self, endpoint: str) -> None:
+        """Spread the symbols of `endpoint` evenly over as few connections as needed.
+
+        Connections keep as many of their own symbols as they can; surplus
+        connections are closed after their symbols have been moved."""
+        await self.start()
+        async with self._lock:
+            clients = self._shards.get(endpoint, [])
+            total = sum(len(client.symbols) for client in clients)
+            if not clients or total == 0:
+                return
+            needed = math.ceil(total / self._max_symbols)
+            capacity = math.ceil(total / needed)
+
+            keep = sorted(clients, key=lambda client: -len(client.symbols))[:needed]
+            drop = [client for client in clients if client not in keep]
+            pool = [symbol for client in keep for symbol in client.symbols[capacity:]]
+            pool += [symbol for client in drop for symbol in client.symbols]
+
+            # Take surplus symbols off first, so no connection exceeds its limit while moving.
+            for client in keep:
+                if len(client.symbols) > capacity:
+                    await client.unsubscribe(client.symbols[capacity:])
+            for client in keep:
+                room = capacity - len(client.symbols)
+                if room > 0 and pool:
+                    await client.subscribe(pool[:room])
+                    pool = pool[room:]
+            for client in drop:
+                await self._remove_shard(endpoint, client)
+
+    async def get(self):
+        """The next (endpoint, message) pair; raises StopAsyncIteration once the manager is closed."""
+        if self._closed:
+            raise StopAsyncIteration
+        await self.start()
+        endpoint, message = await self._queue.get()
+        if message is _CLOSED:
+            # Leave it for any other waiting consumer.
+            self._queue.put_nowait((endpoint, message))
+            raise StopAsyncIteration
+        if isinstance(message, Exception):
+            raise message
+        return endpoint, message
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.get()
+
+    async def close(self) -> None:
+        """Close every connection and end the iteration of every consumer."""
+        self._closed = True
+        for endpoint, clients in self._shards.items():
+            for client in list(clients):
+                await self._remove_shard(endpoint, client)
+        if self._queue is not None:
+            # A full queue has no consumer waiting in get(), and get() checks _closed first.
+            try:
+                self._queue.put_nowait((None, _CLOSED))
+            except asyncio.QueueFull:
+                pass
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
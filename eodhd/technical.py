@@ -0,0 +1,423 @@
+"""technical.py"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from eodhd.indicators import rolling_max, rolling_mean, rolling_min, rolling_std, shift
+
+# Functions of the technical/ endpoint that can be computed locally, with the
+# keys of their output records.
+FUNCTIONS = {
+    "splitadjusted": ("open", "high", "low", "close", "volume"),
+    "avgvol": ("avgvol",),
+    "avgvolccy": ("avgvolccy",),
+    "sma": ("sma",),
+    "ema": ("ema",),
+    "wma": ("wma",),
+    "volatility": ("volatility",),
+    "stochastic": ("k_values", "d_values"),
+    "rsi": ("rsi",),
+    "stddev": ("stddev",),
+    "stochrsi": ("fast_k_line", "fast_d_line"),
+    "slope": ("slope",),
+    "dmi": ("dx", "plus_di", "minus_di"),
+    "adx": ("adx",),
+    "macd": ("macd", "signal", "divergence"),
+    "atr": ("atr",),
+    "cci": ("cci",),
+    "sar": ("sar",),
+    "beta": ("beta",),
+    "bbands": ("uband", "mband", "lband"),
+}
+
+
+def _seeded_ewm(values: np.ndarray, alpha: float, period: int) -> np.ndarray:
+    """y[i] = y[i-1] + alpha * (x[i] - y[i-1]), seeded with the mean of the first
+    `period` valid values (the TA-Lib convention); NaN before the seed."""
+    out = np.full(len(values), np.nan)
+    valid = np.flatnonzero(np.isfinite(values))
+    if len(valid) == 0 or valid[0] + period > len(values):
+        return out
+    start = valid[0]
+    seed = start + period - 1
+    tail = values[seed:].copy()
+    tail[0] = values[start:seed + 1].mean()
+    out[seed:] = pd.Series(tail).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    return out
+
+
+def _ema(values: np.ndarray, period: int) -> np.ndarray:
+    return _seeded_ewm(values, 2.0 / (period + 1), period)
+
+
+def _wilder(values: np.ndarray, period: int) -> np.ndarray:
+    return _seeded_ewm(values, 1.0 / period, period)
+
+
+def _windows(values: np.ndarray, period: int, reduce) -> np.ndarray:
+    out = np.full(len(values), np.nan)
+    if period <= len(values):
+        out[period - 1:] = reduce(sliding_window_view(values, period))
+    return out
+
+
+def _true_range(prices: dict) -> np.ndarray:
+    """True range; NaN on the first bar, which has no previous close."""
+    high, low, prev_close = prices["high"], prices["low"], shift(prices["close"])
+    return np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+def _rsi(close: np.ndarray, period: int) -> np.ndarray:
+    change = np.diff(close, prepend=np.nan)
+    gain = _wilder(np.where(change > 0, change, np.where(np.isnan(change), np.nan, 0.0)), period)
+    loss = _wilder(np.where(change < 0, -change, np.where(np.isnan(change), np.nan, 0.0)), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(loss == 0, 100.0, 100.0 - 100.0 / (1.0 + gain / loss))
+
+
+def _stoch(values: np.ndarray, low: np.ndarray, high: np.ndarray, period: int) -> np.ndarray:
+    lowest, highest = rolling_min(low, period), rolling_max(high, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(highest == lowest, 0.0, 100.0 * (values - lowest) / (highest - lowest))
+
+
+def _dmi(prices: dict, period: int):
+    high, low = prices["high"], prices["low"]
+    up, down = high - shift(high), shift(low) - low
+    missing = np.isnan(up)
+    plus_dm = np.where(missing, np.nan, np.where((up > down) & (up > 0), up, 0.0))
+    minus_dm = np.where(missing, np.nan, np.where((down > up) & (down > 0), down, 0.0))
+
+    atr = _wilder(_true_range(prices), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = 100.0 * _wilder(plus_dm, period) / atr
+        minus_di = 100.0 * _wilder(minus_dm, period) / atr
+        dx = 100.0 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+    return dx, plus_di, minus_di
+
+
+def _sar(high: np.ndarray, low: np.ndarray, acceleration: float, maximum: float) -> np.ndarray:
+    """Wilder's parabolic SAR. Each value depends on the previous trend, so this is a plain loop."""
+    out = np.full(len(high), np.nan)
+    if len(high) < 2:
+        return out
+    rising = high[1] + low[0] >= high[0] + low[1]
+    sar, extreme, factor = (low[0], high[1], acceleration) if rising else (high[0], low[1], acceleration)
+    out[1] = sar
+    for i in range(2, len(high)):
+        sar = sar + factor * (extreme - sar)
+        if rising:
+            sar = min(sar, low[i - 1], low[i - 2])
+            if low[i] < sar:
+                rising, sar, extreme, factor = False, extreme, low[i], acceleration
+            elif high[i] > extreme:
+                extreme, factor = high[i], min(factor + acceleration, maximum)
+        else:
+            sar = max(sar, high[i - 1], high[i - 2])
+            if high[i] > sar:
+                rising, sar, extreme, factor = True, extreme, high[i], acceleration
+            elif low[i] < extreme:
+                extreme, factor = low[i], min(factor + acceleration, maximum)
+        out[i] = sar
+    return out
+
+
+def _slope(values: np.ndarray, period: int) -> np.ndarray:
+    """Slope of the least-squares line through each window of `period` values."""
+    x = np.arange(period, dtype=np.float64) - (period - 1) / 2.0
+    return _windows(values, period, lambda windows: windows @ x / (x @ x))
+
+
+def _cci(prices: dict, period: int) -> np.ndarray:
+    typical = (prices["high"] + prices["low"] + prices["close"]) / 3.0
+
+    def reduce(windows):
+        mean = windows.mean(axis=-1)
+        deviation = np.abs(windows - mean[:, None]).mean(axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (windows[:, -1] - mean) / (0.015 * deviation)
+
+    return _windows(typical, period, reduce)
+
+
+def _beta(close: np.ndarray, benchmark: np.ndarray, period: int) -> np.ndarray:
+    returns, market = close / shift(close) - 1.0, benchmark / shift(benchmark) - 1.0
+    covariance = rolling_mean(returns * market, period) - rolling_mean(returns, period) * rolling_mean(market, period)
+    variance = rolling_mean(market * market, period) - rolling_mean(market, period) ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return covariance / variance
+
+
+def split_factors(index: pd.DatetimeIndex, splits) -> np.ndarray:
+    """Divisor per date that turns raw prices into split-adjusted ones.
+
+    `splits` are records as returned by get_historical_splits_data
+    ({"date": "YYYY-MM-DD", "split": "4.000000/1.000000"}); each split divides
+    the prices of every earlier date by its ratio."""
+    factors = np.ones(len(index))
+    for split in splits or []:
+        try:
+            new, old = (float(part) for part in str(split["split"]).split("/"))
+            ratio = new / old
+        except (KeyError, TypeError, ValueError, ZeroDivisionError):
+            continue
+        if ratio > 0:
+            factors[index < pd.Timestamp(split["date"])] *= ratio
+    return factors
+
+
+def _aggregate(df_data: pd.DataFrame, agg_period: str) -> pd.DataFrame:
+    """OHLCV bars per week or month, each labelled with its first trading date."""
+    if agg_period in (None, "d"):
+        return df_data
+    groups = df_data.index.to_period("W" if agg_period == "w" else "M")
+    bars = df_data.groupby(groups).agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+    bars.index = pd.DatetimeIndex(pd.Series(df_data.index, index=groups).groupby(level=0).first().to_numpy())
+    return bars
+
+
+def compute_indicator(
+    df_data: pd.DataFrame,
+    function: str,
+    period: int = 50,
+    splitadjusted_only: str = "0",
+    agg_period: str = None,
+    fast_kperiod: int = None,
+    slow_kperiod: int = None,
+    slow_dperiod: int = None,
+    fast_dperiod: int = None,
+    fast_period: int = None,
+    slow_period: int = None,
+    signal_period: int = None,
+    acceleration: float = None,
+    maximum: float = None,
+    splits: list = None,
+    benchmark: pd.Series = None,
+) -> pd.DataFrame:
+    """Compute a technical/ endpoint function over an EOD history.
+
+    `df_data` holds open/high/low/close/adjusted_close/volume on a
+    DatetimeIndex (as HistoryStore stores it). Parameters and defaults are
+    those of the endpoint. Prices are adjusted for splits and dividends
+    (adjusted_close, with open/high/low scaled alike); with
+    splitadjusted_only="1" or for "splitadjusted", for splits only, which needs
+    the symbol's `splits`. "beta" needs the `benchmark` close prices.
+
+    Returns a DataFrame with the function's output columns, NaN during the
+    warm-up period of the indicator."""
+    function = "dmi" if function == "dx" else function
+    if function not in FUNCTIONS:
+        raise ValueError(f"Function {function} cannot be computed locally. Available: {list(FUNCTIONS)}")
+
+    df_data = df_data.sort_index()
+    close = df_data["close"].to_numpy(dtype=np.float64)
+    if function == "splitadjusted" or str(splitadjusted_only) in ("1", "True", "true"):
+        price = close / split_factors(df_data.index, splits)
+    else:
+        price = df_data["adjusted_close"].to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(close == 0, 1.0, price / close)
+
+    prices = {
+        "open": df_data["open"].to_numpy(dtype=np.float64) * ratio,
+        "high": df_data["high"].to_numpy(dtype=np.float64) * ratio,
+        "low": df_data["low"].to_numpy(dtype=np.float64) * ratio,
+        "close": price,
+        "volume": df_data["volume"].to_numpy(dtype=np.float64),
+    }
+
+    if function == "splitadjusted":
+        bars = pd.DataFrame(prices, index=df_data.index)
+        bars["volume"] = bars["volume"] * split_factors(df_data.index, splits)
+        return _aggregate(bars, agg_period)
+
+    if function == "stochastic":
+        fast_k = _stoch(price, prices["low"], prices["high"], fast_kperiod or 14)
+        slow_k = rolling_mean(fast_k, slow_kperiod or 3)
+        values = (slow_k, rolling_mean(slow_k, slow_dperiod or 3))
+    elif function == "stochrsi":
+        rsi = _rsi(price, period)
+        fast_k = _stoch(rsi, rsi, rsi, fast_kperiod or 14)
+        values = (fast_k, rolling_mean(fast_k, fast_dperiod or 14))
+    elif function == "macd":
+        macd = _ema(price, fast_period or 12) - _ema(price, slow_period or 26)
+        signal = _ema(macd, signal_period or 9)
+        values = (macd, signal, macd - signal)
+    elif function == "bbands":
+        middle, deviation = rolling_mean(price, period), rolling_std(price, period, ddof=0)
+        values = (middle + 2.0 * deviation, middle, middle - 2.0 * deviation)
+    elif function == "dmi":
+        values = _dmi(prices, period)
+    elif function == "adx":
+        values = (_wilder(_dmi(prices, period)[0], period),)
+    elif function == "sar":
+        values = (_sar(prices["high"], prices["low"], acceleration or 0.02, maximum or 0.2),)
+    elif function == "beta":
+        if benchmark is None:
+            raise ValueError("beta needs the benchmark close prices.")
+        aligned = benchmark.reindex(df_data.index).ffill().to_numpy(dtype=np.float64)
+        values = (_beta(price, aligned, period),)
+    else:
+        single = {
+            "avgvol": lambda: rolling_mean(prices["volume"], period),
+            "avgvolccy": lambda: rolling_mean(prices["volume"] * close, period),
+            "sma": lambda: rolling_mean(price, period),
+            "ema": lambda: _ema(price, period),
+            "wma": lambda: _windows(price, period, lambda w: w @ np.arange(1.0, period + 1) / (period * (period + 1) / 2)),
+            "volatility": lambda: rolling_std(np.log(price / shift(price)), period, ddof=0) * np.sqrt(252) * 100,
+            "rsi": lambda: _rsi(price, period),
+            "stddev": lambda: rolling_std(price, period, ddof=0),
+            "slope": lambda: _slope(price, period),
+            "atr": lambda: _wilder(_true_range(prices), period),
+            "cci": lambda: _cci(prices, period),
+        }
+        values = (single[function](),)
+
+    return pd.DataFrame(dict(zip(FUNCTIONS[function], values)), index=df_data.index)
+
+
+class TechnicalIndicators:
+    """Computes technical/ endpoint indicators locally from EOD history.
+
+    get_technical_indicator_data takes the same function names, parameters and
+    defaults as APIClient.get_technical_indicator_data and returns records in
+    the endpoint's format ([{"date": ..., "<output>": ...}], warm-up rows
+    left out), so it can replace the remote call without spending a request
+    per indicator::
+
+        local = TechnicalIndicators(client, store=HistoryStore(client, "data/eod"))
+        rsi = local.get_technical_indicator_data("AAPL.US", "rsi", period=14)
+
+    Histories come from `store` (HistoryStore.sync, one incremental update per
+    symbol) or else from client.get_eod_historical_stock_market_data, and are
+    kept in memory for the `max_cached` most recently used symbols, so
+    computing many indicators for one symbol loads it once. Splits (for
+    splitadjusted_only / splitadjusted) and beta's benchmark are fetched
+    through `client` and cached alike. Call clear() to reload.
+    """
+
+    def __init__(self, client, store=None, max_cached: int = 128) -> None:
+        if isinstance(max_cached, bool) or not isinstance(max_cached, int) or max_cached < 1:
+            raise ValueError("max_cached must be a positive integer.")
+        self._client = client
+        self._store = store
+        self._max_cached = max_cached
+        self._cached = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cached.clear()
+
+    def _memoized(self, key, load):
+        with self._lock:
+            if key in self._cached:
+                self._cached.move_to_end(key)
+                return self._cached[key]
+        value = load()
+        with self._lock:
+            self._cached[key] = value
+            while len(self._cached) > self._max_cached:
+                self._cached.popitem(last=False)
+        return value
+
+    def _load_history(self, ticker: str) -> pd.DataFrame:
+        if self._store is not None:
+            return self._store.sync(ticker)
+        records = self._client.get_eod_historical_stock_market_data(ticker, period="d")
+        if not isinstance(records, list) or not records:
+            raise ValueError(f"No EOD data for {ticker}.")
+        df_data = pd.DataFrame.from_records(records).dropna(subset=["date"])
+        df_data.index = pd.DatetimeIndex(pd.to_datetime(df_data["date"], format="%Y-%m-%d"), name="date")
+        columns = ["open", "high", "low", "close", "adjusted_close", "volume"]
+        return df_data.reindex(columns=columns).apply(pd.to_numeric, errors="coerce").astype("float64").sort_index()
+
+    def history(self, ticker: str) -> pd.DataFrame:
+        """The EOD history indicators of `ticker` are computed from."""
+        return self._memoized(("eod", ticker), lambda: self._load_history(ticker))
+
+    def _splits(self, ticker: str) -> list:
+        return self._memoized(("splits", ticker), lambda: self._client.get_historical_splits_data(ticker) or [])
+
+    def get_technical_indicator_data(
+        self,
+        ticker: str,
+        function: str,
+        period: int = 50,
+        date_from: str = None,
+        date_to: str = None,
+        order: str = "a",
+        splitadjusted_only: str = "0",
+        agg_period: str = None,
+        fast_kperiod: int = None,
+        slow_kperiod: int = None,
+        slow_dperiod: int = None,
+        fast_dperiod: int = None,
+        fast_period: int = None,
+        slow_period: int = None,
+        signal_period: int = None,
+        acceleration: float = None,
+        maximum: float = None,
+        code2: str = "GSPC.INDX",
+    ) -> list:
+        """Local equivalent of APIClient.get_technical_indicator_data (see there for the
+        parameters); `code2` is beta's benchmark symbol."""
+        if ticker is None or str(ticker).strip() == "":
+            raise ValueError("Ticker is empty. You need to add ticker to args")
+        if function is None or str(function).strip() == "":
+            raise ValueError("Function is empty. You need to add function to args")
+        function = str(function).strip().lower()
+        if order not in ("a", "d"):
+            raise ValueError("order must be 'a' (asc) or 'd' (desc)")
+        if agg_period is not None and agg_period not in ("d", "w", "m"):
+            raise ValueError("agg_period must be in ['d', 'w', 'm']")
+        try:
+            period = int(period)
+        except (TypeError, ValueError):
+            raise ValueError("period must be an integer")
+        if period < 2 or period > 100000:
+            raise ValueError("period must be in range [2..100000]")
+
+        ticker = str(ticker).strip()
+        needs_splits = function == "splitadjusted" or str(splitadjusted_only) in ("1", "True", "true")
+        benchmark = None
+        if function == "beta":
+            benchmark = self.history(code2)["adjusted_close"]
+
+        df_result = compute_indicator(
+            self.history(ticker),
+            function,
+            period=period,
+            splitadjusted_only=splitadjusted_only,
+            agg_period=agg_period,
+            fast_kperiod=fast_kperiod,
+            slow_kperiod=slow_kperiod,
+            slow_dperiod=slow_dperiod,
+            fast_dperiod=fast_dperiod,
+            fast_period=fast_period,
+            slow_period=slow_period,
+            signal_period=signal_period,
+            acceleration=acceleration,
+            maximum=maximum,
+            splits=self._splits(ticker) if needs_splits else None,
+            benchmark=benchmark,
+        )
+
+        df_result = df_result.replace([np.inf, -np.inf], np.nan).dropna()
+        if date_from is not None:
+            df_result = df_result[df_result.index >= pd.Timestamp(date_from)]
+        if date_to is not None:
+            df_result = df_result[df_result.index <= pd.Timestamp(date_to)]
+        if order == "d":
+            df_result = df_result.iloc[::-1]
+
+        dates = df_result.index.strftime("%Y-%m-%d")
+        columns = {column: df_result[column].tolist() for column in df_result.columns}
+        return [
+            {"date": day, **{column: values[row] for column, values in columns.items()}}
+            for row, day in enumerate(dates)
+        ]
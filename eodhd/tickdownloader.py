@@ -0,0 +1,160 @@
+"""tickdownloader.py"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+from eodhd.ticks import empty_ticks
+from eodhd.timeutils import unix_time
+
+
+class TickDownloader:
+    """Resumable, concurrent download of US tick data over long time ranges.
+
+    The range is cut into `chunk_seconds` windows that are fetched with
+    APIClient.get_stock_market_tick_data on up to `max_workers` threads. Each
+    finished window is written to its own compressed NumPy file (a structured
+    array, see eodhd.ticks) and recorded in ``checkpoint.json``, so re-running an
+    interrupted download only fetches the windows that are still missing::
+
+        downloader = TickDownloader(APIClient(api_key), "data/ticks")
+        downloader.download("AAPL.US", "2024-03-01", "2024-03-08")
+        ticks = downloader.load("AAPL.US")
+
+    Files live under ``directory/<symbol>/``.
+    """
+
+    CHECKPOINT = "checkpoint.json"
+
+    def __init__(self, client, directory: str, chunk_seconds: int = 3600, max_workers: int = 4) -> None:
+        if isinstance(chunk_seconds, bool) or not isinstance(chunk_seconds, int) or chunk_seconds < 1:
+            raise ValueError("chunk_seconds must be a positive integer.")
+        if isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+
+        self._client = client
+        self._directory = directory
+        self._chunk_seconds = chunk_seconds
+        self._max_workers = max_workers
+
+    def symbol_directory(self, symbol: str) -> str:
+        if symbol is None or str(symbol).strip() == "":
+            raise ValueError("symbol is empty. Need to add symbol to args")
+        name = str(symbol).strip().replace("/", "_").replace(os.sep, "_")
+        return os.path.join(self._directory, name)
+
+    def chunks(self, start, end) -> list:
+        """Consecutive [from, to) windows of chunk_seconds covering [start, end)."""
+        start, end = unix_time(start), unix_time(end)
+        if start >= end:
+            raise ValueError("start must be before end.")
+        return [(t, min(t + self._chunk_seconds, end)) for t in range(start, end, self._chunk_seconds)]
+
+    @staticmethod
+    def _chunk_name(chunk) -> str:
+        return f"{chunk[0]}_{chunk[1]}.npz"
+
+    @staticmethod
+    def _write_json(path: str, data) -> None:
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(data, file)
+        os.replace(tmp_path, path)
+
+    def load_checkpoint(self, symbol: str) -> dict:
+        """The checkpoint of `symbol` ({start, end, chunk_seconds, done}), or None if there is none."""
+        path = os.path.join(self.symbol_directory(symbol), self.CHECKPOINT)
+        if not os.path.exists(path):
+            return None
+        with open(path) as file:
+            return json.load(file)
+
+    def _fetch_chunk(self, symbol: str, chunk) -> np.ndarray:
+        """Fetch one window; keep only ticks inside [from, to) so adjacent windows never overlap."""
+        ticks = self._client.get_stock_market_tick_data(symbol, chunk[0], chunk[1], output="numpy")
+        if "ts" not in (ticks.dtype.names or ()):
+            return ticks
+        keep = (ticks["ts"] >= chunk[0] * 10 ** 9) & (ticks["ts"] < chunk[1] * 10 ** 9)
+        return ticks[keep]
+
+    def _save_chunk(self, directory: str, chunk, ticks: np.ndarray) -> None:
+        path = os.path.join(directory, self._chunk_name(chunk))
+        tmp_path = path + ".tmp.npz"
+        np.savez_compressed(tmp_path, ticks=ticks)
+        os.replace(tmp_path, path)
+
+    def download(self, symbol: str, start, end) -> dict:
+        """Download every window of [start, end) not yet on disk for `symbol`.
+
+        start/end are UNIX seconds, dates/datetimes or ISO strings (UTC). A
+        window that fails is left out of the checkpoint and retried by the next
+        call; the others are kept. Returns {"chunks", "downloaded", "skipped",
+        "failed": {(from, to): error}}. Raises ValueError if the directory holds
+        a checkpoint for a different range or chunk size."""
+        chunks = self.chunks(start, end)
+        directory = self.symbol_directory(symbol)
+        os.makedirs(directory, exist_ok=True)
+
+        params = {"symbol": symbol, "start": chunks[0][0], "end": chunks[-1][1], "chunk_seconds": self._chunk_seconds}
+        checkpoint = self.load_checkpoint(symbol)
+        if checkpoint is None:
+            checkpoint = dict(params, done=[])
+        elif any(checkpoint.get(key) != value for key, value in params.items()):
+            raise ValueError(
+                f"{directory} holds a checkpoint for another download "
+                f"({checkpoint.get('start')}..{checkpoint.get('end')}, chunk_seconds={checkpoint.get('chunk_seconds')})."
+            )
+
+        done = set(checkpoint["done"])
+        pending = [
+            chunk for chunk in chunks
+            if self._chunk_name(chunk) not in done or not os.path.exists(os.path.join(directory, self._chunk_name(chunk)))
+        ]
+        summary = {"chunks": len(chunks), "downloaded": 0, "skipped": len(chunks) - len(pending), "failed": {}}
+        if not pending:
+            return summary
+
+        workers = min(self._max_workers, len(pending))
+        ensure_pool_size = getattr(self._client, "_ensure_pool_size", None)
+        if ensure_pool_size is not None:
+            ensure_pool_size(workers)
+
+        checkpoint_path = os.path.join(directory, self.CHECKPOINT)
+        self._write_json(checkpoint_path, dict(checkpoint, done=sorted(done)))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eodhd-ticks") as executor:
+            futures = {executor.submit(self._fetch_chunk, symbol, chunk): chunk for chunk in pending}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    # Results are handled on this thread only, so the checkpoint needs no lock.
+                    self._save_chunk(directory, chunk, future.result())
+                    done.add(self._chunk_name(chunk))
+                    self._write_json(checkpoint_path, dict(checkpoint, done=sorted(done)))
+                except Exception as err:
+                    summary["failed"][chunk] = err
+                    continue
+                summary["downloaded"] += 1
+
+        return summary
+
+    def load(self, symbol: str) -> np.ndarray:
+        """All downloaded ticks of `symbol` in time order, as one structured array (see eodhd.ticks)."""
+        checkpoint = self.load_checkpoint(symbol)
+        if checkpoint is None:
+            return empty_ticks()
+
+        directory = self.symbol_directory(symbol)
+        parts = []
+        for name in sorted(checkpoint["done"], key=lambda name: int(name.split("_")[0])):
+            with np.load(os.path.join(directory, name)) as chunk:
+                if len(chunk["ticks"]):
+                    parts.append(chunk["ticks"])
+        if not parts:
+            return empty_ticks()
+
+        # Text fields may have different widths per chunk; promote to a common dtype.
+        dtype = np.result_type(*(part.dtype for part in parts))
+        return np.concatenate([part.astype(dtype) for part in parts])
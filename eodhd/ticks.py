@@ -0,0 +1,111 @@
+"""ticks.py"""
+
+import numpy as np
+
+from eodhd.decoders import to_columns
+
+# Known tick fields: response name -> (output name, dtype). Text fields get a
+# fixed-width unicode dtype sized to the longest value in the payload.
+TICK_FIELDS = {
+    "ts": ("ts", np.int64),
+    "timestamp": ("ts", np.int64),
+    "price": ("price", np.float64),
+    "shares": ("shares", np.int32),
+    "size": ("shares", np.int32),
+    "seq": ("seq", np.int64),
+    "ex": ("ex", np.str_),
+    "mkt": ("mkt", np.str_),
+    "sub_mkt": ("sub_mkt", np.str_),
+    "sl": ("sl", np.str_),
+}
+
+
+_NS_PER_UNIT = {"s": 10 ** 9, "ms": 10 ** 6, "us": 10 ** 3, "ns": 1}
+
+
+def _to_ns(values: np.ndarray, unit: str = "auto") -> np.ndarray:
+    """Epoch timestamps in `unit` -> int64 ns. unit="auto" detects s, ms, us or ns from
+    the magnitude of the values, which assumes dates after 1973."""
+    values = np.asarray(values, dtype=np.int64)
+    if unit != "auto":
+        return values * _NS_PER_UNIT[unit]
+    nonzero = values[values != 0]
+    if len(nonzero) == 0:
+        return values
+    magnitude = int(np.abs(nonzero[0]))
+    for limit, factor in ((10 ** 11, 10 ** 9), (10 ** 14, 10 ** 6), (10 ** 17, 10 ** 3)):
+        if magnitude < limit:
+            return values * factor
+    return values
+
+
+def _numeric(values: list, dtype) -> np.ndarray:
+    try:
+        return np.asarray(values, dtype=dtype)
+    except (TypeError, ValueError):
+        # Missing values: NaN for floats, 0 for integers.
+        as_float = np.asarray([np.nan if value is None else value for value in values], dtype=np.float64)
+        if np.issubdtype(dtype, np.integer):
+            as_float = np.nan_to_num(as_float, nan=0.0)
+        return as_float.astype(dtype)
+
+
+def _text(values: list) -> np.ndarray:
+    return np.asarray(["" if value is None else str(value) for value in values], dtype=np.str_)
+
+
+def _columns(payload) -> dict:
+    """Parallel arrays of a ticks payload: {field: [...]} as returned by /ticks, or an
+    envelope whose `data` is either that or a list of tick records."""
+    if isinstance(payload, dict) and "data" in payload and not isinstance(payload.get("ts"), list):
+        payload = payload["data"]
+    if isinstance(payload, list):
+        return {field: list(values) for field, values in to_columns(payload).items()} if payload else {}
+    if isinstance(payload, dict):
+        return {field: values for field, values in payload.items() if isinstance(values, (list, np.ndarray))}
+    raise ValueError("Unrecognised tick data payload.")
+
+
+def ticks_to_numpy(payload, ts_unit: str = "auto") -> np.ndarray:
+    """Convert a tick data payload into a NumPy structured array, one row per tick.
+
+    Columns are converted directly from the payload's parallel arrays:
+    ``ts`` int64 nanoseconds since the epoch (UTC), ``price`` float64,
+    ``shares`` int32, ``seq`` int64, text fields (``ex``, ``mkt``, ``sub_mkt``,
+    ``sl``) fixed-width unicode; other fields keep the dtype NumPy infers.
+    Known fields come first, in that order. `ts_unit` is the unit of the
+    payload's timestamps ("s", "ms", "us", "ns"); "auto" infers it."""
+    if ts_unit != "auto" and ts_unit not in _NS_PER_UNIT:
+        raise ValueError(f"ts_unit must be 'auto' or one of {list(_NS_PER_UNIT)}.")
+    columns = _columns(payload)
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("Tick data fields have different lengths.")
+
+    arrays = {}
+    for field, values in columns.items():
+        name, dtype = TICK_FIELDS.get(field, (field, None))
+        if name in arrays:
+            continue
+        if name == "ts":
+            arrays[name] = _to_ns(_numeric(values, np.int64), ts_unit)
+        elif dtype is np.str_:
+            arrays[name] = _text(values)
+        elif dtype is not None:
+            arrays[name] = _numeric(values, dtype)
+        else:
+            array = np.asarray(values)
+            arrays[name] = _text(values) if array.dtype == object else array
+
+    order = list(dict.fromkeys(name for name, _ in TICK_FIELDS.values()))
+    names = [name for name in order if name in arrays] + [name for name in arrays if name not in order]
+
+    result = np.empty(lengths.pop() if lengths else 0, dtype=[(name, arrays[name].dtype) for name in names])
+    for name in names:
+        result[name] = arrays[name]
+    return result
+
+
+def empty_ticks() -> np.ndarray:
+    """A zero-length tick array with the standard ts/price/shares fields."""
+    return np.empty(0, dtype=[("ts", np.int64), ("price", np.float64), ("shares", np.int32)])
@@ -0,0 +1,27 @@
+"""timeutils.py"""
+
+from datetime import date, datetime, timezone
+
+
+def unix_time(value) -> int:
+    """UNIX seconds for an int/str timestamp, a datetime/date, or a YYYY-MM-DD[THH:MM:SS] string (naive = UTC)."""
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid time: {value!r}")
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, date):
+        moment = datetime(value.year, value.month, value.day)
+    elif isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    elif isinstance(value, str):
+        try:
+            moment = datetime.fromisoformat(value.strip())
+        except ValueError as err:
+            raise ValueError(f"Invalid time (UNIX seconds or YYYY-MM-DD[THH:MM:SS]): {value!r}") from err
+    else:
+        raise ValueError(f"Invalid time: {value!r}")
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
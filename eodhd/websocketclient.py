@@ -6,8 +6,50 @@ import json
 import re
 import pandas as pd
 
+from eodhd.bars import BarAggregator, parse_interval, parse_trade
+from eodhd.errors import EODHDConnectionError
+from eodhd.eventqueue import EventQueue, StreamEvent
+from eodhd.ringbuffer import TickBuffers
+
 pd.set_option('display.float_format', '{:.8f}'.format)
 
+ENDPOINTS = ("us", "us-quote", "forex", "crypto")
+
+# Symbols one connection may subscribe to.
+MAX_SYMBOLS = 50
+
+STREAM_URL = "wss://ws.eodhistoricaldata.com/ws/{endpoint}?api_token={api_key}"
+
+
+def validate_symbols(symbols) -> None:
+    # Validate individual symbols
+    prog = re.compile(r"^[A-z0-9-$]{1,48}$")
+    for symbol in symbols:
+        if not isinstance(symbol, str) or not prog.match(symbol):
+            raise ValueError(f"Symbol is invalid: {symbol}")
+
+
+def validate_subscription(api_key: str, endpoint: str, symbols, max_symbols: int = MAX_SYMBOLS) -> None:
+    """Check the arguments of a stream client; raise ValueError on the first problem."""
+    # Validate API key
+    prog = re.compile(r"^[A-z0-9.]{16,32}$")
+    if not isinstance(api_key, str) or not prog.match(api_key):
+        raise ValueError("API key is invalid")
+
+    # Validate endpoint
+    if endpoint not in ENDPOINTS:
+        raise ValueError("Endpoint is invalid")
+
+    # Validate symbol list
+    if len(symbols) == 0:
+        raise ValueError("No symbol(s) provided")
+
+    validate_symbols(symbols)
+
+    # Validate max symbol subscriptions
+    if max_symbols is not None and len(symbols) > max_symbols:
+        raise ValueError(f"Max symbol subscription count is {max_symbols}!")
+
 
 class WebSocketClient:
     def __init__(
@@ -22,29 +64,17 @@ class WebSocketClient:
         display_candle_1h: bool = False,
         max_reconnect_attempts: int = 5,
         reconnect_base_delay: float = 1.0,
+        buffer_capacity: int = None,
+        on_tick=None,
+        on_candle=None,
+        on_error=None,
+        candle_intervals: tuple = ("1 minute",),
+        queue_size: int = None,
+        queue_policy: str = "drop-oldest",
     ) -> None:
-        # Validate API key
-        prog = re.compile(r"^[A-z0-9.]{16,32}$")
-        if not prog.match(api_key):
-            raise ValueError("API key is invalid")
-
-        # Validate endpoint
-        if endpoint not in ["us", "us-quote", "forex", "crypto"]:
-            raise ValueError("Endpoint is invalid")
-
-        # Validate symbol list
-        if len(symbols) == 0:
-            raise ValueError("No symbol(s) provided")
-
-        # Validate individual symbols
-        prog = re.compile(r"^[A-z0-9-$]{1,48}$")
-        for symbol in symbols:
-            if not prog.match(symbol):
-                raise ValueError(f"Symbol is invalid: {symbol}")
-
-        # Validate max symbol subscriptions
-        if len(symbols) > 50:
-            raise ValueError("Max symbol subscription count is 50!")
+        validate_subscription(api_key, endpoint, symbols)
+        for interval in candle_intervals:
+            parse_interval(interval)
 
         # Map class arguments to private variables
         self._api_key = api_key
@@ -57,6 +87,10 @@ class WebSocketClient:
         self._display_candle_1h = display_candle_1h
         self._max_reconnect_attempts = max_reconnect_attempts
         self._reconnect_base_delay = reconnect_base_delay
+        self._on_tick = on_tick
+        self._on_candle = on_candle
+        self._on_error = on_error
+        self._candle_intervals = tuple(dict.fromkeys(candle_intervals))
 
         self.running = True
         self.message = None
@@ -64,6 +98,17 @@ class WebSocketClient:
         self.data_list = []
         self.ws = None
 
+        # Bounded storage: the last `buffer_capacity` ticks per symbol instead of data_list.
+        self.buffers = TickBuffers(buffer_capacity) if buffer_capacity is not None else None
+
+        # Events for consumers on other threads: StreamEvent(kind, symbol, interval, data).
+        self.events = EventQueue(queue_size, queue_policy) if queue_size is not None else None
+
+        # symbol -> tuple of (name, indicator, interval, callback); replaced, never mutated,
+        # so the receive thread can read it without locking.
+        self._indicators = {}
+        self._indicators_lock = threading.Lock()
+
         # Register signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -72,6 +117,8 @@ class WebSocketClient:
         print("Stopping websocket...")
         self.running = False
         self.stop_event.set()
+        if self.events is not None:
+            self.events.close()
         if self.ws is not None:
             try:
                 self.ws.close()
@@ -79,39 +126,13 @@ class WebSocketClient:
                 pass
         print("Websocket stopped.")
 
-    def _floor_to_nearest_interval(self, timestamp_ms, interval):
-        # Convert to seconds
-        timestamp_s = timestamp_ms // 1000
-
-        # Define the number of seconds for each interval
-        seconds_per_minute = 60
-        seconds_per_hour = seconds_per_minute * 60
-
-        # Determine the number of seconds for the given interval
-        if interval == "1 minute":
-            interval_seconds = seconds_per_minute
-        elif interval == "5 minutes":
-            interval_seconds = 5 * seconds_per_minute
-        elif interval == "1 hour":
-            interval_seconds = seconds_per_hour
-        else:
-            raise ValueError(f"Unsupported interval: {interval}")
-
-        # Floor to the nearest interval
-        floored_s = (timestamp_s // interval_seconds) * interval_seconds
-
-        # Convert back to milliseconds
-        floored_ms = floored_s * 1000
-
-        return floored_ms
-
     def _collect_data(self):
         attempt = 0
 
         while not self.stop_event.is_set():
             try:
                 self.ws = websocket.create_connection(
-                    f"wss://ws.eodhistoricaldata.com/ws/{self._endpoint}?api_token={self._api_key}"
+                    STREAM_URL.format(endpoint=self._endpoint, api_key=self._api_key)
                 )
 
                 # Send the subscription message
@@ -125,9 +146,7 @@ class WebSocketClient:
                 attempt = 0
 
                 # Reset candle state on each (re)connection — partial candles are misleading
-                candle_1m = {}
-                candle_5m = {}
-                candle_1h = {}
+                candles = self._new_candle_state()
 
                 # Collect data until the stop event is set
                 while not self.stop_event.is_set():
@@ -138,28 +157,12 @@ class WebSocketClient:
                         websocket.WebSocketException,
                         ConnectionError,
                         OSError,
-                    ):
+                    ) as err:
+                        if not self.stop_event.is_set():
+                            self._report_error(err)
                         break
 
-                    try:
-                        message_json = json.loads(self.message)
-                    except (json.JSONDecodeError, TypeError):
-                        continue
-
-                    if self._store_data:
-                        self.data_list.append(self.message)
-
-                    if self._display_stream:
-                        print(self.message)
-
-                    if self._display_candle_1m:
-                        self._update_candle(candle_1m, message_json, "1 minute", 60)
-
-                    if self._display_candle_5m:
-                        self._update_candle(candle_5m, message_json, "5 minutes", 60)
-
-                    if self._display_candle_1h:
-                        self._update_candle(candle_1h, message_json, "1 hour", 60)
+                    self._process_message(self.message, candles)
 
             except (
                 websocket.WebSocketException,
@@ -168,9 +171,13 @@ class WebSocketClient:
             ) as err:
                 if self.stop_event.is_set():
                     break
+                self._report_error(err)
                 attempt += 1
                 if attempt > self._max_reconnect_attempts:
                     print(f"Max reconnect attempts ({self._max_reconnect_attempts}) reached. Giving up.")
+                    self._report_error(EODHDConnectionError(
+                        f"Max reconnect attempts ({self._max_reconnect_attempts}) reached: {err}"
+                    ))
                     self.running = False
                     self.stop_event.set()
                     break
@@ -185,34 +192,139 @@ class WebSocketClient:
             except Exception:
                 pass
 
-    def _update_candle(self, candle, message_json, interval_name, granularity):
-        if "t" in message_json:
-            candle_date = self._floor_to_nearest_interval(message_json["t"], interval_name)
-
-            if "t" in candle and (candle_date != candle["t"]):
-                print(candle)
-                candle.clear()
-
-            candle["t"] = candle_date
-
-        if "s" in message_json:
-            candle["m"] = message_json["s"]
-            candle["g"] = granularity
-
-        if "p" in message_json and "o" not in candle:
-            candle["o"] = message_json["p"]
-            candle["h"] = message_json["p"]
-            candle["l"] = message_json["p"]
-            candle["c"] = message_json["p"]
-            if "q" in message_json:
-                candle["v"] = float(message_json["q"])
-        elif "p" in message_json and "o" in candle:
-            candle["c"] = message_json["p"]
-            if message_json["p"] > candle["h"]:
-                candle["h"] = message_json["p"]
-            if message_json["p"] < candle["l"]:
-                candle["l"] = message_json["p"]
-            candle["v"] += float(message_json["q"])
+    @staticmethod
+    def _new_candle_state() -> dict:
+        """Candles under construction: a time BarAggregator per interval, created when first
+        needed, shared by the displayed candles, indicators, on_candle and the event queue."""
+        return {}
+
+    def _process_message(self, message, candles: dict) -> None:
+        try:
+            message_json = json.loads(message)
+        except (json.JSONDecodeError, TypeError):
+            return
+
+        trade = parse_trade(message_json)
+
+        if self.buffers is not None:
+            if trade is not None:
+                symbol, price, size, timestamp = trade
+                self.buffers.append(symbol, timestamp if timestamp is not None else int(time.time() * 1000), price, size)
+        elif self._store_data:
+            self.data_list.append(message)
+
+        if self._display_stream:
+            print(message)
+
+        if trade is None:
+            return
+        symbol, price, size, timestamp = trade
+        attached = self._indicators.get(symbol, ())
+        candle_consumers = self._on_candle is not None or self.events is not None
+        displayed = [
+            interval for enabled, interval in (
+                (self._display_candle_1m, "1 minute"),
+                (self._display_candle_5m, "5 minutes"),
+                (self._display_candle_1h, "1 hour"),
+            ) if enabled
+        ]
+
+        # Per-symbol candles, each updated once per message for every interval anyone needs.
+        closed = {}
+        if timestamp is not None:
+            intervals = set(displayed)
+            intervals.update(entry[2] for entry in attached)
+            if candle_consumers:
+                intervals.update(self._candle_intervals)
+            for interval in intervals:
+                aggregator = candles.get(interval)
+                if aggregator is None:
+                    aggregator = candles[interval] = BarAggregator("time", interval)
+                closed[interval] = aggregator.update(symbol, price, size, timestamp)
+
+        for interval in displayed:
+            if closed.get(interval) is not None:
+                print(closed[interval])
+
+        if self._on_tick is not None or self.events is not None:
+            self._emit(self._on_tick, StreamEvent("tick", symbol, None, message_json))
+        if candle_consumers:
+            for interval in self._candle_intervals:
+                if closed.get(interval) is not None:
+                    self._emit(self._on_candle, StreamEvent("candle", symbol, interval, closed[interval]))
+        if attached:
+            self._update_indicators(symbol, price, size, timestamp, attached, closed)
+
+    def _emit(self, callback, event: StreamEvent) -> None:
+        """Hand an event to its callback (on_tick(symbol, message) or
+        on_candle(symbol, interval, candle)) and to the event queue."""
+        if callback is not None:
+            try:
+                if event.kind == "tick":
+                    callback(event.symbol, event.data)
+                else:
+                    callback(event.symbol, event.interval, event.data)
+            except Exception as err:
+                self._report_error(err, f"{event.kind} callback for {event.symbol} failed: {err!r}")
+        if self.events is not None:
+            self.events.put(event)
+
+    def _report_error(self, err: Exception, message: str = None) -> None:
+        """Pass a connection or callback error to on_error and the event queue;
+        without on_error, print `message` instead."""
+        if self._on_error is not None:
+            try:
+                self._on_error(err)
+            except Exception as callback_err:
+                print(f"on_error callback failed: {callback_err!r}")
+        elif message is not None:
+            print(message)
+        if self.events is not None:
+            self.events.put(StreamEvent("error", None, None, err))
+
+    def add_indicator(self, symbol: str, name: str, indicator, interval: str = "1 minute", callback=None) -> None:
+        """Attach a streaming indicator (see eodhd.streamindicators) to `symbol` under `name`.
+
+        The indicator is updated on the receive thread: on every trade of the
+        symbol (indicators with on="tick") or whenever one of the symbol's
+        `interval` candles closes (on="candle"); `interval` is anything
+        eodhd.bars.parse_interval accepts, such as "1 minute" or "15m". After each update
+        callback(symbol, name, value) is called if given; value is None while
+        the indicator warms up. Replaces an indicator of the same name."""
+        if symbol not in self._symbols:
+            raise ValueError(f"Symbol is not subscribed: {symbol}")
+        parse_interval(interval)
+        with self._indicators_lock:
+            attached = tuple(entry for entry in self._indicators.get(symbol, ()) if entry[0] != name)
+            self._indicators = {**self._indicators, symbol: attached + ((name, indicator, interval, callback),)}
+
+    def remove_indicator(self, symbol: str, name: str) -> None:
+        with self._indicators_lock:
+            attached = tuple(entry for entry in self._indicators.get(symbol, ()) if entry[0] != name)
+            indicators = dict(self._indicators)
+            if attached:
+                indicators[symbol] = attached
+            else:
+                indicators.pop(symbol, None)
+            self._indicators = indicators
+
+    def indicator_values(self, symbol: str) -> dict:
+        """Current value of every indicator attached to `symbol`, by name."""
+        return {name: indicator.value for name, indicator, _, _ in self._indicators.get(symbol, ())}
+
+    def _update_indicators(self, symbol, price, size, timestamp, attached, closed: dict) -> None:
+        for name, indicator, interval, callback in attached:
+            if indicator.on == "tick":
+                value = indicator.on_tick(price, size, timestamp)
+            elif closed.get(interval) is not None:
+                value = indicator.on_candle(closed[interval])
+            else:
+                continue
+            if callback is not None:
+                try:
+                    callback(symbol, name, value)
+                except Exception as err:
+                    self._report_error(err, f"Indicator callback {name} for {symbol} failed: {err!r}")
 
     def _keepalive(self, interval=30):
         while not self.stop_event.is_set():
@@ -233,6 +345,9 @@ class WebSocketClient:
 
     def stop(self):
         self.stop_event.set()
+        if self.events is not None:
+            # Releases a receive thread blocked on a full queue.
+            self.events.close()
         if self.ws is not None:
             try:
                 self.ws.close()
@@ -242,6 +357,10 @@ class WebSocketClient:
         self.keepalive.join(timeout=5.0)
 
     def get_data(self):
+        """The stored messages: with buffer_capacity, a DataFrame of the buffered ticks
+        (see TickBuffers.to_frame); otherwise the list of raw messages (store_data=True)."""
+        if self.buffers is not None:
+            return self.buffers.to_frame()
         return self.data_list
 
 
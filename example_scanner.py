@@ -8,7 +8,7 @@ def main() -> None:
     """Main"""
 
     scanner = ScannerClient(cfg.API_KEY)
-    df_data = scanner.scan_markets("CC", "1d", "USD", 5000)
+    df_data = scanner.scan_markets("CC", "d", "USD", 5000)
     print(df_data)
 
 
@@ -38,6 +38,10 @@ setup(
         "numpy>=1.25.2",
         "matplotlib>=3.7.2",
     ],
+    extras_require={
+        "parquet": ["pyarrow>=14.0.0"],
+        "fast": ["orjson>=3.8.0"],
+    },
     entry_points={"console_scripts": ["eodhd=eodhd.__main__:main"]}
 
 )
@@ -0,0 +1,124 @@
+"""Tests for AsyncAPIClient."""
+
+import asyncio
+import inspect
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eodhd import APIClient, AsyncAPIClient
+from eodhd.errors import EODHDHTTPError
+
+
+@pytest.fixture
+def mock_session():
+    with patch("eodhd.apiclient.requests.Session") as MockSession:
+        session = MagicMock()
+        MockSession.return_value = session
+        yield session
+
+
+def _ok(data):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = data
+    return resp
+
+
+def test_mirrors_public_apiclient_methods(mock_session):
+    client = AsyncAPIClient(api_key="demo1234567890123456")
+    for name in ("get_eod_historical_stock_market_data", "get_fundamentals_data",
+                 "get_intraday_historical_data", "get_exchanges", "get_user_info"):
+        assert inspect.iscoroutinefunction(getattr(client, name))
+        assert getattr(AsyncAPIClient, name).__doc__ == getattr(APIClient, name).__doc__
+
+
+def test_invalid_max_concurrency(mock_session):
+    with pytest.raises(ValueError):
+        AsyncAPIClient(api_key="demo1234567890123456", max_concurrency=0)
+
+
+def test_call_returns_sync_result(mock_session):
+    mock_session.get.return_value = _ok([{"date": "2024-01-02", "close": 1.0}])
+
+    async def run():
+        async with AsyncAPIClient(api_key="demo1234567890123456") as client:
+            return await client.get_eod_historical_stock_market_data("AAPL.US", "d")
+
+    result = asyncio.run(run())
+
+    assert result == [{"date": "2024-01-02", "close": 1.0}]
+    assert "/eod/AAPL.US" in mock_session.get.call_args[0][0]
+    mock_session.close.assert_called_once()
+
+
+def test_errors_propagate(mock_session):
+    resp = MagicMock()
+    resp.status_code = 404
+    resp.text = "not found"
+    resp.json.side_effect = ValueError("no json")
+    mock_session.get.return_value = resp
+
+    async def run():
+        async with AsyncAPIClient(api_key="demo1234567890123456") as client:
+            await client.get_user_info()
+
+    with pytest.raises(EODHDHTTPError):
+        asyncio.run(run())
+
+
+def test_concurrency_is_bounded(mock_session):
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def slow_get(url, timeout=None):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return _ok({"ok": True})
+
+    mock_session.get.side_effect = slow_get
+
+    async def run():
+        async with AsyncAPIClient(api_key="demo1234567890123456", max_concurrency=3) as client:
+            return await asyncio.gather(*(client.get_user_info() for _ in range(12)))
+
+    results = asyncio.run(run())
+
+    assert len(results) == 12
+    assert mock_session.get.call_count == 12
+    assert 1 < state["peak"] <= 3
+
+
+def test_aclose_does_not_block_the_event_loop(mock_session):
+    def slow_get(url, timeout=None):
+        time.sleep(0.2)
+        return _ok({"ok": True})
+
+    mock_session.get.side_effect = slow_get
+
+    async def run():
+        client = AsyncAPIClient(api_key="demo1234567890123456")
+        request = asyncio.ensure_future(client.get_user_info())
+        await asyncio.sleep(0.02)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(tick())
+        await client.aclose()
+        ticker.cancel()
+        return ticks, await request
+
+    ticks, result = asyncio.run(run())
+    assert result == {"ok": True}
+    assert ticks > 5
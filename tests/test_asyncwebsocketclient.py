@@ -0,0 +1,171 @@
+"""Tests for AsyncWebSocketClient."""
+
+import asyncio
+import json
+
+import pytest
+from websockets.exceptions import ConnectionClosedError
+
+from eodhd import AsyncWebSocketClient
+from eodhd.errors import EODHDConnectionError
+
+API_KEY = "00000000000000000000000000000000"
+
+
+class FakeConnection:
+    """Stands in for a websockets connection: replays `messages`, then fails with `error` or ends."""
+
+    def __init__(self, messages, error=None):
+        self.messages = list(messages)
+        self.error = error
+        self.sent = []
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for message in self.messages:
+            await asyncio.sleep(0)
+            yield message
+        if self.error is not None:
+            raise self.error
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeConnect:
+    def __init__(self, *connections):
+        self.connections = list(connections)
+        self.urls = []
+        self.kwargs = []
+
+    def __call__(self, url, **kwargs):
+        self.urls.append(url)
+        self.kwargs.append(kwargs)
+        connection = self.connections.pop(0)
+        if isinstance(connection, Exception):
+            raise connection
+        return connection
+
+
+def _trade(symbol, price):
+    return json.dumps({"s": symbol, "p": price, "t": 0})
+
+
+def _closed():
+    return ConnectionClosedError(None, None)
+
+
+def test_validation_matches_websocketclient():
+    with pytest.raises(ValueError, match="API key is invalid"):
+        AsyncWebSocketClient("", "crypto", ["BTC-USD"])
+    with pytest.raises(ValueError, match="Endpoint is invalid"):
+        AsyncWebSocketClient(API_KEY, "bonds", ["BTC-USD"])
+    with pytest.raises(ValueError, match="Max symbol subscription count is 50!"):
+        AsyncWebSocketClient(API_KEY, "crypto", [f"S{i}" for i in range(51)])
+
+
+def test_iterates_parsed_messages():
+    connection = FakeConnection([_trade("BTC-USD", 1.0), "not json", _trade("ETH-USD", 2.0)])
+    connect = FakeConnect(connection)
+    client = AsyncWebSocketClient(API_KEY, "crypto", ["BTC-USD", "ETH-USD"], connect=connect)
+
+    async def run():
+        received = []
+        async with client:
+            async for message in client:
+                received.append(message)
+                if len(received) == 2:
+                    break
+        return received
+
+    received = asyncio.run(run())
+
+    assert [message["s"] for message in received] == ["BTC-USD", "ETH-USD"]
+    assert connect.urls == [f"wss://ws.eodhistoricaldata.com/ws/crypto?api_token={API_KEY}"]
+    assert connect.kwargs[0] == {"ping_interval": 20.0, "ping_timeout": 20.0}
+    assert connection.sent == [{"action": "subscribe", "symbols": "BTC-USD,ETH-USD"}]
+    assert connection.closed
+
+
+def test_reconnects_and_resubscribes_current_symbols():
+    first = FakeConnection([_trade("BTC-USD", 1.0)], error=_closed())
+    second = FakeConnection([_trade("ETH-USD", 2.0), _trade("XRP-USD", 3.0)])
+    connect = FakeConnect(first, OSError("refused"), second)
+    client = AsyncWebSocketClient(API_KEY, "crypto", ["BTC-USD"], reconnect_base_delay=0.0, connect=connect)
+
+    async def run():
+        received = []
+        async for message in client:
+            received.append(message["s"])
+            if len(received) == 1:
+                await client.subscribe(["ETH-USD", "XRP-USD"])
+                await client.unsubscribe(["BTC-USD"])
+            if len(received) == 3:
+                await client.close()
+        return received
+
+    assert asyncio.run(run()) == ["BTC-USD", "ETH-USD", "XRP-USD"]
+    assert first.sent == [
+        {"action": "subscribe", "symbols": "BTC-USD"},
+        {"action": "subscribe", "symbols": "ETH-USD,XRP-USD"},
+        {"action": "unsubscribe", "symbols": "BTC-USD"},
+    ]
+    assert second.sent == [{"action": "subscribe", "symbols": "ETH-USD,XRP-USD"}]
+    assert not client.connected
+
+
+def test_gives_up_after_max_reconnect_attempts():
+    connect = FakeConnect(*(OSError("refused") for _ in range(3)))
+    client = AsyncWebSocketClient(API_KEY, "crypto", ["BTC-USD"], max_reconnect_attempts=2,
+                                  reconnect_base_delay=0.0, connect=connect)
+
+    async def run():
+        async for _ in client:
+            pass
+
+    with pytest.raises(EODHDConnectionError):
+        asyncio.run(run())
+    assert len(connect.urls) == 3
+
+
+def test_subscribe_limits():
+    client = AsyncWebSocketClient(API_KEY, "crypto", [f"S{i}" for i in range(50)])
+
+    with pytest.raises(ValueError):
+        asyncio.run(client.subscribe(["EXTRA"]))
+    with pytest.raises(ValueError):
+        asyncio.run(client.subscribe(["bad symbol"]))
+    asyncio.run(client.subscribe(["S1"]))
+    assert len(client.symbols) == 50
+
+
+def test_on_connect_runs_after_each_connection():
+    first = FakeConnection([_trade("BTC-USD", 1.0)], error=_closed())
+    second = FakeConnection([_trade("BTC-USD", 2.0)])
+    calls = []
+
+    async def on_connect(client):
+        calls.append((client.connections, client.connected))
+
+    client = AsyncWebSocketClient(API_KEY, "crypto", ["BTC-USD"], reconnect_base_delay=0.0,
+                                  connect=FakeConnect(first, second), on_connect=on_connect)
+
+    async def run():
+        async for message in client:
+            if message["p"] == 2.0:
+                await client.close()
+
+    asyncio.run(run())
+    assert calls == [(1, True), (2, True)]
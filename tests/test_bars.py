@@ -0,0 +1,126 @@
+"""Tests for BarAggregator."""
+
+import json
+
+import numpy as np
+import pytest
+
+from eodhd import BarAggregator, WebSocketClient
+from eodhd.bars import BAR_DTYPE, parse_interval
+from eodhd.ticks import empty_ticks, ticks_to_numpy
+
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(7)
+    count = 2000
+    payload = {
+        "ts": list(1_700_000_000_000 + np.cumsum(rng.integers(0, 2000, count))),
+        "price": list(np.round(100 + np.cumsum(rng.normal(0, 0.05, count)), 2)),
+        "shares": list(rng.integers(1, 500, count)),
+    }
+    return ticks_to_numpy(payload, ts_unit="ms")
+
+
+def _live(aggregator, ticks):
+    bars = []
+    for ts, price, shares in zip(ticks["ts"] // 1_000_000, ticks["price"], ticks["shares"]):
+        bar = aggregator.update("AAPL", float(price), float(shares), int(ts))
+        if bar is not None:
+            bars.append(bar)
+    bars.extend(aggregator.flush())
+    return np.array([tuple(bar[field] for field in BAR_DTYPE.names) for bar in bars], dtype=BAR_DTYPE)
+
+
+@pytest.mark.parametrize("kind, size", [("time", "1 minute"), ("time", 7), ("tick", 50), ("volume", 10_000),
+                                        ("dollar", 250_000.0)])
+def test_live_and_historical_bars_match(ticks, kind, size):
+    historical = BarAggregator(kind, size).aggregate(ticks)
+    live = _live(BarAggregator(kind, size), ticks)
+
+    assert len(historical) > 5
+    np.testing.assert_array_equal(historical, live)
+    assert historical["n"].sum() == len(ticks)
+    assert historical["v"].sum() == ticks["shares"].sum()
+
+
+def test_late_trades_are_ignored_live_and_historically():
+    # 1:00 bar, a late trade of the 0:00 bar, then the 2:00 bar and another late one.
+    trades = [(60_000, 1.0), (61_000, 2.0), (59_000, 9.0), (120_000, 3.0), (119_000, 8.0), (121_000, 4.0)]
+    aggregator = BarAggregator("time", 60)
+    closed = [aggregator.update("A", price, 1.0, ts) for ts, price in trades]
+
+    assert closed[2] is None and closed[4] is None
+    assert closed[3] == {"t": 60_000, "m": "A", "g": 60, "o": 1.0, "h": 2.0, "l": 1.0, "c": 2.0, "v": 2.0, "n": 2}
+    assert aggregator.late == 2
+    assert aggregator.current("A")["n"] == 2
+
+    ticks = ticks_to_numpy({"ts": [ts for ts, _ in trades], "price": [p for _, p in trades],
+                            "shares": [1] * len(trades)}, ts_unit="ms")
+    np.testing.assert_array_equal(BarAggregator("time", 60).aggregate(ticks), _live(BarAggregator("time", 60), ticks))
+
+
+def test_time_bars_against_pandas(ticks):
+    import pandas as pd
+
+    bars = BarAggregator("time", "5m").aggregate(ticks)
+    series = pd.Series(ticks["price"], index=pd.to_datetime(ticks["ts"]))
+    expected = series.resample("5min").ohlc().dropna()
+
+    np.testing.assert_array_equal(bars["t"], expected.index.as_unit("ms").asi8)
+    np.testing.assert_allclose(bars["o"], expected["open"])
+    np.testing.assert_allclose(bars["h"], expected["high"])
+    np.testing.assert_allclose(bars["l"], expected["low"])
+    np.testing.assert_allclose(bars["c"], expected["close"])
+
+
+def test_volume_bars_do_not_split_trades():
+    aggregator = BarAggregator("volume", 10)
+    results = [aggregator.update("A", price, size, t) for t, (price, size) in enumerate([(1, 4), (2, 4), (3, 4), (4, 20), (5, 1)])]
+
+    assert results[:2] == [None, None]
+    assert results[2] == {"t": 0, "m": "A", "g": 10, "o": 1.0, "h": 3.0, "l": 1.0, "c": 3.0, "v": 12.0, "n": 3}
+    assert results[3]["v"] == 20.0 and results[3]["n"] == 1
+    assert results[4] is None
+    assert aggregator.current("A")["o"] == 5.0
+
+
+def test_many_symbols_keep_separate_state():
+    aggregator = BarAggregator("tick", 2)
+    closed = [aggregator.update(f"S{i % 40}", float(i), 1.0, i) for i in range(80)]
+
+    assert len(aggregator.symbols) == 40
+    assert closed[:40] == [None] * 40
+    assert [bar["m"] for bar in closed[40:]] == [f"S{i}" for i in range(40)]
+    assert closed[40]["o"] == 0.0 and closed[40]["c"] == 40.0
+    assert aggregator.flush() == []
+
+
+def test_update_message_and_validation():
+    aggregator = BarAggregator("time", "1 hour")
+    assert aggregator.update_message({"s": "BTC-USD", "p": 10.0, "q": "0.5", "t": 0}) is None
+    assert aggregator.update_message({"status_code": 200}) is None
+    bar = aggregator.update_message({"s": "BTC-USD", "p": 11.0, "q": "0.5", "t": 3_600_000})
+    assert bar["g"] == 3600 and bar["v"] == 0.5
+
+    assert parse_interval("15m") == 900 and parse_interval("1 day") == 86400 and parse_interval(0.5) == 0.5
+    for interval in ("2 fortnights", "0m", "", True, 0):
+        with pytest.raises(ValueError):
+            parse_interval(interval)
+    with pytest.raises(ValueError):
+        BarAggregator("renko", 10)
+    with pytest.raises(ValueError):
+        BarAggregator("tick", 2.5)
+    assert len(BarAggregator("tick", 10).aggregate(empty_ticks())) == 0
+
+
+def test_websocketclient_candles_have_their_granularity(capsys):
+    client = WebSocketClient(api_key="00000000000000000000000000000000", endpoint="crypto", symbols=["BTC-USD", "ETH-USD"],
+                             display_candle_5m=True, on_candle=lambda *event: None, candle_intervals=("30s",))
+    candles = client._new_candle_state()
+    for symbol, price, t in (("BTC-USD", 1.0, 0), ("ETH-USD", 50.0, 1), ("BTC-USD", 2.0, 300_000)):
+        client._process_message(json.dumps({"s": symbol, "p": price, "q": 1, "t": t}), candles)
+
+    printed = capsys.readouterr().out
+    # Only BTC's 5-minute candle closed, and ETH's trade is not mixed into it.
+    assert "'g': 300" in printed and "'h': 1.0" in printed and "ETH" not in printed
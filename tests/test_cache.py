@@ -0,0 +1,134 @@
+"""Tests for ResponseCache and its use by BaseAPI / APIClient."""
+
+import json
+import time
+from datetime import date, timedelta
+
+import pytest
+from unittest.mock import MagicMock
+
+from eodhd import APIClient, ResponseCache
+from eodhd.APIs.BaseAPI import BaseAPI
+
+
+def _ok(data):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = data
+    resp.content = json.dumps(data).encode()
+    return resp
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ResponseCache(str(tmp_path / "cache" / "responses.sqlite"))
+    yield c
+    c.close()
+
+
+def test_key_ignores_token_and_param_order():
+    a = ResponseCache.make_key("eod", "AAPL.US", "&api_token=abc&period=d&from=2020-01-01")
+    b = ResponseCache.make_key("eod", "AAPL.US", "&from=2020-01-01&period=d&api_token=xyz")
+    assert a == b
+    assert "abc" not in a
+
+
+def test_ttls(cache):
+    yesterday = (date.today() - timedelta(days=2)).isoformat()
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
+    assert cache.ttl("exchanges-list") == 86400
+    assert cache.ttl("real-time", "AAPL.US") == 0
+    assert cache.ttl("eod", "AAPL.US", f"&from=2020-01-01&to={yesterday}") is None
+    assert cache.ttl("eod", "AAPL.US", f"&from=2020-01-01&to={tomorrow}") == 3600
+    assert cache.ttl("eod", "AAPL.US", "&from=2020-01-01") == 3600
+    assert cache.ttl("intraday", "AAPL.US", "&from=1600000000&to=1600086400") is None
+    assert cache.ttl("technical/", "AAPL.US") == cache.default_ttl
+
+
+def test_put_get_roundtrip(cache):
+    cache.put("exchanges-list", "", "", b'[{"Code": "US"}]')
+    assert cache.get("exchanges-list", "", "&api_token=other") == b'[{"Code": "US"}]'
+    assert cache.stats()["hits"] == 1
+
+
+def test_realtime_never_cached(cache):
+    cache.put("real-time", "AAPL.US", "", b"{}")
+    assert cache.get("real-time", "AAPL.US", "") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = ResponseCache(str(tmp_path / "c.sqlite"), ttls={"exchanges-list": 0.05})
+    cache.put("exchanges-list", "", "", b"[]")
+    time.sleep(0.1)
+    assert cache.get("exchanges-list", "", "") is None
+    assert cache.stats()["entries"] == 0
+    cache.close()
+
+
+def test_lru_eviction(tmp_path):
+    cache = ResponseCache(str(tmp_path / "c.sqlite"), max_bytes=25)
+    cache.put("search", "a", "", b"x" * 10)
+    cache.put("search", "b", "", b"x" * 10)
+    cache.get("search", "a", "")  # a is now more recently used than b
+    cache.put("search", "c", "", b"x" * 10)
+
+    assert cache.get("search", "a", "") is not None
+    assert cache.get("search", "b", "") is None
+    assert cache.get("search", "c", "") is not None
+    assert cache.stats()["evictions"] == 1
+    cache.close()
+
+
+def test_invalidate_by_endpoint(cache):
+    cache.put("search", "a", "", b"[]")
+    cache.put("exchanges-list", "", "", b"[]")
+    cache.invalidate("search")
+    assert cache.get("search", "a", "") is None
+    assert cache.get("exchanges-list", "", "") == b"[]"
+
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / "c.sqlite")
+    first = ResponseCache(path)
+    first.put("exchanges-list", "", "", b"[1]")
+    first.close()
+    second = ResponseCache(path)
+    assert second.get("exchanges-list", "", "") == b"[1]"
+    second.close()
+
+
+def test_baseapi_serves_second_call_from_cache(cache):
+    session = MagicMock()
+    session.get.return_value = _ok([{"Code": "US"}])
+    api = BaseAPI(session=session, cache=cache)
+
+    first = api._rest_get_method(api_key="demo1234567890123456", endpoint="exchanges-list")
+    second = api._rest_get_method(api_key="demo1234567890123456", endpoint="exchanges-list")
+
+    assert first == second == [{"Code": "US"}]
+    session.get.assert_called_once()
+
+
+def test_baseapi_raw_cached(cache):
+    session = MagicMock()
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.content = b"PNG"
+    session.get.return_value = resp
+    api = BaseAPI(session=session, cache=cache)
+
+    api._rest_get_raw(api_key="demo1234567890123456", endpoint="logo", uri="AAPL.US")
+    assert api._rest_get_raw(api_key="demo1234567890123456", endpoint="logo", uri="AAPL.US") == b"PNG"
+    session.get.assert_called_once()
+
+
+def test_apiclient_uses_cache(cache):
+    client = APIClient(api_key="demo1234567890123456", cache=cache)
+    client._session = MagicMock()
+    client._session.get.return_value = _ok([{"Code": "US"}])
+
+    client.get_exchanges()
+    client.get_list_of_exchanges()
+
+    client._session.get.assert_called_once()
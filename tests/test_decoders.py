@@ -0,0 +1,168 @@
+"""Tests for the pluggable JSON decoders and columnar decoding."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eodhd import APIClient
+from eodhd.APIs.BaseAPI import BaseAPI
+from eodhd.decoders import JSONDecoder, available_backends, get_decoder, to_columns
+from eodhd.errors import EODHDHTTPError
+
+
+def _ok(body: bytes):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.content = body
+    resp.text = body.decode()
+    resp.json.side_effect = AssertionError("resp.json() must not be used when a decoder is set")
+    return resp
+
+
+def _requests_ok(body: bytes):
+    """A response decoded by requests itself (no decoder set)."""
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.side_effect = lambda: json.loads(body)
+    return resp
+
+
+class _Decoder(JSONDecoder):
+    name = "test"
+
+
+def test_get_decoder_names():
+    assert get_decoder("json").name == "json"
+    assert get_decoder("auto").name == available_backends()[0]
+    decoder = JSONDecoder()
+    assert get_decoder(decoder) is decoder
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_decode_and_reject_bad_json(backend):
+    decoder = get_decoder(backend)
+    assert decoder.loads(b'[{"a": 1, "b": "x"}]') == [{"a": 1, "b": "x"}]
+    with pytest.raises(ValueError):
+        decoder.loads(b"{not json")
+
+
+def test_to_columns_dtypes():
+    columns = to_columns([
+        {"code": "AAPL", "close": 10, "volume": 100},
+        {"code": "MSFT", "close": 10.5, "volume": 200, "extra": "y"},
+        {"code": "IBM", "close": None},
+    ])
+    assert list(columns) == ["code", "close", "volume", "extra"]
+    assert columns["code"].dtype == object
+    assert columns["close"].dtype == np.float64
+    assert np.isnan(columns["close"][2])
+    assert columns["volume"].dtype == np.float64  # missing value -> NaN
+    assert list(columns["extra"]) == [None, "y", None]
+
+
+def test_to_columns_ints_and_forced_dtype():
+    columns = to_columns([{"ts": 1, "p": 2}, {"ts": 3, "p": 4}], dtypes={"p": np.float32})
+    assert columns["ts"].dtype == np.int64
+    assert columns["p"].dtype == np.float32
+
+
+def test_to_columns_rejects_non_records():
+    with pytest.raises(ValueError):
+        to_columns({"data": []})
+
+
+def test_to_columns_bools():
+    columns = to_columns([{"a": True, "b": True}, {"a": False, "b": None}])
+    assert columns["a"].dtype == bool
+    assert columns["b"].dtype == object
+
+
+def test_to_columns_keeps_integers_beyond_64_bits():
+    columns = to_columns([{"id": 2**70, "x": 1}, {"id": 1, "x": 2**70 + 0.5}])
+    assert columns["id"].dtype == object and columns["id"][0] == 2**70
+    assert columns["x"].dtype == np.float64
+
+    client = APIClient(api_key="demo1234567890123456")
+    client._session = MagicMock()
+    client._session.get.return_value = _requests_ok(json.dumps([{"id": 2**70}, {"id": 3}]).encode())
+    assert client._rest_get("eod", "AAPL.US")["id"].tolist() == [2**70, 3]
+
+
+def test_baseapi_uses_decoder():
+    session = MagicMock()
+    session.get.return_value = _ok(b'{"ok": true}')
+    api = BaseAPI(session=session, json_decoder=get_decoder("auto"))
+    assert api._rest_get_method(api_key="demo1234567890123456", endpoint="test") == {"ok": True}
+
+
+def test_baseapi_decoder_invalid_json_raises_http_error():
+    session = MagicMock()
+    session.get.return_value = _ok(b"<html>")
+    api = BaseAPI(session=session, json_decoder=get_decoder("auto"))
+    with pytest.raises(EODHDHTTPError):
+        api._rest_get_method(api_key="demo1234567890123456", endpoint="test")
+
+
+def test_baseapi_rest_get_columns():
+    session = MagicMock()
+    session.get.return_value = _ok(b'[{"code": "A", "close": 1.0}, {"code": "B", "close": 2.0}]')
+    api = BaseAPI(session=session, json_decoder=get_decoder("json"))
+    columns = api._rest_get_columns(api_key="demo1234567890123456", endpoint="eod-bulk-last-day", uri="US")
+    assert columns["close"].tolist() == [1.0, 2.0]
+
+
+def test_apiclient_passes_decoder_to_wrappers():
+    client = APIClient(api_key="demo1234567890123456", json_decoder=_Decoder())
+    assert client.json_decoder.name == "test"
+    client._session = MagicMock()
+    client._session.get.return_value = _ok(b'[{"code": "A"}]')
+    assert client.get_eod_splits_dividends_data(country="US") == [{"code": "A"}]
+
+    client.json_decoder = "orjson" if "orjson" in available_backends() else "json"
+    assert client._api_options()["json_decoder"] is client.json_decoder
+
+    client.json_decoder = "json"
+    assert client.json_decoder is None
+
+
+def test_stdlib_decoder_is_the_default():
+    # The default decodes through requests (resp.json()), as before decoders existed.
+    assert APIClient(api_key="demo1234567890123456").json_decoder is None
+    client = APIClient(api_key="demo1234567890123456")
+    client._session = MagicMock()
+    client._session.get.return_value = _requests_ok(b'[{"code": "A", "close": NaN, "id": 123456789012345678901234567890}]')
+    record = client.get_eod_splits_dividends_data(country="US")[0]
+    assert np.isnan(record["close"]) and record["id"] == 123456789012345678901234567890
+
+
+def test_bulk_columns_output():
+    client = APIClient(api_key="demo1234567890123456")
+    client._session = MagicMock()
+    client._session.get.return_value = _requests_ok(b'[{"code": "A", "close": 1.0, "volume": 5}, {"code": "B", "close": 2.5, "volume": 7}]')
+    columns = client.get_eod_splits_dividends_data(country="US", output="columns")
+    assert columns["close"].tolist() == [1.0, 2.5]
+    assert columns["volume"].dtype == np.int64
+    with pytest.raises(ValueError):
+        client.get_eod_splits_dividends_data(country="US", output="frame")
+
+
+def test_rest_get_builds_frames_from_columns():
+    client = APIClient(api_key="demo1234567890123456")
+    client._session = MagicMock()
+    records = [{"date": "2024-01-02", "close": 1.5, "volume": 10, "adjusted": True},
+               {"date": "2024-01-03", "close": 2, "volume": 20, "adjusted": False}]
+    client._session.get.return_value = _requests_ok(json.dumps(records).encode())
+
+    with patch("eodhd.apiclient.to_columns", wraps=to_columns) as transpose:
+        df_data = client._rest_get("eod", "AAPL.US")
+    transpose.assert_called_once()
+    expected = pd.DataFrame.from_dict(records)
+    pd.testing.assert_frame_equal(df_data, expected)
+
+    client._session.get.return_value = _requests_ok(b'["AAPL", "MSFT"]')
+    assert client._rest_get("exchange-symbol-list", "US")[0].tolist() == ["AAPL", "MSFT"]
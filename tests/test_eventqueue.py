@@ -0,0 +1,128 @@
+"""Tests for EventQueue and WebSocketClient's callback and queue consumers."""
+
+import json
+import queue
+import threading
+
+import pytest
+
+from eodhd import EventQueue, WebSocketClient
+from eodhd.eventqueue import StreamEvent
+
+API_KEY = "00000000000000000000000000000000"
+
+
+def _drain(events):
+    items = []
+    while True:
+        try:
+            items.append(events.get_nowait())
+        except queue.Empty:
+            return items
+
+
+def test_drop_oldest():
+    events = EventQueue(2)
+    for i in range(4):
+        assert events.put(i)
+    assert _drain(events) == [2, 3]
+    assert events.dropped == 2
+
+
+def test_coalesce_keeps_position_and_latest_value():
+    events = EventQueue(10, policy="coalesce")
+    events.put(StreamEvent("tick", "A", None, 1))
+    events.put(StreamEvent("tick", "B", None, 2))
+    events.put(StreamEvent("tick", "A", None, 3))
+    events.put(StreamEvent("candle", "A", "1 minute", 4))
+    events.put("other")
+    events.put("other")
+
+    assert [(event.symbol, event.data) if isinstance(event, StreamEvent) else event for event in _drain(events)] == [
+        ("A", 3), ("B", 2), ("A", 4), "other", "other"
+    ]
+    events.put(StreamEvent("tick", "A", None, 5))
+    assert events.get_nowait().data == 5
+
+
+def test_block_waits_for_consumer():
+    events = EventQueue(1, policy="block")
+    events.put(1)
+    done = threading.Event()
+
+    def produce():
+        events.put(2)
+        done.set()
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    assert not done.wait(0.05)
+    assert events.get() == 1
+    producer.join(1.0)
+    assert done.is_set() and events.get() == 2
+
+
+def test_close_releases_blocked_producer_and_get_times_out():
+    events = EventQueue(1, policy="block")
+    events.put(1)
+    results = []
+    producer = threading.Thread(target=lambda: results.append(events.put(2)))
+    producer.start()
+    events.close()
+    producer.join(1.0)
+    assert results == [False]
+    assert events.get(timeout=0.01) == 1
+    with pytest.raises(queue.Empty):
+        events.get(timeout=0.01)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        EventQueue(0)
+    with pytest.raises(ValueError):
+        EventQueue(10, policy="newest")
+    with pytest.raises(ValueError):
+        WebSocketClient(API_KEY, "crypto", ["BTC-USD"], candle_intervals=("2 fortnights",))
+
+
+def _trade(symbol, price, t):
+    return json.dumps({"s": symbol, "p": price, "q": 1.0, "t": t})
+
+
+def test_websocketclient_callbacks_and_queue():
+    ticks, candles_closed = [], []
+    client = WebSocketClient(
+        API_KEY, "crypto", ["BTC-USD", "ETH-USD"],
+        on_tick=lambda symbol, message: ticks.append((symbol, message["p"])),
+        on_candle=lambda symbol, interval, candle: candles_closed.append((symbol, interval, candle["c"])),
+        candle_intervals=("1 minute", "5 minutes"),
+        queue_size=100,
+    )
+    candles = client._new_candle_state()
+    for message in (
+        _trade("BTC-USD", 10.0, 0), _trade("ETH-USD", 5.0, 30_000), _trade("BTC-USD", 11.0, 60_000),
+        json.dumps({"status_code": 200}), _trade("ETH-USD", 6.0, 300_000),
+    ):
+        client._process_message(message, candles)
+
+    assert ticks == [("BTC-USD", 10.0), ("ETH-USD", 5.0), ("BTC-USD", 11.0), ("ETH-USD", 6.0)]
+    # Candles are per symbol: ETH's first minute closes at its own next trade.
+    assert candles_closed == [
+        ("BTC-USD", "1 minute", 10.0), ("ETH-USD", "1 minute", 5.0), ("ETH-USD", "5 minutes", 5.0),
+    ]
+    events = _drain(client.events)
+    assert [event.kind for event in events] == ["tick", "tick", "tick", "candle", "tick", "candle", "candle"]
+    assert events[3] == StreamEvent("candle", "BTC-USD", "1 minute", events[3].data)
+
+
+def test_callback_errors_go_to_on_error():
+    errors = []
+
+    def fail(symbol, message):
+        raise RuntimeError("boom")
+
+    client = WebSocketClient(API_KEY, "crypto", ["BTC-USD"], on_tick=fail, on_error=errors.append, queue_size=10)
+    client._process_message(_trade("BTC-USD", 10.0, 0), client._new_candle_state())
+
+    assert [str(err) for err in errors] == ["boom"]
+    assert [event.kind for event in _drain(client.events)] == ["error", "tick"]
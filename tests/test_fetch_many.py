@@ -0,0 +1,143 @@
+"""Tests for APIClient.fetch_many."""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+from eodhd import APIClient
+from eodhd.errors import EODHDHTTPError
+
+
+def _ok(data):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = data
+    return resp
+
+
+def _not_found():
+    resp = MagicMock()
+    resp.status_code = 404
+    resp.text = "not found"
+    resp.json.side_effect = ValueError("no json")
+    return resp
+
+
+@pytest.fixture
+def client():
+    api = APIClient(api_key="test1234567890123456")
+    api._session = MagicMock()
+    return api
+
+
+def test_symbols_with_method(client):
+    def get(url, timeout=None):
+        symbol = url.split("/eod/")[1].split("?")[0]
+        return _ok([{"symbol": symbol}])
+
+    client._session.get.side_effect = get
+
+    results = client.fetch_many(["AAPL.US", "MSFT.US"], method="get_eod_historical_stock_market_data",
+                                period="d", from_date="2024-01-01")
+
+    assert list(results) == ["AAPL.US", "MSFT.US"]
+    assert results["AAPL.US"] == [{"symbol": "AAPL.US"}]
+    assert results["MSFT.US"] == [{"symbol": "MSFT.US"}]
+    for call in client._session.get.call_args_list:
+        assert "&from=2024-01-01" in call[0][0]
+
+
+def test_method_kwargs_pairs_keyed_by_position(client):
+    client._session.get.return_value = _ok({"ok": True})
+
+    results = client.fetch_many([
+        ("get_user_info", {}),
+        ("get_fundamentals_data", {"ticker": "AAPL.US"}),
+    ])
+
+    assert results == {0: {"ok": True}, 1: {"ok": True}}
+
+
+def test_errors_are_captured_per_item(client):
+    def get(url, timeout=None):
+        if "BAD.US" in url:
+            return _not_found()
+        return _ok([])
+
+    client._session.get.side_effect = get
+
+    results = client.fetch_many(["AAPL.US", "BAD.US", ""], method="get_eod_historical_stock_market_data", period="d")
+
+    assert results["AAPL.US"] == []
+    assert isinstance(results["BAD.US"], EODHDHTTPError)
+    assert results["BAD.US"].status_code == 404
+    assert isinstance(results[""], ValueError)
+
+
+def test_unexpected_errors_are_captured_per_item(client):
+    def get(url, timeout=None):
+        if "BAD.US" in url:
+            raise KeyError("boom")
+        return _ok([])
+
+    client._session.get.side_effect = get
+
+    results = client.fetch_many(["AAPL.US", "BAD.US"], method="get_eod_historical_stock_market_data", period="d")
+
+    assert results["AAPL.US"] == []
+    assert isinstance(results["BAD.US"], KeyError)
+
+
+def test_duplicate_symbols_are_fetched_once(client):
+    client._session.get.return_value = _ok([])
+
+    results = client.fetch_many(["AAPL.US", "MSFT.US", "AAPL.US"], method="get_eod_historical_stock_market_data")
+
+    assert list(results) == ["AAPL.US", "MSFT.US"]
+    assert client._session.get.call_count == 2
+
+
+def test_runs_concurrently(client):
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def get(url, timeout=None):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return _ok([])
+
+    client._session.get.side_effect = get
+
+    symbols = [f"S{i}.US" for i in range(12)]
+    results = client.fetch_many(symbols, method="get_eod_historical_stock_market_data", period="d", max_workers=4)
+
+    assert len(results) == 12
+    assert 1 < state["peak"] <= 4
+
+
+def test_unknown_or_private_method_rejected(client):
+    with pytest.raises(ValueError):
+        client.fetch_many(["AAPL.US"], method="no_such_method")
+    with pytest.raises(ValueError):
+        client.fetch_many([("_rest_get", {})])
+
+
+def test_kwargs_without_method_rejected(client):
+    with pytest.raises(ValueError):
+        client.fetch_many([("get_user_info", {})], period="d")
+
+
+def test_invalid_max_workers(client):
+    with pytest.raises(ValueError):
+        client.fetch_many(["AAPL.US"], method="get_live_stock_prices", max_workers=0)
+
+
+def test_empty_batch(client):
+    assert client.fetch_many([], method="get_live_stock_prices") == {}
+    client._session.get.assert_not_called()
@@ -0,0 +1,90 @@
+"""Tests for the typed DataFrame built by APIClient.get_historical_data."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eodhd.apiclient import APIClient
+
+
+@pytest.fixture
+def client():
+    with patch("eodhd.apiclient.requests.Session"):
+        yield APIClient(api_key="demo1234567890123456")
+
+
+def _eod_frame():
+    return pd.DataFrame(
+        {
+            "date": ["2025-04-22", "2025-04-23", "2025-04-24"],
+            "open": [10.5, 11.0, None],
+            "high": [11.0, 11.5, 12.0],
+            "low": [10.0, 10.5, 11.0],
+            "close": [10.8, 11.2, 11.9],
+            "adjusted_close": [10.7, 11.1, 11.9],
+            "volume": [1000, 2000, 3000],
+        }
+    )
+
+
+def _intraday_frame():
+    return pd.DataFrame(
+        {
+            "timestamp": [1745312400, 1745316000],
+            "gmtoffset": [0, 0],
+            "datetime": ["2025-04-22 09:00:00", "2025-04-22 10:00:00"],
+            "open": [1.0, 2.0],
+            "high": [1.5, 2.5],
+            "low": [0.5, 1.5],
+            "close": [1.2, 2.2],
+            "volume": [10, 20],
+        }
+    )
+
+
+def test_eod_columns_are_numeric(client):
+    with patch.object(client, "_rest_get", return_value=_eod_frame()):
+        df = client.get_historical_data("AAPL.US", interval="d", iso8601_start="2025-04-22", iso8601_end="2025-04-24")
+
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert df.index[0] == pd.Timestamp("2025-04-22")
+    for column in ("open", "high", "low", "close", "adjusted_close"):
+        assert df[column].dtype == np.float64
+    assert df["volume"].dtype == np.float64
+    assert df["open"].iloc[-1] == 0.0
+    assert (df["symbol"] == "AAPL.US").all()
+    assert (df["interval"] == "d").all()
+
+
+def test_intraday_columns_are_numeric(client):
+    with patch.object(client, "_rest_get", return_value=_intraday_frame()):
+        df = client.get_historical_data("AAPL.US", interval="1h", iso8601_start="2025-04-22", iso8601_end="2025-04-23")
+
+    assert df.index[1] == pd.Timestamp("2025-04-22 10:00:00")
+    assert df["epoch"].dtype == np.int64
+    assert df["epoch"].iloc[0] == 1745312400
+    assert df["close"].dtype == np.float64
+    assert list(df["close"]) == [1.2, 2.2]
+
+
+def test_fractional_volumes_are_kept(client):
+    frame = _eod_frame().assign(volume=[0.25, 1.5, 2.75])
+    with patch.object(client, "_rest_get", return_value=frame):
+        df = client.get_historical_data("BTC-USD.CC", interval="d", iso8601_start="2025-04-22", iso8601_end="2025-04-24")
+    assert list(df["volume"]) == [0.25, 1.5, 2.75]
+
+    frame = _intraday_frame().assign(volume=[0.5, 1.25])
+    with patch.object(client, "_rest_get", return_value=frame):
+        df = client.get_historical_data("EURUSD.FOREX", interval="1h", iso8601_start="2025-04-22", iso8601_end="2025-04-23")
+    assert list(df["volume"]) == [0.5, 1.25]
+
+
+def test_object_dtype_option(client):
+    with patch.object(client, "_rest_get", return_value=_eod_frame()):
+        df = client.get_historical_data("AAPL.US", interval="d", iso8601_start="2025-04-22", object_dtype=True)
+
+    for column in ("open", "high", "low", "close", "adjusted_close", "volume"):
+        assert df[column].dtype == object
+    assert df["close"].iloc[0] == 10.8
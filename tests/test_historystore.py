@@ -0,0 +1,130 @@
+"""Tests for HistoryStore incremental EOD sync."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from eodhd import HistoryStore
+from eodhd.errors import EODHDHTTPError
+
+
+def _bar(date, close, adjusted_close=None, volume=1000):
+    return {
+        "date": date, "open": close, "high": close, "low": close, "close": close,
+        "adjusted_close": close if adjusted_close is None else adjusted_close, "volume": volume,
+    }
+
+
+@pytest.fixture
+def client():
+    return MagicMock()
+
+
+@pytest.fixture
+def store(client, tmp_path):
+    return HistoryStore(client, str(tmp_path), file_format="csv")
+
+
+def test_invalid_format(client, tmp_path):
+    with pytest.raises(ValueError):
+        HistoryStore(client, str(tmp_path), file_format="xlsx")
+
+
+def test_first_sync_downloads_and_stores(store, client):
+    client.get_eod_historical_stock_market_data.return_value = [
+        _bar("2024-01-02", 10.0), _bar("2024-01-03", 11.0),
+    ]
+
+    df = store.sync("AAPL.US", from_date="2024-01-01")
+
+    kwargs = client.get_eod_historical_stock_market_data.call_args.kwargs
+    assert kwargs["from_date"] == "2024-01-01"
+    assert list(df.columns) == HistoryStore.COLUMNS
+    assert df["close"].dtype == "float64"
+    assert len(store.load("AAPL.US")) == 2
+
+
+def test_second_sync_fetches_from_last_date_and_merges(store, client):
+    client.get_eod_historical_stock_market_data.return_value = [
+        _bar("2024-01-02", 10.0), _bar("2024-01-03", 11.0),
+    ]
+    store.sync("AAPL.US")
+
+    # last bar re-sent (possibly revised intraday) plus one new bar
+    client.get_eod_historical_stock_market_data.return_value = [
+        _bar("2024-01-03", 11.5), _bar("2024-01-04", 12.0),
+    ]
+    df = store.sync("AAPL.US")
+
+    assert client.get_eod_historical_stock_market_data.call_args.kwargs["from_date"] == "2024-01-03"
+    assert [str(d.date()) for d in df.index] == ["2024-01-02", "2024-01-03", "2024-01-04"]
+    assert df.loc["2024-01-03", "close"] == 11.5
+    assert len(store.load("AAPL.US")) == 3
+
+
+def test_adjustment_change_triggers_full_refetch(store, client):
+    client.get_eod_historical_stock_market_data.return_value = [
+        _bar("2024-01-02", 10.0), _bar("2024-01-03", 11.0),
+    ]
+    store.sync("AAPL.US")
+
+    full = [_bar("2024-01-02", 10.0, 9.5), _bar("2024-01-03", 11.0, 10.45), _bar("2024-01-04", 12.0)]
+    client.get_eod_historical_stock_market_data.side_effect = [
+        [_bar("2024-01-03", 11.0, 10.45), _bar("2024-01-04", 12.0)],
+        full,
+    ]
+    df = store.sync("AAPL.US")
+
+    calls = client.get_eod_historical_stock_market_data.call_args_list
+    assert calls[-1].kwargs["from_date"] == "2024-01-02"
+    assert df.loc["2024-01-02", "adjusted_close"] == 9.5
+    assert len(df) == 3
+
+
+def test_nothing_new_returns_stored(store, client):
+    client.get_eod_historical_stock_market_data.return_value = [_bar("2024-01-02", 10.0)]
+    store.sync("AAPL.US")
+    client.get_eod_historical_stock_market_data.return_value = []
+    assert len(store.sync("AAPL.US")) == 1
+
+
+def test_sync_many_captures_errors(store, client):
+    def fetch(symbol, period="d", from_date=None, to_date=None):
+        if symbol == "BAD.US":
+            raise EODHDHTTPError(status_code=404, response_body="")
+        return [_bar("2024-01-02", 10.0)]
+
+    client.get_eod_historical_stock_market_data.side_effect = fetch
+
+    results = store.sync_many(["AAPL.US", "BAD.US", "MSFT.US"], max_workers=2)
+
+    assert list(results) == ["AAPL.US", "BAD.US", "MSFT.US"]
+    assert len(results["AAPL.US"]) == 1
+    assert isinstance(results["BAD.US"], EODHDHTTPError)
+
+
+def test_sync_many_captures_any_error_per_symbol(store, client):
+    def fetch(symbol, period="d", from_date=None, to_date=None):
+        if symbol == "ODD.US":
+            raise KeyError("date")
+        return [_bar("2024-01-02", 10.0)]
+
+    client.get_eod_historical_stock_market_data.side_effect = fetch
+    save = store._save
+
+    def failing_save(path, df_data):
+        if "MSFT" in path:
+            raise OSError("No space left on device")
+        save(path, df_data)
+
+    store._save = failing_save
+
+    results = store.sync_many(["AAPL.US", "MSFT.US", "ODD.US"], max_workers=2)
+
+    assert len(results["AAPL.US"]) == 1
+    assert isinstance(results["MSFT.US"], OSError)
+    assert isinstance(results["ODD.US"], KeyError)
+
+
+def test_invalid_period(store):
+    with pytest.raises(ValueError):
+        store.sync("AAPL.US", period="1h")
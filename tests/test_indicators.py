@@ -0,0 +1,108 @@
+"""Tests for the batched indicator engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eodhd.indicators import IndicatorEngine, Screen, _REGISTRY, register_indicator
+
+
+def _history(bars, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    return pd.DataFrame(
+        {
+            "open": close, "high": close + rng.uniform(0, 2, bars), "low": close - rng.uniform(0, 2, bars),
+            "close": close, "volume": rng.integers(1, 10 ** 6, bars),
+        },
+        index=pd.date_range("2023-01-01", periods=bars, freq="D"),
+    )
+
+
+@pytest.fixture
+def histories():
+    return {"AAA": _history(120, 1), "BBB": _history(80, 2), "CCC": _history(120, 3)}
+
+
+def _rsi(close, period):
+    change = close.diff()
+    gain = change.clip(lower=0).ewm(alpha=1 / period, adjust=False).mean()
+    loss = (-change.clip(upper=0)).ewm(alpha=1 / period, adjust=False).mean()
+    return 100 - 100 / (1 + gain / loss)
+
+
+def _true_range(df):
+    prev = df["close"].shift()
+    return pd.concat([df["high"] - df["low"], (df["high"] - prev).abs(), (df["low"] - prev).abs()], axis=1).max(axis=1)
+
+
+@pytest.mark.parametrize("indicator, params, expected", [
+    ("sma", {"period": 20}, lambda df: df["close"].rolling(20).mean()),
+    ("ema", {"period": 12}, lambda df: df["close"].ewm(span=12, adjust=False).mean()),
+    ("stddev", {"period": 10}, lambda df: df["close"].rolling(10).std()),
+    ("atr", {"period": 14}, lambda df: _true_range(df).rolling(14).mean()),
+    ("rsi", {"period": 14}, lambda df: _rsi(df["close"], 14)),
+    ("macd", {}, lambda df: df["close"].ewm(span=12, adjust=False).mean() - df["close"].ewm(span=26, adjust=False).mean()),
+])
+def test_parity_with_pandas_per_symbol(histories, indicator, params, expected):
+    engine = IndicatorEngine(histories)
+    values = engine.compute(indicator, **params)
+
+    assert values.shape == (3, 120)
+    for row, (symbol, df) in enumerate(histories.items()):
+        # Shorter histories are right-aligned.
+        np.testing.assert_allclose(values[row, 120 - len(df):], expected(df).to_numpy(), rtol=1e-9, equal_nan=True)
+
+
+def test_shared_indicators_are_computed_once(histories):
+    calls = []
+
+    @register_indicator("counted_sma")
+    def counted_sma(engine, period=5):
+        calls.append(period)
+        return engine.compute("sma", period=period)
+
+    try:
+        engine = IndicatorEngine(histories)
+        screens = [
+            Screen("a", {"x": ("counted_sma", {"period": 5}), "ema": ("ema", {"period": 12})}),
+            Screen("b", {"y": ("counted_sma", {"period": 5}), "macd": ("macd", {})}),
+        ]
+        results = engine.run(screens)
+    finally:
+        del _REGISTRY["counted_sma"]
+
+    assert calls == [5]
+    assert list(results["a"].columns) == ["x", "ema"]
+    np.testing.assert_allclose(results["a"]["x"], results["b"]["y"])
+    # The EMA(12) of screen "a" is reused by MACD in screen "b".
+    assert sum(1 for key in engine._results if key[0] == "ema") == 2
+
+
+def test_screen_lookback_and_condition(histories):
+    screen = Screen(
+        "uptrend",
+        {"close": ("field", {"column": "close"}), "sma20": ("sma", {"period": 20})},
+        lookback=100,
+        condition=lambda df: df["close"] > df["sma20"],
+    )
+
+    df = IndicatorEngine(histories).run([screen])["uptrend"]
+
+    assert "BBB" not in df.index
+    for symbol in df.index:
+        assert histories[symbol]["close"].iat[-1] > histories[symbol]["close"].tail(20).mean()
+
+
+def test_invalid_specs(histories):
+    with pytest.raises(ValueError):
+        IndicatorEngine(histories).compute("nope")
+    with pytest.raises(ValueError):
+        Screen("bad", {"x": "sma"})
+    with pytest.raises(ValueError):
+        IndicatorEngine(histories).compute("sma", field="adjusted_close")
+
+
+def test_empty_engine():
+    df = IndicatorEngine({}).run([Screen("s", {"sma": ("sma", {"period": 5})})])["s"]
+    assert df.empty and list(df.columns) == ["sma"]
@@ -0,0 +1,112 @@
+"""Tests for APIClient.get_intraday_range window splitting."""
+
+import re
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+
+from eodhd import APIClient
+from eodhd.errors import EODHDHTTPError
+
+DAY = 86400
+
+
+def _bars(start, end, step):
+    first = -(-start // step) * step
+    return [
+        {"timestamp": t, "gmtoffset": 0, "datetime": "", "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5,
+         "volume": 10}
+        for t in range(first, end + 1, step)
+    ]
+
+
+@pytest.fixture
+def client():
+    api = APIClient(api_key="demo1234567890123456")
+    api.requests = []
+    lock = threading.Lock()
+
+    def get(url, timeout=None):
+        start = int(re.search(r"&from=(\d+)", url).group(1))
+        end = int(re.search(r"&to=(\d+)", url).group(1))
+        with lock:
+            api.requests.append((start, end))
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.json.return_value = _bars(start, end, 3600)
+        return resp
+
+    api._session = MagicMock()
+    api._session.get.side_effect = get
+    return api
+
+
+def test_windows_respect_limits():
+    windows = APIClient._intraday_windows("1m", 0, 300 * DAY)
+    assert windows == [(0, 120 * DAY), (120 * DAY, 240 * DAY), (240 * DAY, 300 * DAY)]
+    assert APIClient._intraday_windows("1h", 0, 7000 * DAY) == [(0, 7000 * DAY)]
+
+
+def test_range_is_split_fetched_and_deduplicated(client):
+    start = 1_600_000_000 - 1_600_000_000 % 3600
+    end = start + 1000 * DAY
+
+    df = client.get_intraday_range("AAPL.US", "5m", start=start, end=end, max_workers=4)
+
+    assert len(client.requests) == 2
+    assert all(to - frm <= 600 * DAY for frm, to in client.requests)
+    assert df["timestamp"].is_unique and df["timestamp"].is_monotonic_increasing
+    assert len(df) == 1000 * 24 + 1
+    assert df["timestamp"].dtype == np.int64 and df["close"].dtype == np.float64
+    assert df.index[0] == pd.Timestamp(start, unit="s")
+
+
+def test_accepts_dates_as_utc(client):
+    client.get_intraday_range("AAPL.US", "1h", start="2021-01-01", end=datetime(2021, 1, 2))
+    assert client.requests == [(
+        int(datetime(2021, 1, 1, tzinfo=timezone.utc).timestamp()),
+        int(datetime(2021, 1, 2, tzinfo=timezone.utc).timestamp()),
+    )]
+
+
+def test_invalid_arguments(client):
+    with pytest.raises(ValueError):
+        client.get_intraday_range("AAPL.US", "2m", start=0, end=10)
+    with pytest.raises(ValueError):
+        client.get_intraday_range("AAPL.US", "1m", start=10, end=10)
+    with pytest.raises(ValueError):
+        client.get_intraday_range("AAPL.US", "1m", start="yesterday")
+
+
+def test_failed_window_raises(client):
+    failing = MagicMock(status_code=403, text="", headers={})
+    failing.json.return_value = {"message": "Forbidden"}
+    ok = client._session.get.side_effect
+    calls = iter([ok, lambda url, timeout=None: failing])
+    client._session.get.side_effect = lambda url, timeout=None: next(calls)(url, timeout=timeout)
+
+    with pytest.raises(EODHDHTTPError):
+        client.get_intraday_range("AAPL.US", "1m", start=0, end=200 * DAY, max_workers=1)
+
+
+def test_empty_range(client):
+    client._session.get.side_effect = None
+    resp = MagicMock(status_code=200)
+    resp.json.return_value = []
+    client._session.get.return_value = resp
+    df = client.get_intraday_range("AAPL.US", "1m", start=0, end=DAY)
+    assert df.empty
+    assert list(df.columns) == ["timestamp", "gmtoffset", "open", "high", "low", "close", "volume"]
+
+
+def test_dtypes_match_get_historical_data(client):
+    from eodhd.apiclient import _INTRADAY_COLUMNS
+
+    df = client.get_intraday_range("AAPL.US", "1h", start=0, end=2 * DAY)
+    expected = {field: dtype for field, dtype in _INTRADAY_COLUMNS.values() if field is not None}
+    assert {column: df[column].dtype for column in df.columns} == expected
+    assert df["volume"].dtype == np.float64
@@ -0,0 +1,227 @@
+"""Tests for auto-pagination (iter_pages / iter_records and APIClient.iter_*)."""
+
+import re
+import threading
+
+import pytest
+from unittest.mock import MagicMock
+
+from eodhd import APIClient
+from eodhd.pagination import iter_pages, iter_records
+
+ITEMS = [{"id": i} for i in range(23)]
+
+
+def _envelope(offset, limit, items=ITEMS, with_total=True, next_link=True):
+    page = items[offset:offset + limit]
+    more = offset + limit < len(items)
+    next_url = f"https://eodhd.com/api/x?api_token=t&page[offset]={offset + limit}&page[limit]={limit}"
+    meta = {"offset": offset, "limit": limit}
+    if with_total:
+        meta["total"] = len(items)
+    return {"data": page, "meta": meta, "links": {"next": next_url if more and next_link else None}}
+
+
+def _fake_session(calls, **envelope_kwargs):
+    def get(url, timeout=None):
+        match = re.search(r"page\[offset\]=(\d+)", url)
+        offset = int(match.group(1)) if match else 0
+        match = re.search(r"page\[limit\]=(\d+)", url)
+        limit = int(match.group(1)) if match else 10
+        calls.append((offset, limit))
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.json.return_value = _envelope(offset, limit, **envelope_kwargs)
+        return resp
+
+    session = MagicMock()
+    session.get.side_effect = get
+    return session
+
+
+def test_iter_pages_follows_links():
+    calls = []
+    pages = list(iter_pages(lambda o, l: calls.append(o) or _envelope(o, l), 0, 10))
+    assert calls == [0, 10, 20]
+    assert [len(p["data"]) for p in pages] == [10, 10, 3]
+
+
+def test_iter_pages_stops_on_total_without_next_offset():
+    def fetch(offset, limit):
+        envelope = _envelope(offset, limit)
+        if envelope["links"]["next"]:
+            envelope["links"]["next"] = "https://eodhd.com/api/x?cursor=abc"
+        return envelope
+
+    assert len(list(iter_records(iter_pages(fetch, 0, 5)))) == 23
+
+
+def test_iter_pages_max_offset():
+    calls = []
+    list(iter_pages(lambda o, l: calls.append(o) or _envelope(o, l), 0, 5, max_offset=10))
+    assert calls == [0, 5, 10]
+
+
+def test_iter_pages_empty_page_stops():
+    calls = []
+
+    def fetch(offset, limit):
+        calls.append(offset)
+        return {"data": [], "meta": {}, "links": {"next": "https://eodhd.com/api/x?page[offset]=99"}}
+
+    assert list(iter_records(iter_pages(fetch))) == []
+    assert calls == [0]
+
+
+def test_prefetch_overlaps_next_request():
+    requested = []
+    second_requested = threading.Event()
+
+    def fetch(offset, limit):
+        requested.append(offset)
+        if offset == 10:
+            second_requested.set()
+        return _envelope(offset, limit)
+
+    pages = iter_pages(fetch, 0, 10, prefetch=True)
+    next(pages)
+    # The consumer has not asked for page 2 yet, but it is already in flight.
+    assert second_requested.wait(timeout=2)
+    assert [len(p["data"]) for p in pages] == [10, 3]
+    assert requested == [0, 10, 20]
+
+
+def test_prefetch_close_early():
+    pages = iter_pages(lambda o, l: _envelope(o, l), 0, 5, prefetch=True)
+    next(pages)
+    pages.close()
+
+
+def test_iter_records_keyed_data():
+    pages = [{"data": {"AAPL.US": {"last": 1}}, "links": {}}]
+    assert list(iter_records(pages)) == [("AAPL.US", {"last": 1})]
+
+
+@pytest.fixture
+def client():
+    return APIClient(api_key="demo1234567890123456")
+
+
+@pytest.mark.parametrize("method, args", [
+    ("iter_sanctions_entities", {"program": "SDN"}),
+    ("iter_sanctions_vessels", {}),
+    ("iter_id_mapping", {"isin": "US0378331005"}),
+    ("iter_real_estate_countries", {}),
+    ("iter_real_estate_detailed_prices", {"code": "US"}),
+    ("iter_mp_tickdata", {"symbol": "AAPL"}),
+])
+def test_apiclient_iterators(client, method, args):
+    calls = []
+    client._session = _fake_session(calls)
+    records = list(getattr(client, method)(page_limit=10, **args))
+    assert records == ITEMS
+    assert [offset for offset, _ in calls] == [0, 10, 20]
+
+
+def test_apiclient_options_defaults_and_prefetch(client):
+    calls = []
+    client._session = _fake_session(calls)
+    records = list(client.iter_us_options_eod(underlying_symbol="AAPL", prefetch=True))
+    assert records == ITEMS
+    assert calls == [(0, 1000)]  # the method's own default page_limit is kept
+
+
+def test_apiclient_iter_pages_start_offset(client):
+    calls = []
+    client._session = _fake_session(calls, next_link=True)
+    pages = list(client.iter_pages("get_sanctions_entities", page_offset=10, page_limit=10))
+    assert [offset for offset, _ in calls] == [10, 20]
+    assert len(pages) == 2
+
+
+def test_fetch_all_pages_parallel_in_order():
+    requested = []
+    lock = threading.Lock()
+
+    def fetch(offset, limit):
+        with lock:
+            requested.append(offset)
+        return _envelope(offset, limit)
+
+    from eodhd.pagination import fetch_all_pages, merge_pages
+    pages = fetch_all_pages(fetch, 0, 5, max_workers=4)
+    assert sorted(requested) == [0, 5, 10, 15, 20]
+    assert merge_pages(pages)["data"] == ITEMS
+
+
+def test_fetch_all_pages_without_total_is_serial():
+    from eodhd.pagination import fetch_all_pages
+    calls = []
+    pages = fetch_all_pages(lambda o, l: calls.append(o) or _envelope(o, l, with_total=False), 0, 10)
+    assert calls == [0, 10, 20]
+    assert len(pages) == 3
+
+
+def test_fetch_all_pages_respects_max_offset():
+    from eodhd.pagination import fetch_all_pages
+    calls = []
+    fetch_all_pages(lambda o, l: calls.append(o) or _envelope(o, l), 0, 5, max_offset=10)
+    assert sorted(calls) == [0, 5, 10]
+
+
+def test_fetch_all_pages_next_link_beyond_total():
+    from eodhd.pagination import fetch_all_pages
+    calls = []
+    first = {"data": ITEMS[:3], "meta": {"total": 5},
+             "links": {"next": "https://eodhd.com/api/x?api_token=t&page[offset]=10&page[limit]=10"}}
+    assert fetch_all_pages(lambda o, l: calls.append(o) or first, 0, 10) == [first]
+    assert calls == [0]
+
+
+def test_merge_pages_keyed_data():
+    from eodhd.pagination import merge_pages
+    merged = merge_pages([{"data": {"A": 1}, "meta": {"total": 2}}, {"data": {"B": 2}}])
+    assert merged == {"data": {"A": 1, "B": 2}, "meta": {"total": 2, "count": 2}, "links": {"next": None}}
+
+
+@pytest.mark.parametrize("method, args", [
+    ("get_sanctions_entities", {"program": "SDN", "page_limit": 5}),
+    ("get_id_mapping", {"isin": "US0378331005", "page_limit": 5}),
+    ("get_real_estate_detailed_prices", {"code": "AE", "page_limit": 5}),
+    ("get_us_options_eod", {"underlying_symbol": "AAPL", "page_limit": 5}),
+])
+def test_fetch_all_mode(client, method, args):
+    calls = []
+    client._session = _fake_session(calls)
+    result = getattr(client, method)(fetch_all=True, max_workers=3, **args)
+    assert result["data"] == ITEMS
+    assert result["meta"]["count"] == len(ITEMS)
+    assert result["links"]["next"] is None
+    assert sorted(offset for offset, _ in calls) == [0, 5, 10, 15, 20]
+
+
+def test_fetch_all_positional_args(client):
+    calls = []
+    client._session = _fake_session(calls)
+    result = client.get_real_estate_detailed_prices("AE", page_limit=10, fetch_all=True)
+    assert len(result["data"]) == len(ITEMS)
+
+
+def test_fetch_all_options_offset_cap_warns(client):
+    items = [{"id": i} for i in range(12000)]
+    calls = []
+    client._session = _fake_session(calls, items=items)
+    client.console = MagicMock()
+
+    result = client.get_us_options_eod(underlying_symbol="AAPL", fetch_all=True)
+
+    assert max(offset for offset, _ in calls) == 10000
+    assert len(result["data"]) == 11000
+    client.console.log.assert_called_once()
+
+
+def test_single_page_without_fetch_all(client):
+    calls = []
+    client._session = _fake_session(calls)
+    assert len(client.get_sanctions_entities(page_limit=5)["data"]) == 5
+    assert len(calls) == 1
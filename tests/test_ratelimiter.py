@@ -0,0 +1,125 @@
+"""Tests for RateLimiter and its wiring into BaseAPI / APIClient."""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eodhd import APIClient, RateLimiter
+from eodhd.APIs.BaseAPI import BaseAPI
+from eodhd.errors import EODHDError, EODHDRateLimitError
+
+
+def _ok(data):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = data
+    return resp
+
+
+def test_requires_a_limit():
+    with pytest.raises(ValueError):
+        RateLimiter(per_second=None, per_minute=None)
+
+
+def test_endpoint_costs():
+    limiter = RateLimiter()
+    assert limiter.cost("eod") == 1
+    assert limiter.cost("fundamentals") == 10
+    assert limiter.cost("technical/") == 5
+    assert limiter.cost("mp/unicornbay/options/eod") == 10
+    assert limiter.cost("bulk-fundamentals") == 100
+
+
+def test_custom_costs_override_defaults():
+    limiter = RateLimiter(costs={"eod": 3})
+    assert limiter.cost("eod") == 3
+
+
+def test_per_second_bucket_throttles():
+    limiter = RateLimiter(per_second=20, per_minute=None)
+    start = time.monotonic()
+    for _ in range(25):
+        limiter.acquire("eod")
+    # 20 burst tokens, then 5 more at 20/s -> at least ~0.25s
+    assert time.monotonic() - start >= 0.2
+
+
+def test_daily_budget_is_charged_by_cost():
+    limiter = RateLimiter(per_minute=None, daily_budget=25)
+    limiter.acquire("fundamentals")
+    limiter.acquire("fundamentals")
+    assert limiter.remaining_budget == 5
+    with pytest.raises(EODHDRateLimitError):
+        limiter.acquire("fundamentals")
+    limiter.acquire("eod")
+    assert limiter.remaining_budget == 4
+
+
+def test_rate_limit_error_is_eodhd_error():
+    assert issubclass(EODHDRateLimitError, EODHDError)
+
+
+def test_from_user_info():
+    limiter = RateLimiter.from_user_info({"dailyRateLimit": 100000, "apiRequests": 1500, "extraLimit": 500})
+    assert limiter.remaining_budget == 99000
+
+
+def test_from_user_info_requires_limit():
+    with pytest.raises(ValueError):
+        RateLimiter.from_user_info({"apiRequests": 10})
+
+
+def test_acquire_async():
+    limiter = RateLimiter(per_second=50, per_minute=None, daily_budget=100)
+
+    async def run():
+        await asyncio.gather(*(limiter.acquire_async("eod") for _ in range(10)))
+
+    asyncio.run(run())
+    assert limiter.remaining_budget == 90
+
+
+def test_baseapi_acquires_before_request():
+    session = MagicMock()
+    session.get.return_value = _ok({"ok": True})
+    limiter = MagicMock()
+
+    api = BaseAPI(session=session, rate_limiter=limiter)
+    api._rest_get_method(api_key="demo1234567890123456", endpoint="fundamentals", uri="AAPL.US")
+
+    limiter.acquire.assert_called_once_with("fundamentals")
+
+
+def test_baseapi_budget_exhausted_sends_nothing():
+    session = MagicMock()
+    api = BaseAPI(session=session, rate_limiter=RateLimiter(per_minute=None, daily_budget=5))
+
+    with pytest.raises(EODHDRateLimitError):
+        api._rest_get_method(api_key="demo1234567890123456", endpoint="fundamentals", uri="AAPL.US")
+    session.get.assert_not_called()
+
+
+def test_apiclient_passes_limiter_to_wrappers_and_rest_get():
+    limiter = RateLimiter(per_minute=None, daily_budget=1000)
+    client = APIClient(api_key="demo1234567890123456", rate_limiter=limiter)
+    client._session = MagicMock()
+    client._session.get.return_value = _ok([{"code": "US"}])
+
+    client.get_fundamentals_data("AAPL.US")
+    client.get_exchanges()
+
+    assert limiter.remaining_budget == 1000 - 10 - 1
+
+
+def test_enable_account_rate_limit():
+    with patch("eodhd.apiclient.requests.Session"):
+        client = APIClient(api_key="demo1234567890123456")
+    client._session = MagicMock()
+    client._session.get.return_value = _ok({"dailyRateLimit": 100000, "apiRequests": 40})
+
+    limiter = client.enable_account_rate_limit(per_second=10)
+
+    assert client.rate_limiter is limiter
+    assert limiter.remaining_budget == 99960
@@ -0,0 +1,107 @@
+"""Tests for MemoryCache and APIClient reference-data memoisation."""
+
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+from eodhd import APIClient
+from eodhd.cache import MemoryCache
+
+
+def _ok(data):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = data
+    return resp
+
+
+@pytest.fixture
+def client():
+    api = APIClient(api_key="test1234567890123456", reference_cache_ttl=3600)
+    api._session = MagicMock()
+    api._session.get.return_value = _ok({"data": [{"program": "SDN"}], "meta": {}, "links": {}})
+    return api
+
+
+def test_memory_cache_lru_and_stats():
+    cache = MemoryCache(maxsize=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)  # evicts b, the least recently used
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 1, "entries": 2}
+
+
+def test_memory_cache_ttl():
+    cache = MemoryCache(ttl=0.05)
+    cache.put("a", 1)
+    time.sleep(0.1)
+    assert cache.get("a", "gone") == "gone"
+
+
+def test_memory_cache_invalidate_predicate():
+    cache = MemoryCache()
+    cache.put(("x", 1), 1)
+    cache.put(("y", 1), 2)
+    cache.invalidate(lambda key: key[0] == "x")
+    assert cache.get(("x", 1)) is None
+    assert cache.get(("y", 1)) == 2
+
+
+def test_memory_cache_invalid_args():
+    with pytest.raises(ValueError):
+        MemoryCache(maxsize=0)
+    with pytest.raises(ValueError):
+        MemoryCache(ttl=0)
+
+
+@pytest.mark.parametrize("method", [
+    "get_exchanges", "get_list_of_exchanges", "get_exchange_details_v2_list", "get_cboe_indices_list",
+    "mp_indices_list", "get_sanctions_programs", "get_sanctions_sources", "get_us_options_underlyings",
+])
+def test_reference_methods_are_memoised(client, method):
+    getattr(client, method)()
+    getattr(client, method)()
+    client._session.get.assert_called_once()
+
+
+def test_results_are_copies(client):
+    first = client.get_sanctions_programs()
+    first["data"].append("mutated")
+    assert client.get_sanctions_programs()["data"] == [{"program": "SDN"}]
+
+
+def test_arguments_are_part_of_the_key(client):
+    client.get_us_options_underlyings(page_limit=10)
+    client.get_us_options_underlyings(page_limit=20)
+    assert client._session.get.call_count == 2
+
+
+def test_clear_reference_cache_and_stats(client):
+    client.get_sanctions_programs()
+    client.get_sanctions_sources()
+    client.get_sanctions_programs()
+    assert client.reference_cache_stats()["hits"] == 1
+
+    client.clear_reference_cache("get_sanctions_programs")
+    client.get_sanctions_programs()
+    client.get_sanctions_sources()
+    assert client._session.get.call_count == 3
+
+    client.clear_reference_cache()
+    client.get_sanctions_sources()
+    assert client._session.get.call_count == 4
+
+
+@pytest.mark.parametrize("options", [{}, {"reference_cache_ttl": 0}])
+def test_disabled_by_default_and_with_zero_ttl(options):
+    api = APIClient(api_key="test1234567890123456", **options)
+    api._session = MagicMock()
+    api._session.get.return_value = _ok([])
+    api.get_list_of_exchanges()
+    api.get_list_of_exchanges()
+    assert api._session.get.call_count == 2
+    assert api.reference_cache_stats() == {}
@@ -0,0 +1,188 @@
+"""Tests for RetryPolicy and retries in BaseAPI / APIClient."""
+
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from requests import ConnectionError as RequestsConnectionError, Timeout as RequestsTimeout
+
+from eodhd import APIClient, RetryPolicy
+from eodhd.APIs.BaseAPI import BaseAPI
+from eodhd.errors import EODHDHTTPError, EODHDConnectionError, EODHDTimeoutError
+
+
+def _resp(status, data=None, headers=None, content=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = headers or {}
+    resp.text = ""
+    resp.content = content if content is not None else json.dumps(data).encode()
+    if data is None:
+        resp.json.side_effect = ValueError("no json")
+    else:
+        resp.json.return_value = data
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch("eodhd.retry.time.sleep") as sleep:
+        yield sleep
+
+
+def test_invalid_max_attempts():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+    for attempt in range(1, 10):
+        delay = policy.backoff(attempt)
+        assert 0.0 <= delay <= min(5.0, 2 ** (attempt - 1))
+
+
+def test_retry_after_parsing():
+    assert RetryPolicy.retry_after(_resp(429, headers={"Retry-After": "7"})) == 7.0
+    assert RetryPolicy.retry_after(_resp(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert RetryPolicy.retry_after(_resp(429, headers={"Retry-After": "soon"})) is None
+    assert RetryPolicy.retry_after(_resp(429)) is None
+
+
+def test_retries_5xx_then_succeeds(no_sleep):
+    session = MagicMock()
+    session.get.side_effect = [_resp(503), _resp(502), _resp(200, {"ok": True})]
+    policy = RetryPolicy(max_attempts=3)
+
+    api = BaseAPI(session=session, retry_policy=policy)
+    assert api._rest_get_method(api_key="demo1234567890123456", endpoint="test") == {"ok": True}
+
+    assert session.get.call_count == 3
+    assert no_sleep.call_count == 2
+    stats = policy.stats()
+    assert stats["requests"] == 1
+    assert stats["retries"] == 2
+    assert stats["retried_statuses"] == 2
+
+
+def test_retried_responses_are_closed():
+    session = MagicMock()
+    failed = [_resp(503), _resp(502)]
+    session.get.side_effect = failed + [_resp(200, [{"code": "A"}])]
+
+    api = BaseAPI(session=session, retry_policy=RetryPolicy(max_attempts=3))
+    resp = api._get_response("demo1234567890123456", "eod-bulk-last-day", "US", "", stream=True)
+
+    assert resp.status_code == 200
+    for retried in failed:
+        retried.close.assert_called_once()
+    resp.close.assert_not_called()
+
+
+def test_honours_retry_after(no_sleep):
+    session = MagicMock()
+    session.get.side_effect = [_resp(429, headers={"Retry-After": "3"}), _resp(200, [1])]
+    policy = RetryPolicy()
+
+    BaseAPI(session=session, retry_policy=policy)._rest_get_method(api_key="demo1234567890123456", endpoint="test")
+
+    no_sleep.assert_called_once_with(3.0)
+    assert policy.stats()["retry_after_waits"] == 1
+
+
+def test_gives_up_on_excessive_retry_after(no_sleep):
+    session = MagicMock()
+    session.get.return_value = _resp(429, headers={"Retry-After": "3600"})
+    policy = RetryPolicy(max_retry_after=60)
+
+    with pytest.raises(EODHDHTTPError) as exc_info:
+        BaseAPI(session=session, retry_policy=policy)._rest_get_method(api_key="demo1234567890123456", endpoint="test")
+
+    assert exc_info.value.status_code == 429
+    session.get.assert_called_once()
+    no_sleep.assert_not_called()
+    assert policy.stats()["gave_up"] == 1
+
+
+def test_gives_up_after_max_attempts():
+    session = MagicMock()
+    session.get.return_value = _resp(500)
+    policy = RetryPolicy(max_attempts=4)
+
+    with pytest.raises(EODHDHTTPError):
+        BaseAPI(session=session, retry_policy=policy)._rest_get_method(api_key="demo1234567890123456", endpoint="test")
+
+    assert session.get.call_count == 4
+    assert policy.stats()["gave_up"] == 1
+
+
+def test_non_retryable_status_not_retried():
+    session = MagicMock()
+    session.get.return_value = _resp(404)
+
+    with pytest.raises(EODHDHTTPError):
+        BaseAPI(session=session, retry_policy=RetryPolicy())._rest_get_method(api_key="demo1234567890123456", endpoint="test")
+
+    session.get.assert_called_once()
+
+
+def test_retries_connection_errors_and_timeouts():
+    session = MagicMock()
+    session.get.side_effect = [RequestsConnectionError("reset"), RequestsTimeout("slow"), _resp(200, {"ok": 1})]
+    policy = RetryPolicy(max_attempts=3)
+
+    assert BaseAPI(session=session, retry_policy=policy)._rest_get_method(
+        api_key="demo1234567890123456", endpoint="test") == {"ok": 1}
+    stats = policy.stats()
+    assert stats["retried_connection_errors"] == 1
+    assert stats["retried_timeouts"] == 1
+
+
+def test_exhausted_connection_errors_keep_error_types():
+    session = MagicMock()
+    session.get.side_effect = RequestsConnectionError("reset")
+    with pytest.raises(EODHDConnectionError):
+        BaseAPI(session=session, retry_policy=RetryPolicy(max_attempts=2))._rest_get_method(
+            api_key="demo1234567890123456", endpoint="test")
+
+    session.get.side_effect = RequestsTimeout("slow")
+    with pytest.raises(EODHDTimeoutError):
+        BaseAPI(session=session, retry_policy=RetryPolicy(max_attempts=2))._rest_get_method(
+            api_key="demo1234567890123456", endpoint="test")
+
+
+def test_rest_get_raw_retries():
+    session = MagicMock()
+    session.get.side_effect = [_resp(503), _resp(200, content=b"PNG")]
+
+    api = BaseAPI(session=session, retry_policy=RetryPolicy())
+    assert api._rest_get_raw(api_key="demo1234567890123456", endpoint="logo", uri="AAPL.US") == b"PNG"
+
+
+def test_post_is_not_retried():
+    session = MagicMock()
+    session.post.return_value = _resp(503)
+
+    with pytest.raises(EODHDHTTPError):
+        BaseAPI(session=session, retry_policy=RetryPolicy())._rest_post_method(api_key="demo1234567890123456", endpoint="test")
+
+    session.post.assert_called_once()
+
+
+def test_apiclient_rest_get_retries():
+    policy = RetryPolicy()
+    client = APIClient(api_key="demo1234567890123456", retry_policy=policy)
+    client._session = MagicMock()
+    client._session.get.side_effect = [_resp(502), _resp(200, [{"Code": "US"}])]
+
+    df = client.get_exchanges()
+
+    assert len(df) == 1
+    assert client.retry_policy.stats()["retries"] == 1
+
+
+def test_no_policy_means_no_retry():
+    session = MagicMock()
+    session.get.return_value = _resp(503)
+    with pytest.raises(EODHDHTTPError):
+        BaseAPI(session=session)._rest_get_method(api_key="demo1234567890123456", endpoint="test")
+    session.get.assert_called_once()
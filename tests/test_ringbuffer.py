@@ -0,0 +1,85 @@
+"""Tests for the tick ring buffers and WebSocketClient's bounded storage."""
+
+import json
+
+import numpy as np
+import pytest
+
+from eodhd import TickBuffers, TickRingBuffer, WebSocketClient
+
+
+def test_ring_buffer_keeps_the_last_ticks_in_order():
+    buffer = TickRingBuffer(3)
+    assert len(buffer) == 0
+    assert buffer.snapshot()["price"].size == 0
+
+    for i in range(5):
+        buffer.append(1000 + i, 10.0 + i, i)
+
+    assert len(buffer) == 3 and buffer.total == 5
+    snapshot = buffer.snapshot()
+    np.testing.assert_array_equal(snapshot["timestamp"], [1002, 1003, 1004])
+    np.testing.assert_array_equal(snapshot["price"], [12.0, 13.0, 14.0])
+    assert snapshot["timestamp"].dtype == np.int64
+
+    # Snapshots are copies.
+    snapshot["price"][0] = -1
+    assert buffer.snapshot()["price"][0] == 12.0
+    buffer.clear()
+    assert len(buffer) == 0
+
+
+def test_ring_buffer_does_not_grow():
+    buffer = TickRingBuffer(4)
+    arrays = [column for column in buffer.columns.values()]
+    for i in range(100):
+        buffer.append(i, float(i), 1.0)
+    assert all(a is b for a, b in zip(arrays, buffer.columns.values()))
+    assert list(buffer.to_frame()["timestamp"]) == [96, 97, 98, 99]
+
+
+@pytest.mark.parametrize("capacity", [0, -1, 1.5, True])
+def test_invalid_capacity(capacity):
+    with pytest.raises(ValueError):
+        TickBuffers(capacity)
+
+
+def test_tick_buffers_per_symbol_frame():
+    buffers = TickBuffers(2)
+    assert list(buffers.to_frame().columns) == ["symbol", "timestamp", "price", "size", "datetime"]
+
+    buffers.append("BTC-USD", 0, 1.0, 0.5)
+    buffers.append("ETH-USD", 60_000, 2.0, 1.0)
+    buffers.append("BTC-USD", 1_000, 3.0, 0.5)
+    buffers.append("BTC-USD", 2_000, 4.0, 0.5)
+
+    df_data = buffers.to_frame()
+    assert list(df_data["symbol"]) == ["BTC-USD", "BTC-USD", "ETH-USD"]
+    assert list(df_data["price"]) == [3.0, 4.0, 2.0]
+    assert str(df_data["datetime"].iloc[2]) == "1970-01-01 00:01:00+00:00"
+    assert list(buffers.to_frame("ETH-USD")["price"]) == [2.0]
+    assert len(buffers.to_frame("XRP-USD")) == 0
+    assert len(buffers) == 3
+
+
+def test_websocketclient_buffers_instead_of_storing_messages():
+    client = WebSocketClient(api_key="00000000000000000000000000000000", endpoint="crypto",
+                             symbols=["BTC-USD"], store_data=True, buffer_capacity=2)
+    candles = client._new_candle_state()
+    for i in range(3):
+        client._process_message(json.dumps({"s": "BTC-USD", "p": 10.0 + i, "q": "0.1", "t": i}), candles)
+    client._process_message(json.dumps({"status_code": 200, "message": "Authorized"}), candles)
+
+    assert client.data_list == []
+    df_data = client.get_data()
+    assert list(df_data["price"]) == [11.0, 12.0]
+    assert list(df_data["size"]) == [0.1, 0.1]
+
+
+def test_websocketclient_keeps_raw_messages_without_buffer():
+    client = WebSocketClient(api_key="00000000000000000000000000000000", endpoint="crypto",
+                             symbols=["BTC-USD"], store_data=True)
+    message = json.dumps({"s": "BTC-USD", "p": 10.0, "t": 0})
+    client._process_message(message, client._new_candle_state())
+    assert client.buffers is None
+    assert client.get_data() == [message]
@@ -0,0 +1,98 @@
+"""Tests for ScannerClient.scan_markets."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+
+from eodhd import ScannerClient
+from eodhd.errors import EODHDHTTPError
+
+
+def _history(symbol, bars, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    return pd.DataFrame(
+        {
+            "symbol": symbol, "interval": "d", "open": close, "high": close + rng.uniform(0, 2, bars),
+            "low": close - rng.uniform(0, 2, bars), "close": close, "adjusted_close": close,
+            "volume": rng.integers(1, 10 ** 6, bars),
+        },
+        index=pd.date_range("2023-01-01", periods=bars, freq="D"),
+    )
+
+
+def _reference_row(df_data):
+    """The per-symbol computation of the original scan_markets."""
+    df_data = df_data.copy()
+    df_data["sma50"] = df_data.adjusted_close.rolling(50, min_periods=1).mean()
+    df_data["sma200"] = df_data.adjusted_close.rolling(200, min_periods=1).mean()
+    df_data["ema12"] = df_data.adjusted_close.ewm(span=12, adjust=False).mean()
+    df_data["ema26"] = df_data.adjusted_close.ewm(span=26, adjust=False).mean()
+    high_low = df_data["high"] - df_data["low"]
+    high_close = abs(df_data["high"] - df_data["adjusted_close"].shift())
+    low_close = abs(df_data["low"] - df_data["adjusted_close"].shift())
+    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+    df_data["atr14"] = true_range.rolling(14).sum() / 14
+    return df_data.iloc[-1]
+
+
+@pytest.fixture
+def scanner():
+    scanner = ScannerClient("test1234567890123456")
+    scanner.api.get_exchange_symbols = MagicMock(return_value=pd.DataFrame(
+        {"Code": ["BTC-USD", "ETH-USD", "XRP-USD", "SHORT-USD", "BTC-EUR"]}
+    ))
+    histories = {
+        "BTC-USD.CC": _history("BTC-USD.CC", 300, 1),
+        "ETH-USD.CC": _history("ETH-USD.CC", 250, 2),
+        "SHORT-USD.CC": _history("SHORT-USD.CC", 50, 3),
+    }
+
+    def get_historical_data(symbol, interval="d"):
+        if symbol not in histories:
+            raise EODHDHTTPError(404, "https://eodhd.com/api/eod", "not found")
+        return histories[symbol]
+
+    scanner.api.get_historical_data = MagicMock(side_effect=get_historical_data)
+    scanner.histories = histories
+    return scanner
+
+
+def test_scan_returns_one_row_per_symbol_with_enough_bars(scanner):
+    df = scanner.scan_markets("CC", "d", "USD", 0, max_workers=4)
+
+    assert sorted(df["symbol"]) == ["BTC-USD.CC", "ETH-USD.CC"]
+    assert scanner.api.get_historical_data.call_count == 4
+    assert df["sma50"].dtype == np.float64
+    assert df["bull_market"].dtype == bool
+
+
+def test_indicators_match_rolling_computation(scanner):
+    df = scanner.scan_markets("CC", "d", "USD", 0).set_index("symbol")
+
+    for symbol in ("BTC-USD.CC", "ETH-USD.CC"):
+        expected = _reference_row(scanner.histories[symbol])
+        for column in ("sma50", "sma200", "ema12", "ema26", "atr14"):
+            assert df.loc[symbol, column] == pytest.approx(expected[column])
+        assert df.loc[symbol, "next_action"] == ("sell" if expected["ema12"] > expected["ema26"] else "buy")
+
+
+def test_request_limit_and_optional_file(scanner, tmp_path):
+    output = tmp_path / "scan.csv"
+
+    df = scanner.scan_markets("CC", "d", "USD", 2, output_file=str(output))
+
+    assert list(df["symbol"]) == ["BTC-USD.CC"]
+    assert pd.read_csv(output)["symbol"].tolist() == ["BTC-USD.CC"]
+
+
+def test_no_file_written_by_default(scanner, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    scanner.scan_markets("CC", "d", "USD", 0)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_request_limit_bounds(scanner):
+    with pytest.raises(ValueError):
+        scanner.scan_markets("CC", "d", "USD", 100001)
@@ -0,0 +1,217 @@
+"""Tests for the local export sinks."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+
+from eodhd import APIClient, CSVSink, make_sink
+from eodhd.sinks import SCHEMAS, Sink, apply_schema, parquet_available, to_frame
+from eodhd.ticks import ticks_to_numpy
+
+
+def _bar(date, close, volume=1000):
+    return {"date": date, "open": close, "high": close, "low": close, "close": close,
+            "adjusted_close": close, "volume": volume}
+
+
+def _relative(paths, root):
+    return sorted(os.path.relpath(os.path.dirname(path), root) for path in paths)
+
+
+def test_to_frame_shapes():
+    records = [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+    assert list(to_frame(records)["a"]) == [1, 2]
+    assert list(to_frame({"data": records, "meta": {}, "links": {}})["b"]) == ["x", "y"]
+    assert list(to_frame({"a": [1, 2], "b": ["x", "y"]})["a"]) == [1, 2]
+    assert set(to_frame({"General": {"Code": "AAPL"}, "x": 1}).columns) == {"General.Code", "x"}
+    assert to_frame([]).empty
+
+    indexed = pd.DataFrame({"close": [1.0]}, index=pd.DatetimeIndex(["2024-01-02"]))
+    assert list(to_frame(indexed).columns) == ["date", "close"]
+
+    ticks = ticks_to_numpy({"ts": [1000], "price": [1.5], "shares": [10]}, "ms")
+    assert to_frame(ticks)["ts"].tolist() == [10 ** 9]
+
+    with pytest.raises(ValueError):
+        to_frame("text")
+    with pytest.raises(ValueError):
+        to_frame(np.arange(3))
+
+
+def test_apply_schema_adds_missing_columns_with_stable_types():
+    df = apply_schema(pd.DataFrame([{"date": "2024-01-02", "close": "10", "volume": None}]), SCHEMAS["eod"])
+
+    assert df["date"].dtype == "datetime64[ns]"
+    assert df["close"].dtype == "float64"
+    assert df["volume"].dtype == "float64"
+    assert df["open"].isna().all() and df["open"].dtype == "float64"
+
+
+def test_fractional_volumes_are_kept():
+    df = apply_schema(pd.DataFrame([dict(_bar("2024-01-02", 1.0), volume=0.125)]), SCHEMAS["eod"])
+    assert df["volume"].tolist() == [0.125]
+
+
+def test_csv_sink_partitions_by_symbol(tmp_path):
+    sink = CSVSink(str(tmp_path))
+
+    paths = sink.write([_bar("2024-01-02", 10.0), _bar("2024-01-03", 11.0)], "eod", symbol="AAPL.US")
+
+    assert _relative(paths, tmp_path) == [os.path.join("eod", "symbol=AAPL.US")]
+    assert sorted(sink.files) == sorted(paths)
+    assert pd.read_csv(paths[0])["close"].tolist() == [10.0, 11.0]
+
+
+def test_year_and_month_partitions(tmp_path):
+    sink = CSVSink(str(tmp_path), partition_by=("symbol", "year", "month"))
+    rows = [_bar("2023-12-29", 9.0), _bar("2024-01-02", 10.0), _bar("2024-01-03", 11.0), _bar(None, 12.0)]
+
+    paths = sink.write(rows, "eod", symbol="AAPL.US")
+
+    assert _relative(paths, tmp_path) == [
+        os.path.join("eod", "symbol=AAPL.US", "year=2023", "month=12"),
+        os.path.join("eod", "symbol=AAPL.US", "year=2024", "month=1"),
+        os.path.join("eod", "symbol=AAPL.US", "year=__HIVE_DEFAULT_PARTITION__", "month=__HIVE_DEFAULT_PARTITION__"),
+    ]
+    assert len(pd.read_csv(sorted(paths)[1])) == 2
+
+
+def test_symbol_from_column_and_method_dataset(tmp_path):
+    sink = CSVSink(str(tmp_path), partition_by=["symbol"])
+    rows = [dict(_bar("2024-01-02", 1.0), code="AAPL"), dict(_bar("2024-01-02", 2.0), code="MSFT")]
+
+    paths = sink.write(rows, "get_eod_splits_dividends_data")
+
+    assert _relative(paths, tmp_path) == [
+        os.path.join("eod-bulk-last-day", "symbol=AAPL"),
+        os.path.join("eod-bulk-last-day", "symbol=MSFT"),
+    ]
+
+
+def test_partition_columns_are_not_written(tmp_path):
+    sink = CSVSink(str(tmp_path))
+    rows = [dict(_bar("2024-01-02", 1.0), symbol="AAPL"), dict(_bar("2024-01-02", 2.0), symbol="MSFT")]
+
+    paths = sink.write(rows, "eod")
+
+    assert _relative(paths, tmp_path) == [os.path.join("eod", "symbol=AAPL"), os.path.join("eod", "symbol=MSFT")]
+    assert "symbol" not in pd.read_csv(paths[0]).columns
+
+
+def test_tick_dates_from_nanoseconds(tmp_path):
+    sink = CSVSink(str(tmp_path), partition_by=["month", "day"])
+    ticks = ticks_to_numpy({"ts": [1709251200000, 1709337600000], "price": [1.0, 2.0], "shares": [1, 2]}, "ms")
+
+    paths = sink.write(ticks, "ticks")
+
+    assert _relative(paths, tmp_path) == [
+        os.path.join("ticks", "month=3", "day=1"), os.path.join("ticks", "month=3", "day=2"),
+    ]
+
+
+def test_empty_result_writes_nothing(tmp_path):
+    assert CSVSink(str(tmp_path)).write([], "eod", symbol="AAPL.US") == []
+    assert os.listdir(tmp_path) == []
+
+
+def test_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        CSVSink(str(tmp_path), partition_by=["exchange"])
+    with pytest.raises(ValueError):
+        make_sink(str(tmp_path), "xlsx")
+
+    class NoWriter(Sink):
+        extension = ".txt"
+
+    with pytest.raises(TypeError):
+        Sink(str(tmp_path))
+    with pytest.raises(TypeError):
+        NoWriter(str(tmp_path))
+
+
+def test_make_sink_auto(tmp_path):
+    sink = make_sink(str(tmp_path))
+    assert sink.extension == (".parquet" if parquet_available() else ".csv")
+
+
+def test_fetch_many_writes_results_to_sink(tmp_path):
+    client = APIClient(api_key="test1234567890123456")
+    client._session = MagicMock()
+
+    def get(url, timeout=None):
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.json.return_value = [_bar("2024-01-02", 10.0)]
+        return resp
+
+    client._session.get.side_effect = get
+
+    with CSVSink(str(tmp_path)) as sink:
+        results = client.fetch_many(["AAPL.US", "MSFT.US"], method="get_eod_historical_stock_market_data",
+                                    sink=sink, from_date="2024-01-01")
+
+    assert list(results) == ["AAPL.US", "MSFT.US"]
+    assert _relative(results["MSFT.US"], tmp_path) == [os.path.join("eod", "symbol=MSFT.US")]
+
+
+def test_fetch_many_captures_sink_errors_per_item(tmp_path):
+    client = APIClient(api_key="test1234567890123456")
+    client._session = MagicMock()
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = [_bar("2024-01-02", 10.0)]
+    client._session.get.return_value = resp
+
+    class FullDiskSink(CSVSink):
+        def write(self, data, dataset, symbol=None):
+            if symbol == "MSFT.US":
+                raise OSError("No space left on device")
+            return super().write(data, dataset, symbol)
+
+    sink = FullDiskSink(str(tmp_path))
+
+    results = client.fetch_many(["AAPL.US", "MSFT.US"], method="get_eod_historical_stock_market_data", sink=sink)
+
+    assert _relative(results["AAPL.US"], tmp_path) == [os.path.join("eod", "symbol=AAPL.US")]
+    assert isinstance(results["MSFT.US"], OSError)
+
+
+def test_parquet_round_trip_keeps_types(tmp_path):
+    pytest.importorskip("pyarrow")
+    from eodhd import ParquetSink
+
+    paths = ParquetSink(str(tmp_path), partition_by=()).write([_bar("2024-01-02", 10.0)], "eod")
+    df = pd.read_parquet(paths[0])
+
+    assert df["date"].dtype == "datetime64[ns]"
+    assert df["volume"].dtype == "float64"
+
+
+def test_parquet_dataset_read_back(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+    from eodhd import ParquetSink
+
+    sink = ParquetSink(str(tmp_path), partition_by=("symbol", "year"))
+    sink.write([_bar("2023-12-29", 9.0), _bar("2024-01-02", 10.0)], "eod", symbol="AAPL.US")
+    sink.write([dict(_bar("2024-01-02", 20.0), symbol="MSFT.US")], "eod")
+
+    table = ds.dataset(str(tmp_path / "eod"), format="parquet", partitioning="hive").to_table()
+    df = table.to_pandas().sort_values(["symbol", "date"]).reset_index(drop=True)
+
+    assert df["symbol"].astype(str).tolist() == ["AAPL.US", "AAPL.US", "MSFT.US"]
+    assert df["year"].tolist() == [2023, 2024, 2024]
+    assert df["close"].tolist() == [9.0, 10.0, 20.0]
+    assert df["date"].dtype == "datetime64[ns]"
+
+
+def test_feather_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+    from eodhd import FeatherSink
+
+    paths = FeatherSink(str(tmp_path)).write([_bar("2024-01-02", 10.0)], "eod", symbol="AAPL.US")
+
+    assert pd.read_feather(paths[0])["close"].tolist() == [10.0]
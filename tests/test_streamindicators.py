@@ -0,0 +1,140 @@
+"""Tests for streaming indicators and their WebSocketClient hookup."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eodhd import WebSocketClient
+from eodhd.streamindicators import ATR, EMA, RSI, VWAP, RollingVolatility, StreamIndicator
+from eodhd.technical import _ema, _rsi
+from eodhd.websocketclient import parse_trade
+
+
+@pytest.fixture
+def prices():
+    return 100 + np.cumsum(np.random.default_rng(3).normal(0, 1, 200))
+
+
+def _feed(indicator, values):
+    return np.array([np.nan if v is None else v for v in map(indicator.update, values)])
+
+
+def test_ema_matches_batch_computation(prices):
+    np.testing.assert_allclose(_feed(EMA(10), prices), _ema(prices, 10))
+
+
+def test_rsi_matches_batch_computation(prices):
+    np.testing.assert_allclose(_feed(RSI(14), prices), _rsi(prices, 14))
+
+
+def test_rolling_volatility(prices):
+    expected = pd.Series(np.log(prices)).diff().rolling(20).std().to_numpy()
+    np.testing.assert_allclose(_feed(RollingVolatility(20), prices), expected)
+    assert RollingVolatility(20, annualization=4).update(1.0) is None
+
+
+def test_atr_from_candles():
+    atr = ATR(3)
+    candles = [{"h": 11, "l": 9, "c": 10}, {"h": 12, "l": 10, "c": 11}, {"h": 14, "l": 11, "c": 13}, {"h": 13, "l": 12, "c": 12}]
+    values = [atr.on_candle(candle) for candle in candles]
+
+    assert values[:2] == [None, None]
+    assert values[2] == pytest.approx((2 + 2 + 3) / 3)
+    assert values[3] == pytest.approx(values[2] + (1 - values[2]) / 3)
+    with pytest.raises(ValueError):
+        ATR(3, on="tick")
+
+
+def test_indicators_share_one_update_signature():
+    assert ATR(1).update(10.0, 5.0) == 0.0
+    atr = ATR(2)
+    atr.on_candle({"h": 11, "l": 9, "c": 10})
+    atr.reset()
+    assert atr.on == "candle" and atr.value is None
+
+    for indicator in (EMA(1), RSI(1), RollingVolatility(2), VWAP(), ATR(1)):
+        indicator.update(10.0, 1.0)
+    with pytest.raises(TypeError):
+        StreamIndicator()
+
+
+def test_vwap_and_reset():
+    vwap = VWAP()
+    vwap.on_tick(10.0, 1.0)
+    assert vwap.on_tick(20.0, 3.0) == pytest.approx(17.5)
+    assert vwap.on_tick(30.0, 0.0) == pytest.approx(17.5)
+    vwap.reset()
+    assert vwap.value is None and vwap.on == "tick"
+
+
+def test_candle_indicators_ignore_ticks():
+    ema = EMA(2)
+    ema.on_tick(10.0)
+    assert ema.value is None
+    ema.on_candle({"c": 10.0})
+    assert ema.on_candle({"c": 20.0}) == pytest.approx(15.0)
+
+
+def test_parse_trade():
+    assert parse_trade({"s": "BTC-USD", "p": 10.5, "q": "0.1", "t": 1}) == ("BTC-USD", 10.5, 0.1, 1)
+    assert parse_trade({"s": "AAPL", "p": 10, "v": 100, "t": 1}) == ("AAPL", 10.0, 100.0, 1)
+    assert parse_trade({"s": "EURUSD", "a": 1.2, "b": 1.0, "t": 1})[1] == pytest.approx(1.1)
+    assert parse_trade({"status_code": 200, "message": "Authorized"}) is None
+
+
+@pytest.fixture
+def client():
+    return WebSocketClient(api_key="00000000000000000000000000000000", endpoint="crypto", symbols=["BTC-USD", "ETH-USD"])
+
+
+def _trade(symbol, price, t, q=1.0):
+    return json.dumps({"s": symbol, "p": price, "q": q, "t": t})
+
+
+def test_indicators_update_on_ticks_and_candle_close(client):
+    events = []
+    client.add_indicator("BTC-USD", "vwap", VWAP(), callback=lambda *event: events.append(event))
+    client.add_indicator("BTC-USD", "ema2", EMA(2), interval="1 minute", callback=lambda *event: events.append(event))
+    candles = client._new_candle_state()
+
+    for message in (
+        _trade("BTC-USD", 10.0, 0), _trade("ETH-USD", 99.0, 0), _trade("BTC-USD", 20.0, 30_000),
+        _trade("BTC-USD", 30.0, 60_000), _trade("BTC-USD", 40.0, 120_000),
+    ):
+        client._process_message(message, candles)
+
+    vwap_values = [value for _, name, value in events if name == "vwap"]
+    assert vwap_values == [10.0, 15.0, 20.0, 25.0]
+    # Two 1-minute candles have closed (closes 20 and 30): EMA(2) is their mean.
+    ema_values = [value for _, name, value in events if name == "ema2"]
+    assert ema_values == [None, 25.0]
+    assert client.indicator_values("BTC-USD") == {"vwap": 25.0, "ema2": 25.0}
+    assert client.indicator_values("ETH-USD") == {}
+
+
+def test_add_and_remove_indicator_validation(client):
+    with pytest.raises(ValueError):
+        client.add_indicator("XRP-USD", "ema", EMA(5))
+    with pytest.raises(ValueError):
+        client.add_indicator("BTC-USD", "ema", EMA(5), interval="2 fortnights")
+
+    client.add_indicator("BTC-USD", "ema", EMA(5))
+    client.add_indicator("BTC-USD", "ema", EMA(7))
+    assert len(client._indicators["BTC-USD"]) == 1
+    client.remove_indicator("BTC-USD", "ema")
+    assert client._indicators == {}
+
+
+def test_failing_callback_does_not_stop_processing(client, capsys):
+    def fail(symbol, name, value):
+        raise RuntimeError("boom")
+
+    client.add_indicator("BTC-USD", "vwap", VWAP(), callback=fail)
+    candles = client._new_candle_state()
+    client._process_message(_trade("BTC-USD", 10.0, 0), candles)
+    client._process_message(_trade("BTC-USD", 20.0, 1), candles)
+
+    assert client.indicator_values("BTC-USD")["vwap"] == pytest.approx(15.0)
+    assert "boom" in capsys.readouterr().out
@@ -0,0 +1,129 @@
+"""Tests for incremental JSON parsing and streamed bulk downloads."""
+
+import json
+
+import pytest
+from unittest.mock import MagicMock
+from requests.exceptions import ChunkedEncodingError
+
+from eodhd import APIClient
+from eodhd.APIs.BaseAPI import BaseAPI
+from eodhd.APIs.BulkFundamentalsAPI import BulkFundamentalsAPI
+from eodhd.errors import EODHDConnectionError, EODHDHTTPError
+from eodhd.streaming import iter_batches, iter_json_records
+
+RECORDS = [{"code": f"S{i}", "close": i * 1.25, "name": "Société ✓", "tags": [i, {"x": None}]} for i in range(300)]
+
+
+def _chunks(body: bytes, size: int):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def _stream_resp(body: bytes, size: int = 7):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.iter_content.return_value = iter(_chunks(body, size))
+    return resp
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 64, 1 << 20])
+def test_array_split_anywhere(size):
+    body = json.dumps(RECORDS, ensure_ascii=False).encode()
+    assert list(iter_json_records(_chunks(body, size))) == RECORDS
+
+
+def test_object_values():
+    payload = {str(i): record for i, record in enumerate(RECORDS[:20])}
+    body = json.dumps(payload, indent=2).encode()
+    assert list(iter_json_records(_chunks(body, 3))) == RECORDS[:20]
+
+
+def test_numbers_split_between_chunks():
+    assert list(iter_json_records([b"[1", b"23,4", b"5.", b"5]"])) == [123, 45.5]
+
+
+def test_empty_and_scalar_payloads():
+    assert list(iter_json_records([b" [ ] "])) == []
+    assert list(iter_json_records([b"{}"])) == []
+    assert list(iter_json_records([b'"only"'])) == ["only"]
+    assert list(iter_json_records([])) == []
+
+
+@pytest.mark.parametrize("body", [b"[1, 2", b'[{"a": 1}', b"[1 2]", b'{"a" 1}'])
+def test_truncated_or_malformed(body):
+    with pytest.raises(ValueError):
+        list(iter_json_records(_chunks(body, 2)))
+
+
+def test_iter_batches():
+    assert list(iter_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    with pytest.raises(ValueError):
+        list(iter_batches([], 0))
+
+
+def test_baseapi_stream_requests_streamed_body_and_closes():
+    session = MagicMock()
+    resp = _stream_resp(json.dumps(RECORDS[:5]).encode())
+    session.get.return_value = resp
+
+    records = BaseAPI(session=session)._rest_get_stream(
+        api_key="demo1234567890123456", endpoint="eod-bulk-last-day", uri="US")
+    assert list(records) == RECORDS[:5]
+    assert session.get.call_args.kwargs["stream"] is True
+    resp.close.assert_called_once()
+
+
+def test_baseapi_stream_connection_lost():
+    def broken():
+        yield b'[{"a": 1}, '
+        raise ChunkedEncodingError("connection broken")
+
+    session = MagicMock()
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.iter_content.return_value = broken()
+    session.get.return_value = resp
+
+    records = BaseAPI(session=session)._rest_get_stream(api_key="demo1234567890123456", endpoint="eod-bulk-last-day")
+    assert next(records) == {"a": 1}
+    with pytest.raises(EODHDConnectionError):
+        next(records)
+    resp.close.assert_called_once()
+
+
+def test_baseapi_stream_invalid_json():
+    session = MagicMock()
+    session.get.return_value = _stream_resp(b"<html>oops</html>")
+    with pytest.raises(EODHDHTTPError):
+        list(BaseAPI(session=session)._rest_get_stream(api_key="demo1234567890123456", endpoint="bulk-fundamentals"))
+
+
+def test_wrapper_validates_eagerly():
+    with pytest.raises(ValueError):
+        BulkFundamentalsAPI().iter_bulk_fundamentals(api_token="demo1234567890123456", exchange="")
+    with pytest.raises(ValueError):
+        BulkFundamentalsAPI().iter_bulk_fundamentals(api_token="demo1234567890123456", exchange="US", version="2")
+
+
+def test_apiclient_iter_bulk_fundamentals_batches():
+    client = APIClient(api_key="demo1234567890123456")
+    client._session = MagicMock()
+    payload = {str(i): {"General": {"Code": f"S{i}"}} for i in range(5)}
+    client._session.get.return_value = _stream_resp(json.dumps(payload).encode())
+
+    batches = list(client.iter_bulk_fundamentals("US", version="1.1", batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert "/v1.1/bulk-fundamentals/US" in client._session.get.call_args[0][0]
+
+
+def test_apiclient_iter_eod_splits_dividends_data():
+    client = APIClient(api_key="demo1234567890123456")
+    client._session = MagicMock()
+    client._session.get.return_value = _stream_resp(json.dumps(RECORDS[:3]).encode())
+
+    records = list(client.iter_eod_splits_dividends_data(country="US", type="dividends"))
+
+    assert records == RECORDS[:3]
+    url = client._session.get.call_args[0][0]
+    assert "/eod-bulk-last-day/US" in url and "&type=dividends" in url
@@ -0,0 +1,227 @@
+"""Tests for StreamManager."""
+
+import asyncio
+import json
+
+import pytest
+
+from eodhd import StreamManager
+from eodhd.errors import EODHDConnectionError
+
+API_KEY = "00000000000000000000000000000000"
+
+
+def _symbols(count, prefix="S"):
+    return [f"{prefix}{i}" for i in range(count)]
+
+
+class FakeServer:
+    """Hands out connections that deliver whatever the test pushes with `emit`."""
+
+    def __init__(self):
+        self.connections = []
+
+    def __call__(self, url, **kwargs):
+        connection = FakeConnection(url)
+        self.connections.append(connection)
+        return connection
+
+    def open(self):
+        return [connection for connection in self.connections if not connection.closed]
+
+    def emit(self, symbol, price=1.0):
+        for connection in self.open():
+            if symbol in connection.subscribed:
+                connection.queue.put_nowait(json.dumps({"s": symbol, "p": price}))
+
+
+class FakeConnection:
+    def __init__(self, url):
+        self.url = url
+        self.queue = asyncio.Queue()
+        self.subscribed = set()
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self.queue.get()
+        if item is None:
+            raise StopAsyncIteration
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def send(self, message):
+        message = json.loads(message)
+        symbols = set(message["symbols"].split(","))
+        if message["action"] == "subscribe":
+            assert len(self.subscribed | symbols) <= 50
+            self.subscribed |= symbols
+        else:
+            self.subscribed -= symbols
+
+    async def close(self):
+        self.closed = True
+        self.queue.put_nowait(None)
+
+
+async def _settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def test_validation():
+    with pytest.raises(ValueError, match="Endpoint is invalid"):
+        StreamManager(API_KEY, {"bonds": ["A"]})
+    with pytest.raises(ValueError):
+        StreamManager(API_KEY, {"us": ["A"]}, max_symbols_per_connection=51)
+    with pytest.raises(ValueError):
+        StreamManager(API_KEY, {})
+
+
+def test_shards_symbols_evenly_and_merges_streams():
+    server = FakeServer()
+
+    async def run():
+        async with StreamManager(API_KEY, {"us": _symbols(120), "crypto": ["BTC-USD"]}, connect=server) as manager:
+            await _settle()
+            assert [len(shard) for shard in manager.shards["us"]] == [40, 40, 40]
+            assert len(server.open()) == 4
+
+            server.emit("S0", 1.0)
+            server.emit("S119", 2.0)
+            server.emit("BTC-USD", 3.0)
+            return [await manager.get() for _ in range(3)]
+
+    received = asyncio.run(run())
+
+    assert sorted((endpoint, message["s"]) for endpoint, message in received) == [
+        ("crypto", "BTC-USD"), ("us", "S0"), ("us", "S119")
+    ]
+    assert not server.open()
+
+
+def test_dynamic_subscribe_and_unsubscribe():
+    server = FakeServer()
+
+    async def run():
+        async with StreamManager(API_KEY, {"us": _symbols(45)}, connect=server) as manager:
+            await _settle()
+            await manager.subscribe("us", _symbols(20, "N"))
+            await _settle()
+            assert [len(shard) for shard in manager.shards["us"]] == [50, 15]
+            assert len(server.open()) == 2
+
+            await manager.unsubscribe("us", _symbols(20, "N")[:15])
+            assert [len(shard) for shard in manager.shards["us"]] == [45, 5]
+            assert server.open()[1].subscribed == set(_symbols(20, "N")[15:])
+
+            await manager.unsubscribe("us", _symbols(20, "N")[15:])
+            await _settle()
+            assert [len(shard) for shard in manager.shards["us"]] == [45]
+            assert len(server.open()) == 1
+
+            await manager.subscribe("us", ["AAPL"])
+            server.emit("AAPL")
+            return await manager.get()
+
+    assert asyncio.run(run()) == ("us", {"s": "AAPL", "p": 1.0})
+
+
+def test_rebalance_packs_symbols_into_fewest_connections():
+    server = FakeServer()
+
+    async def run():
+        async with StreamManager(API_KEY, {"us": _symbols(100)}, connect=server) as manager:
+            await _settle()
+            await manager.unsubscribe("us", _symbols(100)[::2])
+            assert [len(shard) for shard in manager.shards["us"]] == [25, 25]
+
+            await manager.rebalance("us")
+            await _settle()
+            assert [len(shard) for shard in manager.shards["us"]] == [50]
+            assert sorted(manager.symbols["us"]) == sorted(_symbols(100)[1::2])
+            assert len(server.open()) == 1
+            assert server.open()[0].subscribed == set(_symbols(100)[1::2])
+
+    asyncio.run(run())
+
+
+def test_reconnect_triggers_rebalance():
+    server = FakeServer()
+
+    async def run():
+        manager = StreamManager(API_KEY, {"us": _symbols(60)}, connect=server, reconnect_base_delay=0.0)
+        await manager.start()
+        await _settle()
+        await manager.unsubscribe("us", _symbols(60)[:20])
+        assert [len(shard) for shard in manager.shards["us"]] == [10, 30]
+
+        # The first connection drops; on reconnect the symbols are packed again.
+        server.connections[0].queue.put_nowait(OSError("reset"))
+        await _settle()
+        assert [len(shard) for shard in manager.shards["us"]] == [40]
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_connection_errors_reach_the_consumer():
+    server = FakeServer()
+
+    async def run():
+        async with StreamManager(API_KEY, {"us": ["AAPL"]}, connect=server, max_reconnect_attempts=0) as manager:
+            await _settle()
+            server.connections[0].queue.put_nowait(OSError("reset"))
+            async for _ in manager:
+                pass
+
+    with pytest.raises(EODHDConnectionError):
+        asyncio.run(run())
+
+
+def test_failed_connections_are_dropped():
+    server = FakeServer()
+
+    async def run():
+        manager = StreamManager(API_KEY, {"us": _symbols(60)}, connect=server, max_reconnect_attempts=0)
+        await manager.start()
+        await _settle()
+        assert [len(shard) for shard in manager.shards["us"]] == [30, 30]
+
+        server.connections[0].queue.put_nowait(OSError("reset"))
+        with pytest.raises(EODHDConnectionError):
+            await manager.get()
+        await _settle()
+        assert [len(shard) for shard in manager.shards["us"]] == [30]
+        assert manager.symbols["us"] == _symbols(60)[30:]
+        assert len(server.open()) == 1
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_close_ends_waiting_iterations():
+    server = FakeServer()
+
+    async def run():
+        manager = StreamManager(API_KEY, {"us": ["AAPL"]}, connect=server)
+        await manager.start()
+
+        async def consume():
+            return [message async for message in manager]
+
+        consumers = [asyncio.ensure_future(consume()) for _ in range(2)]
+        await _settle()
+        await manager.close()
+        return await asyncio.wait_for(asyncio.gather(*consumers), timeout=1.0)
+
+    assert asyncio.run(run()) == [[], []]
@@ -0,0 +1,222 @@
+"""Tests for local technical indicator computation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+
+from eodhd.technical import FUNCTIONS, TechnicalIndicators, compute_indicator, split_factors
+
+
+def _history(bars=300, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    high = close + rng.uniform(0.1, 2, bars)
+    low = close - rng.uniform(0.1, 2, bars)
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.5, bars), "high": high, "low": low, "close": close,
+            "adjusted_close": close * 0.5, "volume": rng.integers(1000, 10 ** 6, bars).astype(float),
+        },
+        index=pd.DatetimeIndex(pd.bdate_range("2022-01-03", periods=bars), name="date"),
+    )
+
+
+def _records(df):
+    return [
+        {"date": day.strftime("%Y-%m-%d"), **{column: row[column] for column in df.columns}}
+        for day, row in df.iterrows()
+    ]
+
+
+# Reference implementations, written out loop by loop.
+
+def _ref_ema(values, period):
+    out = [np.nan] * len(values)
+    out[period - 1] = float(np.mean(values[:period]))
+    for i in range(period, len(values)):
+        out[i] = out[i - 1] + 2.0 / (period + 1) * (values[i] - out[i - 1])
+    return np.array(out)
+
+
+def _ref_wilder(values, period, start):
+    out = [np.nan] * len(values)
+    out[start + period - 1] = float(np.mean(values[start:start + period]))
+    for i in range(start + period, len(values)):
+        out[i] = out[i - 1] + (values[i] - out[i - 1]) / period
+    return np.array(out)
+
+
+def _ref_rsi(close, period):
+    change = np.diff(close, prepend=np.nan)
+    gain = _ref_wilder(np.clip(np.nan_to_num(change), 0, None), period, 1)
+    loss = _ref_wilder(np.clip(-np.nan_to_num(change), 0, None), period, 1)
+    return 100 - 100 / (1 + gain / loss)
+
+
+def _ref_true_range(df):
+    prev = df["close"].shift()
+    return pd.concat([df["high"] - df["low"], (df["high"] - prev).abs(), (df["low"] - prev).abs()], axis=1).max(
+        axis=1, skipna=False).to_numpy()
+
+
+@pytest.fixture
+def df():
+    return _history()
+
+
+@pytest.fixture
+def raw(df):
+    """The same history with adjusted_close == close, so results use the raw prices."""
+    return df.assign(adjusted_close=df["close"])
+
+
+def test_sma_ema_wma(raw):
+    close = raw["close"].to_numpy()
+
+    np.testing.assert_allclose(compute_indicator(raw, "sma", period=20)["sma"], raw["close"].rolling(20).mean())
+    np.testing.assert_allclose(compute_indicator(raw, "ema", period=20)["ema"], _ref_ema(close, 20))
+    weights = np.arange(1, 11)
+    expected = raw["close"].rolling(10).apply(lambda w: (w * weights).sum() / weights.sum(), raw=True)
+    np.testing.assert_allclose(compute_indicator(raw, "wma", period=10)["wma"], expected)
+
+
+def test_rsi_and_atr_use_wilder_smoothing(raw):
+    np.testing.assert_allclose(compute_indicator(raw, "rsi", period=14)["rsi"], _ref_rsi(raw["close"].to_numpy(), 14))
+    np.testing.assert_allclose(compute_indicator(raw, "atr", period=14)["atr"], _ref_wilder(_ref_true_range(raw), 14, 1))
+
+
+def test_macd(raw):
+    close = raw["close"].to_numpy()
+    result = compute_indicator(raw, "macd", fast_period=8, slow_period=21, signal_period=5)
+
+    macd = _ref_ema(close, 8) - _ref_ema(close, 21)
+    signal = np.full(len(close), np.nan)
+    signal[20:] = _ref_ema(macd[20:], 5)
+    np.testing.assert_allclose(result["macd"], macd)
+    np.testing.assert_allclose(result["signal"], signal)
+    np.testing.assert_allclose(result["divergence"], macd - signal)
+
+
+def test_bbands_stddev_stochastic_cci_slope(raw):
+    close = raw["close"]
+    std = close.rolling(20).std(ddof=0)
+    bands = compute_indicator(raw, "bbands", period=20)
+    np.testing.assert_allclose(bands["mband"], close.rolling(20).mean())
+    np.testing.assert_allclose(bands["uband"], close.rolling(20).mean() + 2 * std)
+    np.testing.assert_allclose(compute_indicator(raw, "stddev", period=20)["stddev"], std)
+
+    fast_k = 100 * (close - raw["low"].rolling(14).min()) / (raw["high"].rolling(14).max() - raw["low"].rolling(14).min())
+    stochastic = compute_indicator(raw, "stochastic")
+    np.testing.assert_allclose(stochastic["k_values"], fast_k.rolling(3).mean())
+    np.testing.assert_allclose(stochastic["d_values"], fast_k.rolling(3).mean().rolling(3).mean())
+
+    typical = (raw["high"] + raw["low"] + close) / 3
+    mean_dev = typical.rolling(20).apply(lambda w: np.abs(w - w.mean()).mean(), raw=True)
+    np.testing.assert_allclose(compute_indicator(raw, "cci", period=20)["cci"],
+                               (typical - typical.rolling(20).mean()) / (0.015 * mean_dev))
+
+    expected_slope = close.rolling(10).apply(lambda w: np.polyfit(np.arange(10), w, 1)[0], raw=True)
+    np.testing.assert_allclose(compute_indicator(raw, "slope", period=10)["slope"], expected_slope)
+
+
+def test_all_functions_produce_their_outputs(df):
+    for function, outputs in FUNCTIONS.items():
+        result = compute_indicator(df, function, period=14, benchmark=df["close"])
+        assert list(result.columns) == list(outputs), function
+        assert result.dropna().shape[0] > 0, function
+
+
+def test_prices_are_adjusted_by_default(df):
+    adjusted = compute_indicator(df, "sma", period=10)["sma"]
+    np.testing.assert_allclose(adjusted, df["adjusted_close"].rolling(10).mean())
+    # OHLC-based functions are scaled by adjusted_close / close as well.
+    np.testing.assert_allclose(compute_indicator(df, "atr", period=14)["atr"],
+                               0.5 * compute_indicator(df.assign(adjusted_close=df["close"]), "atr", period=14)["atr"])
+
+
+def test_split_adjustment(df):
+    splits = [{"date": df.index[100].strftime("%Y-%m-%d"), "split": "4.000000/1.000000"}]
+    factors = split_factors(df.index, splits)
+    assert (factors[:100] == 4).all() and (factors[100:] == 1).all()
+
+    sma = compute_indicator(df, "sma", period=5, splitadjusted_only="1", splits=splits)["sma"]
+    np.testing.assert_allclose(sma, (df["close"] / factors).rolling(5).mean())
+
+    weekly = compute_indicator(df, "splitadjusted", agg_period="w", splits=splits)
+    assert weekly.index[0] == df.index[0]
+    assert weekly["high"].iloc[0] == pytest.approx(df["high"].iloc[:5].max() / 4)
+    assert weekly["volume"].iloc[0] == pytest.approx(df["volume"].iloc[:5].sum() * 4)
+
+
+def test_beta_against_itself_is_one(df):
+    beta = compute_indicator(df, "beta", period=20, benchmark=df["adjusted_close"])["beta"].dropna()
+    np.testing.assert_allclose(beta, 1.0)
+
+
+def test_unknown_function(df):
+    with pytest.raises(ValueError):
+        compute_indicator(df, "format_amibroker")
+    with pytest.raises(ValueError):
+        compute_indicator(df, "beta")
+
+
+@pytest.fixture
+def client(df):
+    client = MagicMock()
+    client.get_eod_historical_stock_market_data.return_value = _records(df)
+    return client
+
+
+def test_response_format_matches_endpoint(client, df):
+    local = TechnicalIndicators(client)
+
+    records = local.get_technical_indicator_data("AAPL.US", "sma", period=10)
+
+    assert len(records) == len(df) - 9
+    assert records[0] == {"date": df.index[9].strftime("%Y-%m-%d"), "sma": pytest.approx(df["adjusted_close"][:10].mean())}
+
+    macd = local.get_technical_indicator_data("AAPL.US", "macd", order="d", date_from="2022-06-01", date_to="2022-06-30")
+    assert set(macd[0]) == {"date", "macd", "signal", "divergence"}
+    assert macd[0]["date"] == "2022-06-30" and macd[-1]["date"] == "2022-06-01"
+
+
+def test_history_is_loaded_once_per_symbol(client):
+    local = TechnicalIndicators(client)
+
+    for function in ("sma", "ema", "rsi", "atr", "bbands", "macd"):
+        local.get_technical_indicator_data("AAPL.US", function, period=14)
+
+    assert client.get_eod_historical_stock_market_data.call_count == 1
+    local.clear()
+    local.get_technical_indicator_data("AAPL.US", "sma")
+    assert client.get_eod_historical_stock_market_data.call_count == 2
+
+
+def test_history_from_store(client, df):
+    store = MagicMock()
+    store.sync.return_value = df
+
+    records = TechnicalIndicators(client, store=store).get_technical_indicator_data("AAPL.US", "ema", period=20)
+
+    store.sync.assert_called_once_with("AAPL.US")
+    client.get_eod_historical_stock_market_data.assert_not_called()
+    assert records[0]["date"] == df.index[19].strftime("%Y-%m-%d")
+
+
+def test_beta_fetches_benchmark(client):
+    records = TechnicalIndicators(client).get_technical_indicator_data("AAPL.US", "beta", period=20)
+
+    symbols = [call.args[0] for call in client.get_eod_historical_stock_market_data.call_args_list]
+    assert symbols == ["GSPC.INDX", "AAPL.US"]
+    assert records[0]["beta"] == pytest.approx(1.0)
+
+
+def test_validation(client):
+    local = TechnicalIndicators(client)
+    with pytest.raises(ValueError):
+        local.get_technical_indicator_data("", "sma")
+    with pytest.raises(ValueError):
+        local.get_technical_indicator_data("AAPL.US", "sma", period=1)
+    with pytest.raises(ValueError):
+        local.get_technical_indicator_data("AAPL.US", "sma", order="x")
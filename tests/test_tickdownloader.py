@@ -0,0 +1,130 @@
+"""Tests for the resumable TickDownloader."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from eodhd import TickDownloader
+from eodhd.errors import EODHDHTTPError
+from eodhd.ticks import ticks_to_numpy
+
+
+def _ticks(from_ts, to_ts):
+    # One tick every 600s, including one exactly on the closing bound (inclusive API `to`).
+    ts = list(range(from_ts * 1000, to_ts * 1000 + 1, 600_000))
+    return {
+        "ts": ts,
+        "price": [100.0 + i for i in range(len(ts))],
+        "shares": [10] * len(ts),
+        "mkt": ["Q"] * len(ts),
+    }
+
+
+@pytest.fixture
+def client():
+    mock = MagicMock()
+    mock.get_stock_market_tick_data.side_effect = (
+        lambda symbol, from_ts, to_ts, limit=None, output="json": ticks_to_numpy(_ticks(from_ts, to_ts), "ms")
+    )
+    return mock
+
+
+def test_chunks(tmp_path, client):
+    downloader = TickDownloader(client, str(tmp_path), chunk_seconds=3600)
+    assert downloader.chunks(0, 9000) == [(0, 3600), (3600, 7200), (7200, 9000)]
+    with pytest.raises(ValueError):
+        downloader.chunks(10, 10)
+
+
+def test_download_and_load(tmp_path, client):
+    downloader = TickDownloader(client, str(tmp_path), chunk_seconds=3600, max_workers=3)
+    summary = downloader.download("AAPL.US", 0, 4 * 3600)
+
+    assert summary == {"chunks": 4, "downloaded": 4, "skipped": 0, "failed": {}}
+    ticks = downloader.load("AAPL.US")
+    # Boundary ticks are kept once, by the window they open.
+    assert ticks["ts"].tolist() == [ms * 10 ** 6 for ms in range(0, 4 * 3600 * 1000, 600_000)]
+    assert ticks["price"].dtype == np.float64
+    assert ticks["shares"].dtype == np.int32
+    assert ticks["mkt"].tolist() == ["Q"] * 24
+
+    checkpoint = json.loads((tmp_path / "AAPL.US" / "checkpoint.json").read_text())
+    assert len(checkpoint["done"]) == 4
+
+
+def test_resume_only_fetches_missing_chunks(tmp_path, client):
+    calls = []
+
+    def flaky(symbol, from_ts, to_ts, limit=None, output="json"):
+        calls.append(from_ts)
+        if from_ts == 3600 and calls.count(3600) == 1:
+            raise EODHDHTTPError(status_code=500, response_body="", message="boom")
+        return ticks_to_numpy(_ticks(from_ts, to_ts), "ms")
+
+    client.get_stock_market_tick_data.side_effect = flaky
+    downloader = TickDownloader(client, str(tmp_path), chunk_seconds=3600, max_workers=1)
+
+    first = downloader.download("AAPL.US", 0, 3 * 3600)
+    assert first["downloaded"] == 2
+    assert list(first["failed"]) == [(3600, 7200)]
+
+    second = downloader.download("AAPL.US", 0, 3 * 3600)
+    assert second == {"chunks": 3, "downloaded": 1, "skipped": 2, "failed": {}}
+    assert sorted(calls) == [0, 3600, 3600, 7200]
+    assert len(downloader.load("AAPL.US")["ts"]) == 18
+
+
+def test_any_chunk_error_is_recorded(tmp_path, client):
+    def malformed(symbol, from_ts, to_ts, limit=None, output="json"):
+        if from_ts == 0:
+            raise KeyError("ts")
+        return ticks_to_numpy(_ticks(from_ts, to_ts), "ms")
+
+    client.get_stock_market_tick_data.side_effect = malformed
+    downloader = TickDownloader(client, str(tmp_path), chunk_seconds=3600, max_workers=1)
+    save_chunk = downloader._save_chunk
+
+    def failing_save(directory, chunk, ticks):
+        if chunk == (3600, 7200):
+            raise OSError("No space left on device")
+        save_chunk(directory, chunk, ticks)
+
+    downloader._save_chunk = failing_save
+
+    summary = downloader.download("AAPL.US", 0, 3 * 3600)
+
+    assert summary["downloaded"] == 1
+    assert isinstance(summary["failed"][(0, 3600)], KeyError)
+    assert isinstance(summary["failed"][(3600, 7200)], OSError)
+    assert downloader.load_checkpoint("AAPL.US")["done"] == ["7200_10800.npz"]
+
+
+def test_unix_time():
+    from datetime import date, datetime, timezone
+    from eodhd.timeutils import unix_time
+
+    assert unix_time("2024-01-02") == unix_time(date(2024, 1, 2)) == 1704153600
+    assert unix_time(datetime(2024, 1, 2, tzinfo=timezone.utc)) == unix_time("1704153600") == 1704153600
+    with pytest.raises(ValueError):
+        unix_time("yesterday")
+
+
+def test_missing_chunk_file_is_refetched(tmp_path, client):
+    downloader = TickDownloader(client, str(tmp_path), chunk_seconds=3600)
+    downloader.download("AAPL.US", 0, 7200)
+    os.remove(tmp_path / "AAPL.US" / "0_3600.npz")
+
+    assert downloader.download("AAPL.US", 0, 7200)["downloaded"] == 1
+
+
+def test_conflicting_checkpoint(tmp_path, client):
+    TickDownloader(client, str(tmp_path), chunk_seconds=3600).download("AAPL.US", 0, 7200)
+    with pytest.raises(ValueError):
+        TickDownloader(client, str(tmp_path), chunk_seconds=600).download("AAPL.US", 0, 7200)
+
+
+def test_load_without_download(tmp_path, client):
+    assert len(TickDownloader(client, str(tmp_path)).load("MSFT.US")) == 0
@@ -0,0 +1,97 @@
+"""Tests for columnar tick decoding into NumPy structured arrays."""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from eodhd import APIClient
+from eodhd.APIs.StockMarketTickDataAPI import StockMarketTickDataAPI
+from eodhd.ticks import ticks_to_numpy
+
+PAYLOAD = {
+    "ex": ["Q", "Q", "P"],
+    "mkt": ["Q", "K", "P"],
+    "price": [189.5, 189.51, 189.49],
+    "seq": [1, 2, 3],
+    "shares": [100, 5, 20],
+    "sl": ["@ TI", "@", None],
+    "sub_mkt": ["", "", ""],
+    "ts": [1694519999002, 1694519999010, 1694520000100],
+}
+
+
+def _resp(data):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = data
+    return resp
+
+
+def test_structured_dtypes_and_order():
+    ticks = ticks_to_numpy(PAYLOAD)
+    assert ticks.dtype.names[:3] == ("ts", "price", "shares")
+    assert ticks["ts"].dtype == np.int64
+    assert ticks["ts"][0] == 1694519999002 * 10 ** 6
+    assert ticks["price"].dtype == np.float64
+    assert ticks["shares"].dtype == np.int32
+    assert ticks["sl"].tolist() == ["@ TI", "@", ""]
+    assert len(ticks) == 3
+
+
+@pytest.mark.parametrize("ts, factor", [(1694519999, 10 ** 9), (1694519999002, 10 ** 6),
+                                        (1694519999002000, 10 ** 3), (1694519999002000000, 1)])
+def test_timestamp_units(ts, factor):
+    assert ticks_to_numpy({"ts": [ts], "price": [1.0]})["ts"][0] == ts * factor
+
+
+def test_explicit_timestamp_unit():
+    assert ticks_to_numpy({"ts": [600_000]}, ts_unit="ms")["ts"][0] == 600_000 * 10 ** 6
+    with pytest.raises(ValueError):
+        ticks_to_numpy({"ts": [1]}, ts_unit="minutes")
+
+
+def test_envelope_with_records():
+    payload = {"meta": {}, "data": [{"timestamp": 1694519999002, "price": 1.5, "size": 10, "venue": "X"}],
+               "links": {}}
+    ticks = ticks_to_numpy(payload)
+    assert ticks.dtype.names == ("ts", "price", "shares", "venue")
+    assert ticks["shares"][0] == 10
+
+
+def test_missing_numeric_values():
+    ticks = ticks_to_numpy({"ts": [1, 2], "price": [1.0, None], "shares": [None, 3]})
+    assert np.isnan(ticks["price"][1])
+    assert ticks["shares"].tolist() == [0, 3]
+
+
+def test_empty_and_invalid_payloads():
+    assert len(ticks_to_numpy({"ts": [], "price": []})) == 0
+    with pytest.raises(ValueError):
+        ticks_to_numpy({"ts": [1, 2], "price": [1.0]})
+    with pytest.raises(ValueError):
+        ticks_to_numpy("nope")
+
+
+def test_tick_api_numpy_output():
+    session = MagicMock()
+    session.get.return_value = _resp(PAYLOAD)
+    api = StockMarketTickDataAPI(session=session)
+
+    ticks = api.get_stock_market_tick_data(api_token="demo1234567890123456", symbol="AAPL", from_timestamp=1,
+                                           to_timestamp=2, limit=None, output="numpy")
+    assert ticks["price"].tolist() == PAYLOAD["price"]
+
+    with pytest.raises(ValueError):
+        api.get_stock_market_tick_data(api_token="demo1234567890123456", symbol="AAPL", from_timestamp=1,
+                                       to_timestamp=2, limit=None, output="csv")
+
+
+def test_apiclient_output_modes():
+    client = APIClient(api_key="demo1234567890123456")
+    client._session = MagicMock()
+    client._session.get.return_value = _resp(PAYLOAD)
+    assert client.get_stock_market_tick_data("AAPL", 1, 2) == PAYLOAD
+    assert len(client.get_stock_market_tick_data("AAPL", 1, 2, output="numpy")) == 3
+
+    client._session.get.return_value = _resp({"data": [{"ts": 1, "price": 2.0, "shares": 3}], "meta": {}, "links": {}})
+    assert client.mp_tickdata("AAPL", output="numpy")["shares"].tolist() == [3]